@@ -85,7 +85,6 @@ from diesel_heater_ble import (
     ProtocolCBFF,
     ProtocolHcalory,
     _decrypt_data,
-    _u8_to_number,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -1352,7 +1351,7 @@ class VevorHeaterCoordinator(DataUpdateCoordinator):
 
         if len(data) == 48:
             decrypted = _decrypt_data(data)
-            inner = (_u8_to_number(decrypted[0]) << 8) | _u8_to_number(decrypted[1])
+            inner = (decrypted[0] << 8) | decrypted[1]
             if inner == 0xAA55:
                 return self._protocols[2], decrypted
             if inner == 0xAA66:
@@ -1364,7 +1363,7 @@ class VevorHeaterCoordinator(DataUpdateCoordinator):
         """Parse response from heater using protocol handler classes."""
         if len(data) < 8:
             # AA77 ACK is 10 bytes - check before discarding
-            header_short = (_u8_to_number(data[0]) << 8) | _u8_to_number(data[1]) if len(data) >= 2 else 0
+            header_short = (data[0] << 8) | data[1] if len(data) >= 2 else 0
             if header_short == PROTOCOL_HEADER_AA77:
                 self._logger.debug("AA77 ACK received (%d bytes)", len(data))
                 self._notification_data = data
@@ -1372,7 +1371,7 @@ class VevorHeaterCoordinator(DataUpdateCoordinator):
             self._logger.debug("Response too short: %d bytes", len(data))
             return
 
-        header = (_u8_to_number(data[0]) << 8) | _u8_to_number(data[1])
+        header = (data[0] << 8) | data[1]
 
         # Check for AA77 (Sunster V2.1 locked state / command ACK)
         if header == PROTOCOL_HEADER_AA77:
@@ -1424,7 +1423,7 @@ class VevorHeaterCoordinator(DataUpdateCoordinator):
 
         # Parse
         try:
-            parsed = protocol.parse(parse_data)
+            parsed = protocol.parse_cached(parse_data)
         except Exception as err:
             self._logger.error("%s parse error: %s", protocol.name, err)
             self.data.update({
@@ -1767,6 +1766,10 @@ class VevorHeaterCoordinator(DataUpdateCoordinator):
         else:
             protocol = self._protocols[1]
         packet = protocol.build_command(command, argument, self._passkey)
+        # Identical status bytes would parse to the same dict, but parse() also
+        # refreshes hidden parser state (CBFF _last_mode/_last_param), so don't
+        # let the next status notification skip it
+        protocol.invalidate_parse_cache()
         self._logger.debug(
             "Command packet (%d bytes, %s): %s", len(packet), protocol.name, packet.hex()
         )
@@ -16,6 +16,8 @@ This module has no dependency on Home Assistant.
 """
 from __future__ import annotations
 
+import struct
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -36,14 +38,29 @@ from .const import (
     HCALORY_MIN_LEVEL,
     HCALORY_MIN_TEMP_CELSIUS,
     HCALORY_MIN_TEMP_FAHRENHEIT,
+    HCALORY_MODE_LEVEL,
+    HCALORY_MODE_TEMPERATURE,
+    HCALORY_MODE_VENTILATION,
     HCALORY_POWER_AUTO_OFF,
     HCALORY_POWER_AUTO_ON,
     HCALORY_POWER_AUTO_TOGGLE,
     HCALORY_POWER_CELSIUS,
     HCALORY_POWER_FAHRENHEIT,
+    HCALORY_POWER_MODE_LEVEL,
+    HCALORY_POWER_MODE_TEMP,
     HCALORY_POWER_OFF,
     HCALORY_POWER_ON,
     HCALORY_POWER_QUERY,
+    HCALORY_POWER_VENTILATION,
+    HCALORY_RUNNING_STATUS_ERROR,
+    HCALORY_RUNNING_STATUS_OFF,
+    HCALORY_RUNNING_STATUS_TURNING_OFF,
+    HCALORY_RUNNING_STEP_COOLDOWN,
+    HCALORY_RUNNING_STEP_FAN,
+    HCALORY_RUNNING_STEP_IGNITION,
+    HCALORY_RUNNING_STEP_INACTIVE,
+    HCALORY_RUNNING_STEP_RUNNING,
+    HCALORY_RUNNING_STEP_STANDBY,
     HCALORY_STATE_HEATING_MANUAL_GEAR,
     HCALORY_STATE_HEATING_TEMP_AUTO,
     HCALORY_STATE_MACHINE_FAULT,
@@ -58,30 +75,198 @@ from .const import (
     SUNSTER_V21_KEY,
 )
 
+# ---------------------------------------------------------------------------
+# Precompiled packet layouts
+# ---------------------------------------------------------------------------
+
+# FEAA header: FE AA + version + pkg_num + total_length (uint16 LE) + cmd_1 + cmd_2
+_FEAA_HEADER = struct.Struct("<BBBBHBB")
+
+# Hcalory command header: protocol ID, reserved, flags, pad, cmd_type (uint16 BE
+# across bytes 7-8), 2 pad bytes, payload length
+_HCALORY_CMD_HEADER = struct.Struct(">6BxHxxB")
+
+# CBFF V2.1 handshake PIN: [PIN % 100, PIN // 100]
+_CBFF_PIN = struct.Struct("<BB")
+
+# AA55 unencrypted status, bytes 0-16 (multi-byte fields are little-endian)
+_AA55_FIELDS = struct.Struct(
+    "<3x"   # 0-2: AA55 header + unused
+    "3B"    # 3-5: running_state, error_code, running_step
+    "H"     # 6-7: altitude
+    "3B"    # 8-10: running_mode, set value (level/temp), level - 1
+    "H"     # 11-12: voltage (x10)
+    "2h"    # 13-16: case temperature, cabin temperature (int16)
+)
+
+# AA55/AA66 encrypted status after decryption, bytes 0-14 (big-endian)
+_AA_ENCRYPTED_FIELDS = struct.Struct(
+    ">3x"   # 0-2: header + unused
+    "3B"    # 3-5: running_state, error_code (AA55 only), running_step
+    "H"     # 6-7: altitude (x10)
+    "3B"    # 8-10: running_mode, set temperature, set level
+    "H"     # 11-12: voltage (x10)
+    "h"     # 13-14: case temperature (int16)
+)
+
+# Single fields read at fixed offsets
+_U16BE = struct.Struct(">H")
+_I16BE = struct.Struct(">h")
+_U32LE = struct.Struct("<I")
+
+# Encrypted AA55/AA66 timer, bytes 21-24: start and duration minutes
+_TIMER_FIELDS = struct.Struct(">2H")
+
+# AA66 unencrypted status, bytes 0-15 (multi-byte fields are little-endian)
+_AA66_FIELDS = struct.Struct(
+    "<3x"   # 0-2: AA66 header + unused
+    "4B"    # 3-6: running_state, error_code, running_step, altitude
+    "x"     # 7: unused
+    "2B"    # 8-9: running_mode, set value (level/temp)
+    "x"     # 10: unused
+    "2H"    # 11-14: voltage (x10), case temperature
+    "B"     # 15: cabin temperature
+)
+
+# ABBA status, bytes 0-15 (case temperature is big-endian; the little-endian
+# altitude at 16-17 is read separately)
+_ABBA_FIELDS = struct.Struct(
+    ">4x"   # 0-3: ABBA header + unused
+    "3B"    # 4-6: status, mode, gear/target temp or error code
+    "x"     # 7: unused
+    "3B"    # 8-10: auto start/stop, voltage, temperature unit
+    "B"     # 11: environment temperature
+    "H"     # 12-13: case temperature
+    "2B"    # 14-15: altitude unit, high-altitude mode
+)
+
+# Hcalory MVP2 status, bytes 0-37 (multi-byte fields are big-endian)
+_HCALORY_FIELDS = struct.Struct(
+    ">18x"  # 0-17: header / unused
+    "B"     # 18: altitude mode
+    "x"     # 19: unused
+    "4B"    # 20-23: complete state byte, set mode, set value, auto start/stop
+    "H"     # 24-25: voltage (x10)
+    "x"     # 26: unused
+    "H"     # 27-28: shell/case temperature (x10)
+    "x"     # 29: unused
+    "H"     # 30-31: ambient/cabin temperature (x10)
+    "5x"    # 32-36: unused
+    "B"     # 37: temperature unit
+)
+
+# Hcalory 1-6 gear <-> standard 1-10 level (index = input level)
+_HCALORY_TO_STANDARD_LEVEL = (1, 2, 4, 5, 6, 8, 10)
+_STANDARD_TO_HCALORY_LEVEL = (1, 1, 1, 2, 2, 3, 4, 5, 5, 6, 6)
+
+# Hcalory MVP2 running step nibble -> standard running_step (index = nibble)
+# MVP2 steps: 0x0=Inactive, 0x1=Fan, 0x3=Ignition, 0x4=Cooldown, 0x5=Running, 0x7=Standby
+# Standard steps: 0=Standby, 1=Self-test, 2=Ignition, 3=Running, 4=Cooldown, 6=Ventilation
+# Unknown nibbles are passed through unchanged.
+_HCALORY_STEP_MAP = tuple(
+    {
+        HCALORY_RUNNING_STEP_INACTIVE: 0,  # Standby
+        HCALORY_RUNNING_STEP_FAN: 6,  # Ventilation/Fan
+        HCALORY_RUNNING_STEP_IGNITION: 2,  # Ignition
+        HCALORY_RUNNING_STEP_COOLDOWN: 4,  # Cooldown
+        HCALORY_RUNNING_STEP_RUNNING: 3,  # Running
+        HCALORY_RUNNING_STEP_STANDBY: 0,  # Standby
+    }.get(step, step)
+    for step in range(16)
+)
+
+# Hcalory status nibbles (high nibble of byte 20) grouped by how parse() treats them,
+# as bitmasks tested with (1 << status) & mask
+_HCALORY_STATUS_STOPPED = (1 << HCALORY_RUNNING_STATUS_OFF) | (1 << HCALORY_RUNNING_STATUS_ERROR)
+_HCALORY_STATUS_NO_SET_VALUE = (1 << HCALORY_RUNNING_STATUS_TURNING_OFF) | (1 << HCALORY_RUNNING_STATUS_ERROR)
+
+# Complete state byte (byte 20) -> 1 when byte 22 carries no set value: the
+# whole byte is OFF (0x00), or the status is TURNING_OFF / ERROR. OFF with a
+# nonzero step nibble still carries a set value, so this is not a status mask.
+_HCALORY_SET_VALUE_HIDDEN = bytes(
+    state == HCALORY_RUNNING_STATUS_OFF or bool((1 << (state >> 4)) & _HCALORY_STATUS_NO_SET_VALUE)
+    for state in range(256)
+)
+
+# Hcalory set mode (byte 21) -> standard running_mode; anything else is manual
+_HCALORY_MODE_MAP = {
+    HCALORY_MODE_TEMPERATURE: RUNNING_MODE_TEMPERATURE,
+    HCALORY_MODE_LEVEL: RUNNING_MODE_LEVEL,
+    HCALORY_MODE_VENTILATION: RUNNING_MODE_MANUAL,  # Fan-only
+}
+
+# Clamp tables for single raw status bytes (index = byte value)
+_CLAMP_LEVEL = bytes(max(1, min(10, i)) for i in range(256))
+_CLAMP_TEMP_CELSIUS = bytes(max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, i)) for i in range(256))
+_CLAMP_HCALORY_LEVEL = bytes(max(HCALORY_MIN_LEVEL, min(HCALORY_MAX_LEVEL, i)) for i in range(256))
+# uint8 Fahrenheit set value -> clamped Celsius
+_CLAMP_TEMP_FAHRENHEIT_TO_CELSIUS = bytes(
+    max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, round((f - 32) * 5 / 9))) for f in range(256)
+)
+
+# Encrypted AA55/AA66 frames: the first 48 bytes are XORed with the 8-byte
+# key repeated six times, kept as one big-endian int
+_ENCRYPTED_LEN = 48
+_ENCRYPTION_KEY_BYTES = bytes(ENCRYPTION_KEY)
+_ENCRYPTION_KEY_INT = int.from_bytes(_ENCRYPTION_KEY_BYTES * 6, "big")
+
+# CBFF fields kept when neither raw nor decrypted data is plausible
+_CBFF_SUSPECT_KEEP = frozenset({"connected", "cbff_protocol_version", "running_state"})
+
+# CBFF status fields, bytes 0-45 (multi-byte fields are little-endian)
+_CBFF_FIELDS = struct.Struct(
+    "<2x"   # 0-1: CBFF header
+    "B"     # 2: protocol_version
+    "7x"    # 3-9: unused
+    "6B"    # 10-15: run_state, run_mode, run_param, now_gear, run_step, fault_display
+    "x"     # 16: unused
+    "B"     # 17: temp_unit
+    "h"     # 18-19: cabin temperature (int16)
+    "B"     # 20: altitude_unit
+    "2H"    # 21-24: altitude, voltage
+    "h"     # 25-26: case temperature (int16)
+    "H"     # 27-28: CO sensor
+    "B"     # 29: pwr_onoff
+    "2H"    # 30-33: hardware_version, software_version
+    "b"     # 34: temp_comp (int8)
+    "9B"    # 35-43: language, tank, pump, backlight, startup/shutdown diff, wifi, auto start/stop, heater_mode
+    "H"     # 44-45: remain_run_time
+)
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
 def _u8_to_number(value: int) -> int:
-    """Convert unsigned 8-bit value."""
-    return (value + 256) if (value < 0) else value
+    """Convert a signed (Java-style) byte to its unsigned 8-bit value.
+
+    Bytes read from a ``bytes``/``bytearray`` are already unsigned, so the
+    parsers index them directly instead of calling this.
+    """
+    return value & 0xFF
 
 
 def _unsign_to_sign(value: int) -> int:
-    """Convert unsigned to signed value."""
-    if value > 32767.5:
-        value = value | -65536
-    return value
+    """Convert an unsigned 16-bit value to signed (two's complement).
+
+    The parsers read signed fields directly with ``h`` struct formats; this
+    helper stays for callers holding an already-decoded uint16.
+    """
+    return ((value & 0xFFFF) ^ 0x8000) - 0x8000
 
 
 def _decrypt_data(data: bytearray) -> bytearray:
-    """Decrypt encrypted data using XOR with password key."""
+    """Decrypt encrypted data using XOR with password key.
+
+    The first 48 bytes are XORed with the key repeated six times, as one
+    big-int XOR instead of a per-byte loop.
+    """
     decrypted = bytearray(data)
-    for j in range(6):
-        base_index = 8 * j
-        for i in range(8):
-            if base_index + i < len(decrypted):
-                decrypted[base_index + i] = ENCRYPTION_KEY[i] ^ decrypted[base_index + i]
+    n = min(len(decrypted), _ENCRYPTED_LEN)
+    if n:
+        key = _ENCRYPTION_KEY_INT >> (8 * (_ENCRYPTED_LEN - n))
+        decrypted[:n] = (int.from_bytes(decrypted[:n], "big") ^ key).to_bytes(n, "big")
     return decrypted
 
 
@@ -90,6 +275,11 @@ def _encrypt_data(data: bytearray) -> bytearray:
     return _decrypt_data(data)
 
 
+# CBFF double-XOR key streams (key1 ^ key2) per (device_sn, frame length),
+# each kept as one big-endian int
+_CBFF_KEYSTREAMS: dict[tuple[str, int], int] = {}
+
+
 def _minutes_to_time_str(minutes: int) -> str:
     """Convert minutes from midnight to HH:MM format.
 
@@ -131,13 +321,14 @@ def _format_timer(timer_start: int, timer_duration: int, timer_enabled: bool) ->
 # Parsed state dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class HeaterState:
     """Parsed heater state from BLE notification data.
 
     All fields are optional (None by default) because not every protocol
     provides every value.  The coordinator can read whichever fields its
-    platform entities need.
+    platform entities need.  Slotted, so fields are fixed attribute slots
+    rather than a per-instance ``__dict__``.
     """
 
     # Core state
@@ -210,12 +401,10 @@ class HeaterState:
         existing coordinator code can migrate incrementally.
         """
         result: dict[str, Any] = {}
-        for f in self.__dataclass_fields__:
-            if f == "extra":
-                continue
-            val = getattr(self, f)
+        for name in _HEATER_STATE_FIELDS:
+            val = getattr(self, name)
             if val is not None:
-                result[f] = val
+                result[name] = val
         result.update(self.extra)
         return result
 
@@ -225,7 +414,7 @@ class HeaterState:
 
         Known fields are set as attributes; unknown fields go into ``extra``.
         """
-        known = {f.name for f in cls.__dataclass_fields__.values() if f.name != "extra"}
+        known = _HEATER_STATE_FIELD_SET
         kwargs: dict[str, Any] = {}
         extra: dict[str, Any] = {}
         for key, val in data.items():
@@ -236,6 +425,11 @@ class HeaterState:
         return cls(**kwargs, extra=extra)
 
 
+# HeaterState value fields in declaration order (everything but ``extra``)
+_HEATER_STATE_FIELDS = tuple(name for name in HeaterState.__dataclass_fields__ if name != "extra")
+_HEATER_STATE_FIELD_SET = frozenset(_HEATER_STATE_FIELDS)
+
+
 # ---------------------------------------------------------------------------
 # Abstract base class
 # ---------------------------------------------------------------------------
@@ -248,6 +442,10 @@ class HeaterProtocol(ABC):
     needs_calibration: bool = True   # Call _apply_ui_temperature_offset after parse
     needs_post_status: bool = False  # Send follow-up status request after commands
 
+    # Last notification and its parse result, reused by parse_cached()
+    _last_raw: bytes | None = None
+    _last_parsed: dict[str, Any] | None = None
+
     @abstractmethod
     def parse(self, data: bytearray) -> dict[str, Any] | None:
         """Parse BLE response data into a normalized dict.
@@ -274,6 +472,29 @@ class HeaterProtocol(ABC):
             return None
         return HeaterState.from_dict(parsed)
 
+    def parse_cached(self, data: bytearray) -> dict[str, Any] | None:
+        """Parse BLE data, reusing the previous result for identical bytes.
+
+        Idle heaters keep sending byte-identical notifications, so the
+        last raw packet and its parsed dict are kept and a copy is returned
+        when the same bytes arrive again (callers may mutate the result).
+        """
+        raw = bytes(data)
+        if raw == self._last_raw and self._last_parsed is not None:
+            return self._last_parsed.copy()
+        parsed = self.parse(data)
+        if parsed is None:
+            self.invalidate_parse_cache()
+            return None
+        self._last_raw = raw
+        self._last_parsed = parsed.copy()
+        return parsed
+
+    def invalidate_parse_cache(self) -> None:
+        """Forget the cached notification (e.g. after sending a command)."""
+        self._last_raw = None
+        self._last_parsed = None
+
 
 # ---------------------------------------------------------------------------
 # Shared command builder for Vevor AA55-based protocols
@@ -284,14 +505,73 @@ class VevorCommandMixin:
 
     def build_command(self, command: int, argument: int, passkey: int) -> bytearray:
         """Build 8-byte AA55 command packet (always unencrypted)."""
-        packet = bytearray([0xAA, 0x55, 0, 0, 0, 0, 0, 0])
-        packet[2] = passkey // 100
-        packet[3] = passkey % 100
-        packet[4] = command % 256
-        packet[5] = argument % 256
-        packet[6] = (argument // 256) % 256
-        packet[7] = (packet[2] + packet[3] + packet[4] + packet[5] + packet[6]) % 256
-        return packet
+        pk_hi, pk_lo = divmod(passkey, 100)
+        command &= 0xFF
+        arg_lo = argument & 0xFF
+        arg_hi = (argument >> 8) & 0xFF
+        return bytearray((
+            0xAA, 0x55, pk_hi, pk_lo, command, arg_lo, arg_hi,
+            (pk_hi + pk_lo + command + arg_lo + arg_hi) & 0xFF,
+        ))
+
+
+class _EncryptedTrailerMixin:
+    """Shared parser for the bytes 19-44 tail of AA55/AA66 encrypted packets."""
+
+    # Last raw part number and its hex string, reused while it is unchanged
+    _last_part_raw: int | None = None
+    _last_part_hex: str | None = None
+
+    def _parse_encrypted_trailer(self, data: bytearray, parsed: dict[str, Any]) -> None:
+        """Parse offset, backlight, CO, part number, motherboard, time and timer fields."""
+        # Byte 34: Temperature offset (signed)
+        if len(data) > 34:
+            raw = data[34]
+            parsed["heater_offset"] = (raw - 256) if raw > 127 else raw
+
+        # Byte 36: Backlight brightness
+        if len(data) > 36:
+            parsed["backlight"] = data[36]
+
+        # Byte 37: CO sensor present, Bytes 38-39: CO PPM (big endian)
+        if len(data) > 39:
+            if data[37] == 1:
+                parsed["co_ppm"] = float(_U16BE.unpack_from(data, 38)[0])
+            else:
+                parsed["co_ppm"] = None
+
+        # Bytes 40-43: Part number (uint32 LE, hex string)
+        if len(data) > 43:
+            part = _U32LE.unpack_from(data, 40)[0]
+            if part != 0:
+                # Part number is fixed per device: only re-format when it changes
+                if part != self._last_part_raw:
+                    self._last_part_raw = part
+                    self._last_part_hex = format(part, 'x')
+                parsed["part_number"] = self._last_part_hex
+
+        # Byte 44: Motherboard version
+        if len(data) > 44:
+            mb = data[44]
+            if mb != 0:
+                parsed["motherboard_version"] = mb
+
+        # Bytes 19-20: Device time (minutes from midnight, issue #48)
+        if len(data) > 20:
+            device_time_minutes = _U16BE.unpack_from(data, 19)[0]
+            parsed["device_time"] = _minutes_to_time_str(device_time_minutes)
+            parsed["device_time_minutes"] = device_time_minutes
+
+        # Bytes 21-25: Timer support (AAXX protocols, issue #48 @Xev)
+        # Only AA55/AA66 encrypted support timer (single timer slot)
+        if len(data) > 25:
+            timer_start, timer_duration = _TIMER_FIELDS.unpack_from(data, 21)
+            timer_enabled = bool(data[25])
+
+            parsed["timer_start_minutes"] = timer_start
+            parsed["timer_duration_minutes"] = timer_duration
+            parsed["timer_enabled"] = timer_enabled
+            parsed["timer"] = _format_timer(timer_start, timer_duration, timer_enabled)
 
 
 # ---------------------------------------------------------------------------
@@ -305,27 +585,31 @@ class ProtocolAA55(VevorCommandMixin, HeaterProtocol):
     name = "AA55"
 
     def parse(self, data: bytearray) -> dict[str, Any] | None:
-        parsed: dict[str, Any] = {}
-
-        parsed["running_state"] = _u8_to_number(data[3])
-        parsed["error_code"] = _u8_to_number(data[4])
-        parsed["running_step"] = _u8_to_number(data[5])
-        parsed["altitude"] = _u8_to_number(data[6]) + 256 * _u8_to_number(data[7])
-        parsed["running_mode"] = _u8_to_number(data[8])
-
-        if parsed["running_mode"] == RUNNING_MODE_LEVEL:
-            parsed["set_level"] = _u8_to_number(data[9])
-        elif parsed["running_mode"] == RUNNING_MODE_TEMPERATURE:
-            parsed["set_temp"] = _u8_to_number(data[9])
-            parsed["set_level"] = _u8_to_number(data[10]) + 1
-        elif parsed["running_mode"] == RUNNING_MODE_MANUAL:
-            parsed["set_level"] = _u8_to_number(data[10]) + 1
-
-        parsed["supply_voltage"] = (
-            (256 * _u8_to_number(data[12]) + _u8_to_number(data[11])) / 10
-        )
-        parsed["case_temperature"] = _unsign_to_sign(256 * data[14] + data[13])
-        parsed["cab_temperature"] = _unsign_to_sign(256 * data[16] + data[15])
+        (
+            running_state, error_code, running_step, altitude,
+            running_mode, byte9, byte10, voltage, case_temp, cab_temp,
+        ) = _AA55_FIELDS.unpack_from(data)
+
+        # Fixed fields go into a single dict display; only the mode-dependent
+        # set values are added afterwards
+        parsed: dict[str, Any] = {
+            "running_state": running_state,
+            "error_code": error_code,
+            "running_step": running_step,
+            "altitude": altitude,
+            "running_mode": running_mode,
+            "supply_voltage": voltage / 10,
+            "case_temperature": case_temp,
+            "cab_temperature": cab_temp,
+        }
+
+        if running_mode == RUNNING_MODE_LEVEL:
+            parsed["set_level"] = byte9
+        elif running_mode == RUNNING_MODE_TEMPERATURE:
+            parsed["set_temp"] = byte9
+            parsed["set_level"] = byte10 + 1
+        elif running_mode == RUNNING_MODE_MANUAL:
+            parsed["set_level"] = byte10 + 1
 
         return parsed
 
@@ -337,35 +621,38 @@ class ProtocolAA66(VevorCommandMixin, HeaterProtocol):
     name = "AA66"
 
     def parse(self, data: bytearray) -> dict[str, Any] | None:
-        parsed: dict[str, Any] = {}
-
-        parsed["running_state"] = _u8_to_number(data[3])
-        parsed["error_code"] = _u8_to_number(data[4])
-        parsed["running_step"] = _u8_to_number(data[5])
-        parsed["altitude"] = _u8_to_number(data[6])
-        parsed["running_mode"] = _u8_to_number(data[8])
-
-        if parsed["running_mode"] == RUNNING_MODE_LEVEL:
-            parsed["set_level"] = max(1, min(10, _u8_to_number(data[9])))
-        elif parsed["running_mode"] == RUNNING_MODE_TEMPERATURE:
-            parsed["set_temp"] = max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, _u8_to_number(data[9])))
+        (
+            running_state, error_code, running_step, altitude,
+            running_mode, byte9, voltage_raw, case_temp_raw, cab_temp,
+        ) = _AA66_FIELDS.unpack_from(data)
+
+        parsed: dict[str, Any] = {
+            "running_state": running_state,
+            "error_code": error_code,
+            "running_step": running_step,
+            "altitude": altitude,
+            "running_mode": running_mode,
+        }
+
+        if running_mode == RUNNING_MODE_LEVEL:
+            parsed["set_level"] = _CLAMP_LEVEL[byte9]
+        elif running_mode == RUNNING_MODE_TEMPERATURE:
+            parsed["set_temp"] = _CLAMP_TEMP_CELSIUS[byte9]
 
-        voltage_raw = _u8_to_number(data[11]) | (_u8_to_number(data[12]) << 8)
         parsed["supply_voltage"] = voltage_raw / 10.0
 
         # Auto-detect case temp format: >350 means 0.1°C scale
-        case_temp_raw = _u8_to_number(data[13]) | (_u8_to_number(data[14]) << 8)
         if case_temp_raw > 350:
             parsed["case_temperature"] = case_temp_raw / 10.0
         else:
             parsed["case_temperature"] = float(case_temp_raw)
 
-        parsed["cab_temperature"] = _u8_to_number(data[15])
+        parsed["cab_temperature"] = cab_temp
 
         return parsed
 
 
-class ProtocolAA55Encrypted(VevorCommandMixin, HeaterProtocol):
+class ProtocolAA55Encrypted(_EncryptedTrailerMixin, VevorCommandMixin, HeaterProtocol):
     """AA55 encrypted protocol (mode=2, 48 bytes decrypted).
 
     Receives already-decrypted data from coordinator._detect_protocol.
@@ -375,77 +662,29 @@ class ProtocolAA55Encrypted(VevorCommandMixin, HeaterProtocol):
     name = "AA55 encrypted"
 
     def parse(self, data: bytearray) -> dict[str, Any] | None:
-        parsed: dict[str, Any] = {}
-
-        parsed["running_state"] = _u8_to_number(data[3])
-        parsed["error_code"] = _u8_to_number(data[4])
-        parsed["running_step"] = _u8_to_number(data[5])
-        parsed["altitude"] = (_u8_to_number(data[7]) + 256 * _u8_to_number(data[6])) / 10
-        parsed["running_mode"] = _u8_to_number(data[8])
-        parsed["set_level"] = max(1, min(10, _u8_to_number(data[10])))
-        parsed["set_temp"] = max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, _u8_to_number(data[9])))
-
-        parsed["supply_voltage"] = (256 * data[11] + data[12]) / 10
-        parsed["case_temperature"] = _unsign_to_sign(256 * data[13] + data[14])
-        parsed["cab_temperature"] = _unsign_to_sign(256 * data[32] + data[33]) / 10
-
-        # Byte 34: Temperature offset (signed)
-        if len(data) > 34:
-            raw = data[34]
-            parsed["heater_offset"] = (raw - 256) if raw > 127 else raw
-
-        # Byte 36: Backlight brightness
-        if len(data) > 36:
-            parsed["backlight"] = _u8_to_number(data[36])
-
-        # Byte 37: CO sensor present, Bytes 38-39: CO PPM (big endian)
-        if len(data) > 39:
-            if _u8_to_number(data[37]) == 1:
-                parsed["co_ppm"] = float(
-                    (_u8_to_number(data[38]) << 8) | _u8_to_number(data[39])
-                )
-            else:
-                parsed["co_ppm"] = None
-
-        # Bytes 40-43: Part number (uint32 LE, hex string)
-        if len(data) > 43:
-            part = (
-                _u8_to_number(data[40])
-                | (_u8_to_number(data[41]) << 8)
-                | (_u8_to_number(data[42]) << 16)
-                | (_u8_to_number(data[43]) << 24)
-            )
-            if part != 0:
-                parsed["part_number"] = format(part, 'x')
-
-        # Byte 44: Motherboard version
-        if len(data) > 44:
-            mb = _u8_to_number(data[44])
-            if mb != 0:
-                parsed["motherboard_version"] = mb
-
-        # Bytes 19-20: Device time (minutes from midnight, issue #48)
-        if len(data) > 20:
-            device_time_minutes = (data[19] << 8) | data[20]
-            parsed["device_time"] = _minutes_to_time_str(device_time_minutes)
-            parsed["device_time_minutes"] = device_time_minutes
-
-        # Bytes 21-25: Timer support (AAXX protocols, issue #48 @Xev)
-        # Only AA55/AA66 encrypted support timer (single timer slot)
-        if len(data) > 25:
-            timer_start = (data[21] << 8) | data[22]
-            timer_duration = (data[23] << 8) | data[24]
-            timer_enabled = bool(data[25])
-
-            parsed["timer_start_minutes"] = timer_start
-            parsed["timer_duration_minutes"] = timer_duration
-            parsed["timer_enabled"] = timer_enabled
-            parsed["timer"] = _format_timer(timer_start, timer_duration, timer_enabled)
-
+        (
+            running_state, error_code, running_step, altitude,
+            running_mode, set_temp, set_level, voltage, case_temp,
+        ) = _AA_ENCRYPTED_FIELDS.unpack_from(data)
+
+        parsed: dict[str, Any] = {
+            "running_state": running_state,
+            "error_code": error_code,
+            "running_step": running_step,
+            "altitude": altitude / 10,
+            "running_mode": running_mode,
+            "set_level": _CLAMP_LEVEL[set_level],
+            "set_temp": _CLAMP_TEMP_CELSIUS[set_temp],
+            "supply_voltage": voltage / 10,
+            "case_temperature": case_temp,
+            "cab_temperature": _I16BE.unpack_from(data, 32)[0] / 10,
+        }
+
+        self._parse_encrypted_trailer(data, parsed)
         return parsed
 
 
-class ProtocolAA66Encrypted(VevorCommandMixin, HeaterProtocol):
+class ProtocolAA66Encrypted(_EncryptedTrailerMixin, VevorCommandMixin, HeaterProtocol):
     """AA66 encrypted protocol (mode=4, 48 bytes decrypted).
 
     Receives already-decrypted data from coordinator._detect_protocol.
@@ -456,40 +695,44 @@ class ProtocolAA66Encrypted(VevorCommandMixin, HeaterProtocol):
     name = "AA66 encrypted"
 
     def parse(self, data: bytearray) -> dict[str, Any] | None:
+        (
+            running_state, _, running_step, altitude,
+            running_mode, raw_set_temp, set_level, voltage, case_temp,
+        ) = _AA_ENCRYPTED_FIELDS.unpack_from(data)
+
         parsed: dict[str, Any] = {}
 
-        parsed["running_state"] = _u8_to_number(data[3])
-        parsed["error_code"] = _u8_to_number(data[35])  # Different position!
-        parsed["running_step"] = _u8_to_number(data[5])
-        parsed["altitude"] = (_u8_to_number(data[7]) + 256 * _u8_to_number(data[6])) / 10
-        parsed["running_mode"] = _u8_to_number(data[8])
-        parsed["set_level"] = max(1, min(10, _u8_to_number(data[10])))
+        parsed["running_state"] = running_state
+        parsed["error_code"] = data[35]  # Different position!
+        parsed["running_step"] = running_step
+        parsed["altitude"] = altitude / 10
+        parsed["running_mode"] = running_mode
+        parsed["set_level"] = _CLAMP_LEVEL[set_level]
 
         # Byte 27: Temperature unit (0=Celsius, 1=Fahrenheit)
-        temp_unit_byte = _u8_to_number(data[27])
+        temp_unit_byte = data[27]
         parsed["temp_unit"] = temp_unit_byte
         heater_uses_fahrenheit = (temp_unit_byte == 1)
 
         # Byte 9: Set temperature (convert from F to C if needed)
-        raw_set_temp = _u8_to_number(data[9])
         if heater_uses_fahrenheit:
-            parsed["set_temp"] = max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, round((raw_set_temp - 32) * 5 / 9)))
+            parsed["set_temp"] = _CLAMP_TEMP_FAHRENHEIT_TO_CELSIUS[raw_set_temp]
         else:
-            parsed["set_temp"] = max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, raw_set_temp))
+            parsed["set_temp"] = _CLAMP_TEMP_CELSIUS[raw_set_temp]
 
         # Byte 31: Automatic Start/Stop flag
-        parsed["auto_start_stop"] = (_u8_to_number(data[31]) == 1)
+        parsed["auto_start_stop"] = (data[31] == 1)
 
         # Configuration settings (bytes 26, 28, 29, 30)
         if len(data) > 26:
-            parsed["language"] = _u8_to_number(data[26])
+            parsed["language"] = data[26]
 
         if len(data) > 28:
-            parsed["tank_volume"] = _u8_to_number(data[28])
+            parsed["tank_volume"] = data[28]
 
         # Byte 29: Pump type / RF433 status (20=off, 21=on)
         if len(data) > 29:
-            pump_byte = _u8_to_number(data[29])
+            pump_byte = data[29]
             if pump_byte == 20:
                 parsed["rf433_enabled"] = False
                 parsed["pump_type"] = None
@@ -501,65 +744,13 @@ class ProtocolAA66Encrypted(VevorCommandMixin, HeaterProtocol):
                 parsed["rf433_enabled"] = None
 
         if len(data) > 30:
-            parsed["altitude_unit"] = _u8_to_number(data[30])
-
-        parsed["supply_voltage"] = (256 * data[11] + data[12]) / 10
-        parsed["case_temperature"] = _unsign_to_sign(256 * data[13] + data[14])
-        parsed["cab_temperature"] = _unsign_to_sign(256 * data[32] + data[33]) / 10
+            parsed["altitude_unit"] = data[30]
 
-        # Byte 34: Temperature offset (signed)
-        if len(data) > 34:
-            raw = data[34]
-            parsed["heater_offset"] = (raw - 256) if raw > 127 else raw
-
-        # Byte 36: Backlight brightness
-        if len(data) > 36:
-            parsed["backlight"] = _u8_to_number(data[36])
-
-        # Byte 37: CO sensor present, Bytes 38-39: CO PPM (big endian)
-        if len(data) > 39:
-            if _u8_to_number(data[37]) == 1:
-                parsed["co_ppm"] = float(
-                    (_u8_to_number(data[38]) << 8) | _u8_to_number(data[39])
-                )
-            else:
-                parsed["co_ppm"] = None
-
-        # Bytes 40-43: Part number (uint32 LE, hex string)
-        if len(data) > 43:
-            part = (
-                _u8_to_number(data[40])
-                | (_u8_to_number(data[41]) << 8)
-                | (_u8_to_number(data[42]) << 16)
-                | (_u8_to_number(data[43]) << 24)
-            )
-            if part != 0:
-                parsed["part_number"] = format(part, 'x')
-
-        # Byte 44: Motherboard version
-        if len(data) > 44:
-            mb = _u8_to_number(data[44])
-            if mb != 0:
-                parsed["motherboard_version"] = mb
-
-        # Bytes 19-20: Device time (minutes from midnight, issue #48)
-        if len(data) > 20:
-            device_time_minutes = (data[19] << 8) | data[20]
-            parsed["device_time"] = _minutes_to_time_str(device_time_minutes)
-            parsed["device_time_minutes"] = device_time_minutes
-
-        # Bytes 21-25: Timer support (AAXX protocols, issue #48 @Xev)
-        # Only AA55/AA66 encrypted support timer (single timer slot)
-        if len(data) > 25:
-            timer_start = (data[21] << 8) | data[22]
-            timer_duration = (data[23] << 8) | data[24]
-            timer_enabled = bool(data[25])
-
-            parsed["timer_start_minutes"] = timer_start
-            parsed["timer_duration_minutes"] = timer_duration
-            parsed["timer_enabled"] = timer_enabled
-            parsed["timer"] = _format_timer(timer_start, timer_duration, timer_enabled)
+        parsed["supply_voltage"] = voltage / 10
+        parsed["case_temperature"] = case_temp
+        parsed["cab_temperature"] = _I16BE.unpack_from(data, 32)[0] / 10
 
+        self._parse_encrypted_trailer(data, parsed)
         return parsed
 
 
@@ -592,17 +783,20 @@ class ProtocolABBA(HeaterProtocol):
         if len(data) < 21:
             return None
 
+        (
+            status_byte, mode_byte, gear_byte, auto_byte, voltage, temp_unit,
+            env_temp_raw, case_temp, altitude_unit, high_altitude,
+        ) = _ABBA_FIELDS.unpack_from(data)
+
         parsed: dict[str, Any] = {"connected": True}
 
         # Byte 4: Status
-        status_byte = _u8_to_number(data[4])
         parsed["running_state"] = 1 if status_byte == 0x01 else 0
         parsed["running_step"] = ABBA_STATUS_MAP.get(status_byte, status_byte)
 
         # Byte 5: Mode (0x00=Level, 0x01=Temperature, 0xFF=Error)
-        mode_byte = _u8_to_number(data[5])
         if mode_byte == 0xFF:
-            parsed["error_code"] = _u8_to_number(data[6])
+            parsed["error_code"] = gear_byte
             # Keep last known mode — don't set running_mode
         else:
             parsed["error_code"] = 0
@@ -616,41 +810,37 @@ class ProtocolABBA(HeaterProtocol):
         # Byte 6: Gear/Target temp — only parse if NOT in error state
         # (when mode_byte == 0xFF, byte 6 is the error code, not gear)
         if "running_mode" in parsed:
-            gear_byte = _u8_to_number(data[6])
             if parsed["running_mode"] == RUNNING_MODE_LEVEL:
-                parsed["set_level"] = max(1, min(10, gear_byte))
+                parsed["set_level"] = _CLAMP_LEVEL[gear_byte]
             else:
-                parsed["set_temp"] = max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, gear_byte))
+                parsed["set_temp"] = _CLAMP_TEMP_CELSIUS[gear_byte]
 
         # Byte 8: Auto Start/Stop
-        parsed["auto_start_stop"] = (_u8_to_number(data[8]) == 1)
+        parsed["auto_start_stop"] = (auto_byte == 1)
 
         # Byte 9: Supply voltage
-        parsed["supply_voltage"] = float(_u8_to_number(data[9]))
+        parsed["supply_voltage"] = float(voltage)
 
         # Byte 10: Temperature unit
-        parsed["temp_unit"] = _u8_to_number(data[10])
-        uses_fahrenheit = (parsed["temp_unit"] == 1)
+        parsed["temp_unit"] = temp_unit
+        uses_fahrenheit = (temp_unit == 1)
 
         # Byte 11: Environment/Cabin temperature
-        env_temp_raw = _u8_to_number(data[11])
         env_temp = env_temp_raw - (22 if uses_fahrenheit else 30)
         parsed["cab_temperature"] = float(env_temp)
         parsed["cab_temperature_raw"] = float(env_temp)
 
         # Bytes 12-13: Case temperature (uint16 BE)
-        parsed["case_temperature"] = float(
-            (_u8_to_number(data[12]) << 8) | _u8_to_number(data[13])
-        )
+        parsed["case_temperature"] = float(case_temp)
 
         # Byte 14: Altitude unit
-        parsed["altitude_unit"] = _u8_to_number(data[14])
+        parsed["altitude_unit"] = altitude_unit
 
         # Byte 15: High-altitude mode
-        parsed["high_altitude"] = _u8_to_number(data[15])
+        parsed["high_altitude"] = high_altitude
 
         # Bytes 16-17: Altitude (uint16 LE)
-        parsed["altitude"] = _u8_to_number(data[16]) | (_u8_to_number(data[17]) << 8)
+        parsed["altitude"] = int.from_bytes(data[16:18], "little")
 
         return parsed
 
@@ -700,7 +890,7 @@ class ProtocolABBA(HeaterProtocol):
     @staticmethod
     def _build_abba(cmd_hex: str) -> bytearray:
         """Build ABBA packet with checksum."""
-        cmd_bytes = bytes.fromhex(cmd_hex.replace(" ", ""))
+        cmd_bytes = bytes.fromhex(cmd_hex)
         checksum = sum(cmd_bytes) & 0xFF
         return bytearray(cmd_bytes) + bytearray([checksum])
 
@@ -755,6 +945,9 @@ class ProtocolCBFF(HeaterProtocol):
         # a single command sets both, so we need to remember the last values)
         self._last_mode: int = self._DEFAULT_MODE
         self._last_param: int = self._DEFAULT_PARAM
+        # Handshake PIN bytes, cached per passkey (re-sent on every reconnect)
+        self._pin_passkey: int | None = None
+        self._pin_bytes: bytes = b""
 
     def set_device_sn(self, sn: str) -> None:
         """Set the device serial number (BLE MAC without colons, uppercased).
@@ -762,6 +955,7 @@ class ProtocolCBFF(HeaterProtocol):
         Used as key2 for CBFF double-XOR encryption/decryption.
         """
         self._device_sn = sn
+        self.invalidate_parse_cache()
 
     def set_v21_mode(self, enabled: bool) -> None:
         """Enable or disable V2.1 encrypted mode.
@@ -789,8 +983,10 @@ class ProtocolCBFF(HeaterProtocol):
             Encrypted FEAA handshake packet
         """
         # PIN encoding: e.g., 1234 -> [34, 12]
-        payload = bytes([passkey % 100, passkey // 100])
-        packet = self._build_feaa(cmd_1=0x06, cmd_2=0x00, payload=payload)
+        if passkey != self._pin_passkey:
+            self._pin_bytes = _CBFF_PIN.pack(passkey % 100, passkey // 100)
+            self._pin_passkey = passkey
+        packet = self._build_feaa(cmd_1=0x06, cmd_2=0x00, payload=self._pin_bytes)
 
         # Handshake is always encrypted in V2.1
         if self._device_sn:
@@ -883,19 +1079,22 @@ class ProtocolCBFF(HeaterProtocol):
         # Plus payload + checksum
         total_length = 8 + len(payload) + 1
 
-        packet = bytearray([
-            0xFE, 0xAA,          # Header
-            0x00,                # version_num (0=heater)
-            0x00,                # package_num
-            total_length & 0xFF, # length LSB
-            (total_length >> 8) & 0xFF,  # length MSB
-            cmd_1,               # command code
-            cmd_2,               # command type
-        ])
+        packet = bytearray(_FEAA_HEADER.pack(
+            0xFE, 0xAA,     # Header
+            0x00,           # version_num (0=heater)
+            0x00,           # package_num
+            total_length,   # length (uint16 LE)
+            cmd_1,          # command code
+            cmd_2,          # command type
+        ))
         packet.extend(payload)
 
-        # Checksum: sum of all bytes & 0xFF
-        checksum = sum(packet) & 0xFF
+        # Checksum: sum of all bytes & 0xFF, accumulated from the header
+        # fields instead of re-scanning the packet
+        checksum = (
+            0xFE + 0xAA + (total_length & 0xFF) + (total_length >> 8)
+            + cmd_1 + cmd_2 + sum(payload)
+        ) & 0xFF
         packet.append(checksum)
 
         return packet
@@ -942,19 +1141,10 @@ class ProtocolCBFF(HeaterProtocol):
                 self._update_last_state(parsed_dec)
                 return parsed_dec
 
-        # Neither raw nor decrypted data is valid
+        # Neither raw nor decrypted data is valid: keep only the fields that
+        # don't depend on the sensor/config bytes and flag the data as suspect
+        parsed = {key: val for key, val in parsed.items() if key in _CBFF_SUSPECT_KEEP}
         parsed["_cbff_data_suspect"] = True
-        for key in (
-            "cab_temperature", "case_temperature", "supply_voltage",
-            "altitude", "co_ppm", "heater_offset", "error_code",
-            "running_step", "running_mode", "set_level", "set_temp",
-            "temp_unit", "altitude_unit", "language", "tank_volume",
-            "pump_type", "rf433_enabled", "backlight", "startup_temp_diff",
-            "shutdown_temp_diff", "wifi_enabled", "auto_start_stop",
-            "heater_mode", "remain_run_time", "hardware_version",
-            "software_version", "pwr_onoff",
-        ):
-            parsed.pop(key, None)
         return parsed
 
     @staticmethod
@@ -973,21 +1163,20 @@ class ProtocolCBFF(HeaterProtocol):
         key1 = "passwordA2409PW" (15 bytes, hardcoded in Sunster app)
         key2 = device_sn.upper() (BLE MAC without colons)
         """
-        key1 = bytearray(SUNSTER_V21_KEY)
-        key2 = bytearray(device_sn.upper().encode("ascii"))
-        out = bytearray(data)
-
-        j = 0
-        for i in range(len(out)):
-            out[i] ^= key1[j]
-            j = (j + 1) % len(key1)
-
-        j = 0
-        for i in range(len(out)):
-            out[i] ^= key2[j]
-            j = (j + 1) % len(key2)
-
-        return out
+        n = len(data)
+        if not n:
+            return bytearray(data)
+        key = _CBFF_KEYSTREAMS.get((device_sn, n))
+        if key is None:
+            key1 = SUNSTER_V21_KEY
+            key2 = device_sn.upper().encode("ascii")
+            # Both keys repeat over the whole frame; XOR them into one stream
+            stream1 = (key1 * (n // len(key1) + 1))[:n]
+            stream2 = (key2 * (n // len(key2) + 1))[:n]
+            key = _CBFF_KEYSTREAMS[(device_sn, n)] = (
+                int.from_bytes(stream1, "big") ^ int.from_bytes(stream2, "big")
+            )
+        return bytearray((int.from_bytes(data, "big") ^ key).to_bytes(n, "big"))
 
     @staticmethod
     def _decrypt_cbff(data: bytearray, device_sn: str) -> bytearray:
@@ -1002,19 +1191,27 @@ class ProtocolCBFF(HeaterProtocol):
     @staticmethod
     def _parse_cbff_fields(data: bytearray) -> dict[str, Any]:
         """Parse CBFF byte fields into a dict."""
+        (
+            protocol_version,
+            run_state, run_mode, run_param, now_gear, run_step, fault_display,
+            temp_unit, cab, altitude_unit, altitude, voltage, case, co_raw,
+            pwr_onoff, hw_ver, sw_ver, temp_comp,
+            lang, tank, pump, backlight, startup_diff, shutdown_diff, wifi,
+            auto_start_stop, heater_mode, remain,
+        ) = _CBFF_FIELDS.unpack_from(data)
+
         parsed: dict[str, Any] = {"connected": True}
 
         # Byte 2: protocol_version (stored for diagnostics)
-        parsed["cbff_protocol_version"] = _u8_to_number(data[2])
+        parsed["cbff_protocol_version"] = protocol_version
 
         # Byte 10: run_state (2/5/6 = OFF)
-        parsed["running_state"] = 0 if _u8_to_number(data[10]) in CBFF_RUN_STATE_OFF else 1
+        parsed["running_state"] = 0 if run_state in CBFF_RUN_STATE_OFF else 1
 
         # Byte 14: run_step
-        parsed["running_step"] = _u8_to_number(data[14])
+        parsed["running_step"] = run_step
 
         # Byte 11: run_mode (1=Level, 2=Temperature, 3=Ventilation)
-        run_mode = _u8_to_number(data[11])
         if run_mode == 1:
             parsed["running_mode"] = RUNNING_MODE_LEVEL
         elif run_mode == 2:
@@ -1025,63 +1222,51 @@ class ProtocolCBFF(HeaterProtocol):
             parsed["running_mode"] = RUNNING_MODE_MANUAL
 
         # Byte 12: run_param
-        run_param = _u8_to_number(data[12])
         if parsed["running_mode"] in (RUNNING_MODE_LEVEL, RUNNING_MODE_VENTILATION):
-            parsed["set_level"] = max(1, min(10, run_param))
+            parsed["set_level"] = _CLAMP_LEVEL[run_param]
         elif parsed["running_mode"] == RUNNING_MODE_TEMPERATURE:
-            parsed["set_temp"] = max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, run_param))
+            parsed["set_temp"] = _CLAMP_TEMP_CELSIUS[run_param]
             # Byte 13: now_gear (current gear in temp mode)
-            parsed["set_level"] = max(1, min(10, _u8_to_number(data[13])))
+            parsed["set_level"] = _CLAMP_LEVEL[now_gear]
         else:
-            parsed["set_temp"] = max(MIN_TEMP_CELSIUS, min(MAX_TEMP_CELSIUS, run_param))
+            parsed["set_temp"] = _CLAMP_TEMP_CELSIUS[run_param]
 
         # Byte 15: fault_display
-        parsed["error_code"] = _u8_to_number(data[15]) & 0x3F
+        parsed["error_code"] = fault_display & 0x3F
 
         # Byte 17: temp_unit (lower nibble)
-        parsed["temp_unit"] = _u8_to_number(data[17]) & 0x0F
+        parsed["temp_unit"] = temp_unit & 0x0F
 
         # Bytes 18-19: cabin temperature (int16 LE)
-        cab = data[18] | (data[19] << 8)
-        if cab >= 32768:
-            cab -= 65536
         parsed["cab_temperature"] = float(cab)
 
         # Byte 20: altitude_unit (lower nibble)
-        parsed["altitude_unit"] = _u8_to_number(data[20]) & 0x0F
+        parsed["altitude_unit"] = altitude_unit & 0x0F
 
         # Bytes 21-22: altitude (uint16 LE, /10)
-        parsed["altitude"] = (data[21] | (data[22] << 8)) / 10.0
+        parsed["altitude"] = altitude / 10.0
 
         # Bytes 23-24: voltage (uint16 LE, /10)
-        parsed["supply_voltage"] = (data[23] | (data[24] << 8)) / 10.0
+        parsed["supply_voltage"] = voltage / 10.0
 
         # Bytes 25-26: case temperature (int16 LE, /10)
-        case = data[25] | (data[26] << 8)
-        if case >= 32768:
-            case -= 65536
         parsed["case_temperature"] = case / 10.0
 
-        # Bytes 27-28: CO sensor (uint16 LE, /10)
-        co_ppm = (data[27] | (data[28] << 8)) / 10.0
-        parsed["co_ppm"] = co_ppm if co_ppm < 6553 else None
+        # Bytes 27-28: CO sensor (uint16 LE, /10; raw >= 65530 = not available)
+        parsed["co_ppm"] = co_raw / 10.0 if co_raw < 65530 else None
 
         # Byte 34: temp_comp (int8)
-        temp_comp = data[34]
-        parsed["heater_offset"] = (temp_comp - 256) if temp_comp > 127 else temp_comp
+        parsed["heater_offset"] = temp_comp
 
         # Byte 35: language
-        lang = _u8_to_number(data[35])
         if lang != 255:
             parsed["language"] = lang
 
         # Byte 36: tank volume index
-        tank = _u8_to_number(data[36])
         if tank != 255:
             parsed["tank_volume"] = tank
 
         # Byte 37: pump_model / RF433
-        pump = _u8_to_number(data[37])
         if pump != 255:
             if pump == 20:
                 parsed["rf433_enabled"] = False
@@ -1094,46 +1279,39 @@ class ProtocolCBFF(HeaterProtocol):
                 parsed["rf433_enabled"] = None
 
         # Byte 29: pwr_onoff
-        parsed["pwr_onoff"] = _u8_to_number(data[29])
+        parsed["pwr_onoff"] = pwr_onoff
 
         # Bytes 30-31: hardware_version (uint16 LE)
-        hw_ver = data[30] | (data[31] << 8)
         if hw_ver != 0:
             parsed["hardware_version"] = hw_ver
 
         # Bytes 32-33: software_version (uint16 LE)
-        sw_ver = data[32] | (data[33] << 8)
         if sw_ver != 0:
             parsed["software_version"] = sw_ver
 
         # Byte 38: back_light (255=not available)
-        backlight = _u8_to_number(data[38])
         if backlight != 255:
             parsed["backlight"] = backlight
 
         # Byte 39: startup_temp_difference (255=not available)
-        startup_diff = _u8_to_number(data[39])
         if startup_diff != 255:
             parsed["startup_temp_diff"] = startup_diff
 
         # Byte 40: shutdown_temp_difference (255=not available)
-        shutdown_diff = _u8_to_number(data[40])
         if shutdown_diff != 255:
             parsed["shutdown_temp_diff"] = shutdown_diff
 
         # Byte 41: wifi (255=not available)
-        wifi = _u8_to_number(data[41])
         if wifi != 255:
             parsed["wifi_enabled"] = (wifi == 1)
 
         # Byte 42: auto start/stop
-        parsed["auto_start_stop"] = (_u8_to_number(data[42]) == 1)
+        parsed["auto_start_stop"] = (auto_start_stop == 1)
 
         # Byte 43: heater_mode
-        parsed["heater_mode"] = _u8_to_number(data[43])
+        parsed["heater_mode"] = heater_mode
 
         # Bytes 44-45: remain_run_time (uint16 LE, 65535=not available)
-        remain = data[44] | (data[45] << 8)
         if remain != 65535:
             parsed["remain_run_time"] = remain
 
@@ -1164,6 +1342,38 @@ class ProtocolHcalory(HeaterProtocol):
         self._custom_query_dt: datetime | None = None  # Custom timestamp for time sync
         self._uses_fahrenheit: bool = False  # Set by coordinator from parsed temp_unit
 
+        # Fixed CMD_POWER packets (8 zero bytes + action byte), built once
+        self._power_packets: dict[int, bytes] = {
+            action: bytes(self._build_hcalory_cmd(HCALORY_CMD_POWER, bytes(8) + bytes([action])))
+            for action in (
+                HCALORY_POWER_QUERY,
+                HCALORY_POWER_OFF,
+                HCALORY_POWER_ON,
+                HCALORY_POWER_AUTO_TOGGLE,
+                HCALORY_POWER_MODE_TEMP,
+                HCALORY_POWER_MODE_LEVEL,
+                HCALORY_POWER_VENTILATION,
+                HCALORY_ALTITUDE_TOGGLE_CMD,
+                HCALORY_POWER_CELSIUS,
+                HCALORY_POWER_FAHRENHEIT,
+            )
+        }
+        # Set temp / set gear templates with zeroed value bytes (offset 12+)
+        self._set_temp_packet = bytes(self._build_hcalory_cmd(HCALORY_CMD_SET_TEMP, bytes(2)))
+        self._set_gear_packet = bytes(self._build_hcalory_cmd(HCALORY_CMD_SET_GEAR, bytes(1)))
+        # MVP2 query template with zeroed timestamp (offsets 12-15); unlike the
+        # other commands its checksum covers the whole packet
+        mvp2_query = bytes((
+            0x00, 0x02,  # Protocol ID
+            0x00, 0x01,  # Reserved
+            0x00, 0x01,  # Flags (expects response)
+            0x00, 0x0A, 0x0A, 0x00,  # dpID 0A0A
+            0x00, 0x05,  # Payload length = 5
+            0x00, 0x00, 0x00, 0x00,  # Timestamp HH MM SS DOW
+            0x00,  # Trailing 00
+        ))
+        self._mvp2_query_packet = mvp2_query + bytes([sum(mvp2_query) & 0xFF])
+
     def set_mvp_version(self, is_mvp2: bool) -> None:
         """Set MVP version (MVP1 vs MVP2) based on service UUID detection."""
         self._is_mvp2 = is_mvp2
@@ -1212,133 +1422,73 @@ class ProtocolHcalory(HeaterProtocol):
         if len(data) < 38:
             return None
 
-        parsed: dict[str, Any] = {"connected": True}
+        # The length check above covers every fixed offset read below, so no
+        # exception handling is needed around the unpack
+        (
+            altitude_mode, complete_state_byte, set_mode, set_value_raw,
+            auto_byte, voltage_raw, case_temp_raw, ambient_raw, temp_unit,
+        ) = _HCALORY_FIELDS.unpack_from(data)
 
-        try:
-            # Import MVP2 constants
-            from .const import (
-                HCALORY_RUNNING_STATUS_OFF,
-                HCALORY_RUNNING_STATUS_TURNING_OFF,
-                HCALORY_RUNNING_STATUS_HEATING,
-                HCALORY_RUNNING_STATUS_VENTILATION,
-                HCALORY_RUNNING_STATUS_ERROR,
-                HCALORY_RUNNING_STEP_INACTIVE,
-                HCALORY_RUNNING_STEP_FAN,
-                HCALORY_RUNNING_STEP_IGNITION,
-                HCALORY_RUNNING_STEP_COOLDOWN,
-                HCALORY_RUNNING_STEP_RUNNING,
-                HCALORY_RUNNING_STEP_STANDBY,
-                HCALORY_MODE_OFF,
-                HCALORY_MODE_TEMPERATURE,
-                HCALORY_MODE_LEVEL,
-                HCALORY_MODE_VENTILATION,
-            )
+        # Byte 20: Complete state byte (status in high nibble, running_step in low nibble)
+        status = (complete_state_byte & 0xF0) >> 4  # High nibble
+        running_step_raw = complete_state_byte & 0x0F  # Low nibble
 
-            # Byte 20: Complete state byte (status in high nibble, running_step in low nibble)
-            complete_state_byte = _u8_to_number(data[20])
-            status = (complete_state_byte & 0xF0) >> 4  # High nibble
-            running_step_raw = complete_state_byte & 0x0F  # Low nibble
+        # Synthetic COOLDOWN state: when status is TURNING_OFF, set running_step to COOLDOWN
+        if status == HCALORY_RUNNING_STATUS_TURNING_OFF:
+            running_step = HCALORY_RUNNING_STEP_COOLDOWN
+        else:
+            running_step = running_step_raw
 
-            # Synthetic COOLDOWN state: when status is TURNING_OFF, set running_step to COOLDOWN
-            if status == HCALORY_RUNNING_STATUS_TURNING_OFF:
-                running_step = HCALORY_RUNNING_STEP_COOLDOWN
-            else:
-                running_step = running_step_raw
+        # Byte 21: Set mode (0=Off, 1=Temperature, 2=Level, 3=Ventilation)
+        running_mode = _HCALORY_MODE_MAP.get(set_mode, RUNNING_MODE_MANUAL)
 
+        parsed: dict[str, Any] = {
+            "connected": True,
             # Store raw values for diagnostics
-            parsed["hcalory_status"] = status
-            parsed["hcalory_running_step"] = running_step
-
+            "hcalory_status": status,
+            "hcalory_running_step": running_step,
             # Map status to running_state (0=off, 1=on)
-            if status in (HCALORY_RUNNING_STATUS_OFF, HCALORY_RUNNING_STATUS_ERROR):
-                parsed["running_state"] = 0
-            else:
-                parsed["running_state"] = 1
-
+            "running_state": (
+                0 if (1 << status) & _HCALORY_STATUS_STOPPED else 1
+            ),
             # Map running_step to standard running_step
-            # MVP2 steps: 0x0=Inactive, 0x1=Fan, 0x3=Ignition, 0x4=Cooldown, 0x5=Running, 0x7=Standby
-            # Standard steps: 0=Standby, 1=Self-test, 2=Ignition, 3=Running, 4=Cooldown, 6=Ventilation
-            step_mapping = {
-                HCALORY_RUNNING_STEP_INACTIVE: 0,  # Standby
-                HCALORY_RUNNING_STEP_FAN: 6,  # Ventilation/Fan
-                HCALORY_RUNNING_STEP_IGNITION: 2,  # Ignition
-                HCALORY_RUNNING_STEP_COOLDOWN: 4,  # Cooldown
-                HCALORY_RUNNING_STEP_RUNNING: 3,  # Running
-                HCALORY_RUNNING_STEP_STANDBY: 0,  # Standby
-            }
-            parsed["running_step"] = step_mapping.get(running_step, running_step)
-
-            # Byte 21: Set mode (0=Off, 1=Temperature, 2=Level, 3=Ventilation)
-            set_mode = _u8_to_number(data[21])
-            parsed["hcalory_set_mode"] = set_mode
-
-            # Map set_mode to running_mode
-            if set_mode == HCALORY_MODE_TEMPERATURE:
-                parsed["running_mode"] = RUNNING_MODE_TEMPERATURE
-            elif set_mode == HCALORY_MODE_LEVEL:
-                parsed["running_mode"] = RUNNING_MODE_LEVEL
-            elif set_mode == HCALORY_MODE_VENTILATION:
-                parsed["running_mode"] = RUNNING_MODE_MANUAL  # Fan-only
-            else:
-                parsed["running_mode"] = RUNNING_MODE_MANUAL
-
-            # Byte 22: Set value (temperature or gear) - BUT can be None when heater is OFF
-            set_value_raw = _u8_to_number(data[22])
-
-            # Critical: set_value is None when heater is OFF, TURNING_OFF, or ERROR (@Xev's discovery)
-            if complete_state_byte == HCALORY_RUNNING_STATUS_OFF or status in (HCALORY_RUNNING_STATUS_TURNING_OFF, HCALORY_RUNNING_STATUS_ERROR):
-                # Heater is OFF - don't parse set_value (coordinator must remember last value)
-                parsed["hcalory_set_value_none"] = True
-            else:
-                # Heater is ON - parse set_value based on mode
-                if parsed.get("running_mode") == RUNNING_MODE_TEMPERATURE:
-                    # Beta.28 fix: Don't clamp here! Value may be in Fahrenheit (46-97°F).
-                    # Coordinator will convert F→C if needed, then clamp to 8-36°C.
-                    parsed["set_temp"] = set_value_raw
-                else:
-                    # Beta.36: Hcalory uses 1-10 gear levels directly (no mapping, @Xev issue #46)
-                    hcalory_level = max(HCALORY_MIN_LEVEL, min(HCALORY_MAX_LEVEL, set_value_raw))
-                    parsed["set_level"] = hcalory_level
-
+            "running_step": _HCALORY_STEP_MAP[running_step],
+            "hcalory_set_mode": set_mode,
+            "running_mode": running_mode,
             # Byte 23: Auto start/stop (@Xev note 2026-02-19: was swapped, now fixed)
             # 1 = enabled, 2 = disabled (corrected from initial analysis)
-            auto_byte = _u8_to_number(data[23])
-            parsed["auto_start_stop"] = (auto_byte == 1)  # 1 = enabled (fixed swap)
-
+            "auto_start_stop": (auto_byte == 1),  # 1 = enabled (fixed swap)
             # Bytes 24-25: Voltage (uint16 BE, /10) - fixed beta.28 per @Xev
-            voltage_raw = ((_u8_to_number(data[24]) << 8) | _u8_to_number(data[25]))
-            parsed["supply_voltage"] = voltage_raw / 10.0
-
+            "supply_voltage": voltage_raw / 10.0,
             # Bytes 27-28: Shell/Case temperature (uint16 BE, /10, in unit from byte 37)
             # Fixed beta.26: Corrected to /10 per @Xev analysis. Values are in F or C based on byte 37.
             # @Xev: shell_temp = ((data[27] << 8) | data[28]) // 10
-            case_temp_raw = ((_u8_to_number(data[27]) << 8) | _u8_to_number(data[28]))
-            parsed["case_temperature"] = case_temp_raw // 10  # Integer division, unit from byte 37
-
+            "case_temperature": case_temp_raw // 10,  # Integer division, unit from byte 37
             # Bytes 30-31: Ambient/Cabin temperature (uint16 BE, /10, in unit from byte 37)
             # Fixed beta.26: Corrected to /10 per @Xev analysis. Values are in F or C based on byte 37.
             # @Xev: ambient = ((data[30] << 8) | data[31]) // 10
-            ambient_raw = ((_u8_to_number(data[30]) << 8) | _u8_to_number(data[31]))
-            parsed["cab_temperature"] = ambient_raw // 10  # Integer division, unit from byte 37
-
+            "cab_temperature": ambient_raw // 10,  # Integer division, unit from byte 37
             # Byte 18: Altitude mode
-            if len(data) > 18:
-                parsed["high_altitude"] = _u8_to_number(data[18])
-
+            "high_altitude": altitude_mode,
             # Byte 37: Temperature unit (0=C, 1=F)
-            if len(data) > 37:
-                parsed["temp_unit"] = _u8_to_number(data[37])
-
+            "temp_unit": temp_unit,
             # Error handling: when status == ERROR (0xF), byte 22 contains error code
-            if status == HCALORY_RUNNING_STATUS_ERROR:
-                parsed["error_code"] = set_value_raw
-            else:
-                parsed["error_code"] = 0
-
-        except (ValueError, IndexError) as e:
-            # Parse error - return minimal data
-            parsed["_hcalory_parse_error"] = True
-            parsed["_parse_error_msg"] = str(e)
+            "error_code": set_value_raw if status == HCALORY_RUNNING_STATUS_ERROR else 0,
+        }
+
+        # Byte 22: Set value (temperature or gear) - BUT can be None when heater is OFF
+        # Critical: set_value is None when heater is OFF, TURNING_OFF, or ERROR (@Xev's discovery)
+        if _HCALORY_SET_VALUE_HIDDEN[complete_state_byte]:
+            # Heater is OFF - don't parse set_value (coordinator must remember last value)
+            parsed["hcalory_set_value_none"] = True
+        elif running_mode == RUNNING_MODE_TEMPERATURE:
+            # Heater is ON - parse set_value based on mode
+            # Beta.28 fix: Don't clamp here! Value may be in Fahrenheit (46-97°F).
+            # Coordinator will convert F→C if needed, then clamp to 8-36°C.
+            parsed["set_temp"] = set_value_raw
+        else:
+            # Beta.36: Hcalory uses 1-10 gear levels directly (no mapping, @Xev issue #46)
+            parsed["set_level"] = _CLAMP_HCALORY_LEVEL[set_value_raw]
 
         return parsed
 
@@ -1350,8 +1500,9 @@ class ProtocolHcalory(HeaterProtocol):
         Hcalory: 1, 2, 3, 4, 5, 6
         Standard: 2, 4, 5, 6, 8, 10
         """
-        mapping = {1: 2, 2: 4, 3: 5, 4: 6, 5: 8, 6: 10}
-        return mapping.get(hcalory_level, max(1, min(10, hcalory_level * 2)))
+        if 1 <= hcalory_level <= 6:
+            return _HCALORY_TO_STANDARD_LEVEL[hcalory_level]
+        return max(1, min(10, hcalory_level * 2))
 
     @staticmethod
     def _map_standard_to_hcalory_level(standard_level: int) -> int:
@@ -1359,18 +1510,7 @@ class ProtocolHcalory(HeaterProtocol):
 
         Standard: 1-2->1, 3-4->2, 5->3, 6->4, 7-8->5, 9-10->6
         """
-        if standard_level <= 2:
-            return 1
-        elif standard_level <= 4:
-            return 2
-        elif standard_level == 5:
-            return 3
-        elif standard_level == 6:
-            return 4
-        elif standard_level <= 8:
-            return 5
-        else:
-            return 6
+        return _STANDARD_TO_HCALORY_LEVEL[max(0, min(10, standard_level))]
 
     def build_command(self, command: int, argument: int, passkey: int) -> bytearray:
         """Build Hcalory command packet.
@@ -1388,118 +1528,102 @@ class ProtocolHcalory(HeaterProtocol):
         - MVP1: Uses dpID 0E04 for query with 9-byte payload
         - MVP2: Uses dpID 0A0A for query with timestamp payload
         """
-        # Status request - different for MVP1 vs MVP2
-        if command in (0, 1):
-            if self._is_mvp2:
-                # MVP2: Use 0A0A with timestamp
-                return self._build_mvp2_query_cmd()
-            else:
-                # MVP1: Use 0E04 with query byte
-                return self._build_hcalory_cmd(
-                    HCALORY_CMD_POWER,
-                    bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_QUERY])
-                )
+        handler = self._COMMAND_HANDLERS.get(command)
+        if handler is None:
+            # Default: status query
+            return self._power_cmd(HCALORY_POWER_QUERY)
+        return handler(self, argument)
 
-        # Set mode (cmd 2) - Temperature=2, Level=1
+    # -------------------------
+    # build_command handlers (argument -> packet)
+    # -------------------------
+
+    def _cmd_query(self, argument: int) -> bytearray:
+        """Status request / time sync (cmd 0, 1, 10) - different for MVP1 vs MVP2.
+
+        The MVP2 query packet (dpID 0x0A0A) contains HH:MM:SS:DOW which the
+        heater uses to sync its clock. MVP1 may not support explicit time sync.
+        """
+        if self._is_mvp2:
+            # MVP2: Use 0A0A with timestamp
+            return self._build_mvp2_query_cmd()
+        # MVP1: Use 0E04 with query byte
+        return self._power_cmd(HCALORY_POWER_QUERY)
+
+    def _cmd_set_mode(self, argument: int) -> bytearray:
+        """Set mode (cmd 2) - Temperature=2, Level=1."""
         # @Xev btsnoop analysis (issue #43): mode switch uses CMD_POWER, not CMD_SET_MODE
-        if command == 2:
-            # argument: 1=Level mode, 2=Temperature mode
-            from .const import HCALORY_POWER_MODE_LEVEL, HCALORY_POWER_MODE_TEMP
-            mode_value = HCALORY_POWER_MODE_TEMP if argument == 2 else HCALORY_POWER_MODE_LEVEL
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_POWER,
-                bytes([0, 0, 0, 0, 0, 0, 0, 0, mode_value])
-            )
+        mode_value = HCALORY_POWER_MODE_TEMP if argument == 2 else HCALORY_POWER_MODE_LEVEL
+        return self._power_cmd(mode_value)
 
-        # Power on/off (cmd 3)
-        if command == 3:
-            power_arg = HCALORY_POWER_ON if argument == 1 else HCALORY_POWER_OFF
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_POWER,
-                bytes([0, 0, 0, 0, 0, 0, 0, 0, power_arg])
-            )
+    def _cmd_power(self, argument: int) -> bytearray:
+        """Power on/off (cmd 3)."""
+        power_arg = HCALORY_POWER_ON if argument == 1 else HCALORY_POWER_OFF
+        return self._power_cmd(power_arg)
 
-        # Set temperature (cmd 4)
+    def _cmd_set_temp(self, argument: int) -> bytearray:
+        """Set temperature (cmd 4)."""
         # Beta.41 fix: Use Hcalory-specific limits (0-40°C / 32-104°F)
         # and respect heater's native temperature unit
-        if command == 4:
-            if self._uses_fahrenheit:
-                temp = max(HCALORY_MIN_TEMP_FAHRENHEIT, min(HCALORY_MAX_TEMP_FAHRENHEIT, argument))
-                unit_byte = 0x01  # Fahrenheit
-            else:
-                temp = max(HCALORY_MIN_TEMP_CELSIUS, min(HCALORY_MAX_TEMP_CELSIUS, argument))
-                unit_byte = 0x00  # Celsius
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_SET_TEMP,
-                bytes([temp, unit_byte])
-            )
-
-        # Set level (cmd 5)
-        if command == 5:
-            # Beta.36: Use level 1-10 directly, no mapping (@Xev issue #46)
-            level = max(HCALORY_MIN_LEVEL, min(HCALORY_MAX_LEVEL, argument))
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_SET_GEAR,
-                bytes([level])
-            )
-
-        # Set auto start/stop — toggle command (@Xev, issue #43)
-        # Auto start/stop is a TOGGLE (0x05), not separate ON/OFF values
-        # cmd 18 = coordinator standard, cmd 22 = legacy/custom
-        if command in (18, 22):
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_POWER,
-                bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_AUTO_TOGGLE])
-            )
-
-        # Set temperature unit (cmd 15)
-        if command == 15:
-            temp_unit_arg = HCALORY_POWER_FAHRENHEIT if argument == 1 else HCALORY_POWER_CELSIUS
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_POWER,
-                bytes([0, 0, 0, 0, 0, 0, 0, 0, temp_unit_arg])
-            )
-
-        # Time sync (cmd 10) - MVP2 uses query command with timestamp to sync time
-        # The query packet (dpID 0x0A0A) contains HH:MM:SS:DOW which the heater uses to sync
-        if command == 10:
-            if self._is_mvp2:
-                # MVP2: Send query with current timestamp (heater syncs from it)
-                return self._build_mvp2_query_cmd()
-            else:
-                # MVP1: Fallback to query (MVP1 may not support explicit time sync)
-                return self._build_hcalory_cmd(
-                    HCALORY_CMD_POWER,
-                    bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_QUERY])
-                )
-
-        # Toggle altitude mode (cmd 9) - MVP2 only (@Xev, issue #34)
-        # Cycles through: OFF(0) → MODE_1(1) → MODE_2(2) → OFF(0)
-        # Payload: 0x04 0x00 0x00 0x09 [8 zeros] 0x09
-        if command == 9:
-            # Use dpID 0x0E04 with special payload ending in 0x09 (toggle command)
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_POWER,
-                bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_ALTITUDE_TOGGLE_CMD])
-            )
-
-        # Set altitude (cmd 14)
-        if command == 14:
-            # argument is altitude in meters
-            sign = 0x00 if argument >= 0 else 0x01
-            alt_abs = abs(argument)
-            unit = 0x00  # Meters
-            return self._build_hcalory_cmd(
-                HCALORY_CMD_SET_ALTITUDE,
-                bytes([sign, (alt_abs >> 8) & 0xFF, alt_abs & 0xFF, unit])
-            )
-
-        # Default: status query
+        if self._uses_fahrenheit:
+            temp = max(HCALORY_MIN_TEMP_FAHRENHEIT, min(HCALORY_MAX_TEMP_FAHRENHEIT, argument))
+            unit_byte = 0x01  # Fahrenheit
+        else:
+            temp = max(HCALORY_MIN_TEMP_CELSIUS, min(HCALORY_MAX_TEMP_CELSIUS, argument))
+            unit_byte = 0x00  # Celsius
+        return self._set_temp_cmd(temp, unit_byte)
+
+    def _cmd_set_level(self, argument: int) -> bytearray:
+        """Set level (cmd 5)."""
+        # Beta.36: Use level 1-10 directly, no mapping (@Xev issue #46)
+        level = max(HCALORY_MIN_LEVEL, min(HCALORY_MAX_LEVEL, argument))
+        return self._set_gear_cmd(level)
+
+    def _cmd_auto_start_stop(self, argument: int) -> bytearray:
+        """Set auto start/stop (cmd 18 standard, cmd 22 legacy/custom)."""
+        # Auto start/stop is a TOGGLE (0x05), not separate ON/OFF values (@Xev, issue #43)
+        return self._power_cmd(HCALORY_POWER_AUTO_TOGGLE)
+
+    def _cmd_temp_unit(self, argument: int) -> bytearray:
+        """Set temperature unit (cmd 15)."""
+        temp_unit_arg = HCALORY_POWER_FAHRENHEIT if argument == 1 else HCALORY_POWER_CELSIUS
+        return self._power_cmd(temp_unit_arg)
+
+    def _cmd_toggle_altitude(self, argument: int) -> bytearray:
+        """Toggle altitude mode (cmd 9) - MVP2 only (@Xev, issue #34).
+
+        Cycles through: OFF(0) → MODE_1(1) → MODE_2(2) → OFF(0)
+        Payload: 0x04 0x00 0x00 0x09 [8 zeros] 0x09
+        """
+        # Use dpID 0x0E04 with special payload ending in 0x09 (toggle command)
+        return self._power_cmd(HCALORY_ALTITUDE_TOGGLE_CMD)
+
+    def _cmd_set_altitude(self, argument: int) -> bytearray:
+        """Set altitude (cmd 14); argument is altitude in meters."""
+        sign = 0x00 if argument >= 0 else 0x01
+        alt_abs = abs(argument)
+        unit = 0x00  # Meters
         return self._build_hcalory_cmd(
-            HCALORY_CMD_POWER,
-            bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_QUERY])
+            HCALORY_CMD_SET_ALTITUDE,
+            bytes([sign, (alt_abs >> 8) & 0xFF, alt_abs & 0xFF, unit])
         )
 
+    # Standard command number -> handler; unknown commands fall back to a status query
+    _COMMAND_HANDLERS = {
+        0: _cmd_query,
+        1: _cmd_query,
+        2: _cmd_set_mode,
+        3: _cmd_power,
+        4: _cmd_set_temp,
+        5: _cmd_set_level,
+        9: _cmd_toggle_altitude,
+        10: _cmd_query,
+        14: _cmd_set_altitude,
+        15: _cmd_temp_unit,
+        18: _cmd_auto_start_stop,
+        22: _cmd_auto_start_stop,
+    }
+
     @staticmethod
     def _build_hcalory_cmd(cmd_type: int, payload: bytes) -> bytearray:
         """Build Hcalory command packet with checksum.
@@ -1521,32 +1645,44 @@ class ProtocolHcalory(HeaterProtocol):
           00 02 00 01 00 01 00 07 | 06 00 00 02 14 00 | 1C
           Header (0-7)            | Payload (8-13)    | Checksum=28
         """
-        cmd_hi = (cmd_type >> 8) & 0xFF
-        cmd_lo = cmd_type & 0xFF
         payload_len = len(payload)
 
-        # Build header (bytes 0-7)
-        packet = bytearray([
+        # Header (bytes 0-11) is packed straight into the final buffer,
+        # followed by the payload and the checksum byte
+        packet = bytearray(_HCALORY_CMD_HEADER.size + payload_len + 1)
+        _HCALORY_CMD_HEADER.pack_into(
+            packet, 0,
             0x00, 0x02,  # Protocol ID (bytes 0-1)
             0x00, 0x01,  # Reserved (bytes 2-3)
             0x00, 0x01,  # Flags (bytes 4-5)
-            0x00, cmd_hi,  # Command high (bytes 6-7)
-        ])
-
-        # Build payload for checksum calculation (bytes 8+)
-        payload_for_checksum = bytearray([
-            cmd_lo,  # Command low (byte 8)
-            0x00, 0x00,  # Padding (bytes 9-10)
+            cmd_type,    # Command high (byte 7) + low (byte 8)
             payload_len,  # Payload length (byte 11)
-        ])
-        payload_for_checksum.extend(payload)
+        )
+        packet[12:-1] = payload
 
-        packet.extend(payload_for_checksum)
+        # Checksum covers bytes 8 onwards; padding bytes are zero, so only
+        # cmd_lo, the length byte and the payload contribute
+        packet[-1] = ((cmd_type & 0xFF) + payload_len + sum(payload)) & 0xFF
 
-        # Calculate checksum on payload portion only (bytes 8 onwards)
-        checksum = sum(payload_for_checksum) & 0xFF
-        packet.append(checksum)
+        return packet
+
+    def _power_cmd(self, action: int) -> bytearray:
+        """Return a copy of the prebuilt CMD_POWER packet for ``action``."""
+        return bytearray(self._power_packets[action])
 
+    def _set_temp_cmd(self, temp: int, unit_byte: int) -> bytearray:
+        """Stamp temperature and unit into the CMD_SET_TEMP template."""
+        packet = bytearray(self._set_temp_packet)
+        packet[12] = temp
+        packet[13] = unit_byte
+        packet[-1] = (packet[-1] + temp + unit_byte) & 0xFF
+        return packet
+
+    def _set_gear_cmd(self, level: int) -> bytearray:
+        """Stamp the gear level into the CMD_SET_GEAR template."""
+        packet = bytearray(self._set_gear_packet)
+        packet[12] = level
+        packet[-1] = (packet[-1] + level) & 0xFF
         return packet
 
     @staticmethod
@@ -1563,31 +1699,24 @@ class ProtocolHcalory(HeaterProtocol):
         Timestamp is 4 bytes (NOT BCD): hour, minute, second, isoweekday (1-7)
         """
         # Use custom timestamp if set (for time sync), otherwise current time
-        now = self._custom_query_dt if self._custom_query_dt is not None else datetime.now()
+        now = self._custom_query_dt
         # @Xev: timestamp is NOT BCD encoded, just raw bytes + isoweekday()
-        timestamp = bytes([
-            now.hour,
-            now.minute,
-            now.second,
-            now.isoweekday()  # 1=Monday, 7=Sunday
-        ])
-
-        # Build packet: header + dpID 0A0A + payload length (5) + timestamp + 00
-        packet = bytearray([
-            0x00, 0x02,  # Protocol ID
-            0x00, 0x01,  # Reserved
-            0x00, 0x01,  # Flags (expects response)
-            0x00, 0x0A, 0x0A, 0x00,  # dpID 0A0A
-            0x00, 0x05,  # Payload length = 5
-        ])
+        if now is None:
+            # time.localtime() avoids building a datetime for the common path
+            t = time.localtime()
+            hour, minute, second = t.tm_hour, t.tm_min, t.tm_sec
+            weekday = t.tm_wday + 1  # 1=Monday, 7=Sunday
+        else:
+            hour, minute, second = now.hour, now.minute, now.second
+            weekday = now.isoweekday()  # 1=Monday, 7=Sunday
 
-        # Add timestamp (4 bytes: HH MM SS DOW) + trailing 00
-        packet.extend(timestamp)
-        packet.append(0x00)
-
-        # Calculate checksum
-        checksum = sum(packet) & 0xFF
-        packet.append(checksum)
+        # Stamp timestamp (4 bytes: HH MM SS DOW) into the prebuilt template
+        packet = bytearray(self._mvp2_query_packet)
+        packet[12] = hour
+        packet[13] = minute
+        packet[14] = second
+        packet[15] = weekday
+        packet[-1] = (packet[-1] + hour + minute + second + weekday) & 0xFF
 
         return packet
 
@@ -1606,12 +1735,11 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Password handshake command packet
         """
-        # Extract individual digits from passkey
-        digits = []
-        pk = passkey
-        for _ in range(4):
-            digits.insert(0, pk % 10)
-            pk //= 10
+        # Extract the last 4 decimal digits of the passkey (most significant first)
+        pk, d4 = divmod(passkey, 10)
+        pk, d3 = divmod(pk, 10)
+        pk, d2 = divmod(pk, 10)
+        digits = (pk % 10, d2, d3, d4)
 
         # Build packet according to @Xev's analysis (issue #34)
         # Correct structure for PIN=0: 00 02 00 01 00 01 00 0A 0C 00 00 05 01 00 00 00 00 12
@@ -1658,11 +1786,7 @@ class ProtocolHcalory(HeaterProtocol):
         """
         temp_clamped = max(HCALORY_MIN_TEMP_CELSIUS, min(HCALORY_MAX_TEMP_CELSIUS, temp))
         # Use CMD_SET_TEMP (0x0706) with [temp, unit=0]
-        from .const import HCALORY_CMD_SET_TEMP
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_SET_TEMP,
-            bytes([temp_clamped, 0x00])  # temp, unit=Celsius
-        )
+        return self._set_temp_cmd(temp_clamped, 0x00)  # temp, unit=Celsius
 
     def set_temperature_fahrenheit(self, temp_f: int) -> bytearray:
         """Set temperature in Fahrenheit mode.
@@ -1673,11 +1797,7 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Command packet to set temperature
         """
-        from .const import HCALORY_CMD_SET_TEMP
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_SET_TEMP,
-            bytes([temp_f, 0x01])  # temp, unit=Fahrenheit
-        )
+        return self._set_temp_cmd(temp_f, 0x01)  # temp, unit=Fahrenheit
 
     def set_level_mode(self) -> bytearray:
         """Switch to Level/Gear mode.
@@ -1691,12 +1811,8 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Command packet to switch to level mode
         """
-        from .const import HCALORY_CMD_POWER, HCALORY_POWER_MODE_LEVEL
         # @Xev btsnoop analysis (issue #43): 0x07=Level, 0x06=Temp
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_POWER,
-            bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_MODE_LEVEL])
-        )
+        return self._power_cmd(HCALORY_POWER_MODE_LEVEL)
 
     def set_temperature_mode(self) -> bytearray:
         """Switch to Temperature mode.
@@ -1704,12 +1820,8 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Command packet to switch to temperature mode
         """
-        from .const import HCALORY_CMD_POWER, HCALORY_POWER_MODE_TEMP
         # @Xev btsnoop analysis (issue #43): 0x07=Level, 0x06=Temp
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_POWER,
-            bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_MODE_TEMP])
-        )
+        return self._power_cmd(HCALORY_POWER_MODE_TEMP)
 
     def set_ventilation_mode(self) -> bytearray:
         """Switch to Ventilation/Fan-only mode.
@@ -1719,11 +1831,7 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Command packet to enable ventilation mode
         """
-        from .const import HCALORY_CMD_POWER, HCALORY_POWER_VENTILATION
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_POWER,
-            bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_VENTILATION])
-        )
+        return self._power_cmd(HCALORY_POWER_VENTILATION)
 
     def toggle_auto_start_stop(self) -> bytearray:
         """Toggle automatic start/stop feature.
@@ -1734,11 +1842,7 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Command packet to toggle auto start/stop
         """
-        from .const import HCALORY_CMD_POWER, HCALORY_POWER_AUTO_TOGGLE
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_POWER,
-            bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_AUTO_TOGGLE])
-        )
+        return self._power_cmd(HCALORY_POWER_AUTO_TOGGLE)
 
     # Keep aliases for backwards compatibility
     def enable_auto_start_stop(self) -> bytearray:
@@ -1755,11 +1859,7 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Command packet to switch to Celsius
         """
-        from .const import HCALORY_CMD_POWER, HCALORY_POWER_CELSIUS
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_POWER,
-            bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_CELSIUS])
-        )
+        return self._power_cmd(HCALORY_POWER_CELSIUS)
 
     def set_temperature_unit_fahrenheit(self) -> bytearray:
         """Set temperature display unit to Fahrenheit.
@@ -1767,8 +1867,4 @@ class ProtocolHcalory(HeaterProtocol):
         Returns:
             Command packet to switch to Fahrenheit
         """
-        from .const import HCALORY_CMD_POWER, HCALORY_POWER_FAHRENHEIT
-        return self._build_hcalory_cmd(
-            HCALORY_CMD_POWER,
-            bytes([0, 0, 0, 0, 0, 0, 0, 0, HCALORY_POWER_FAHRENHEIT])
-        )
+        return self._power_cmd(HCALORY_POWER_FAHRENHEIT)
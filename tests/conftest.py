@@ -3,49 +3,137 @@
 For pure-Python tests (protocol, helpers) we stub out the homeassistant
 package so that ``custom_components.diesel_heater`` can be imported without
 having Home Assistant installed.
+
+The suite can run in parallel with pytest-xdist
+(``pytest -n auto --dist loadfile``). Every worker is its own process and
+imports this module once, so the stubs below are set up at import time and
+nothing here is shared or mutated across workers.
 """
 from __future__ import annotations
 
+import importlib.abc
+import importlib.util
 import sys
 import types
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
 
+def _stub_getattr(mod: types.ModuleType):
+    """Return a module ``__getattr__`` that creates one MagicMock per name.
+
+    The mock is stored on the module, so later lookups of the same name
+    (e.g. ``HVACMode`` imported by several modules) hit the real attribute
+    and return the same object instead of building a new MagicMock.
+    """
 
-class _HAStubFinder:
-    """Meta-path finder that intercepts homeassistant.* and bleak* imports.
+    def __getattr__(name):
+        value = MagicMock()
+        setattr(mod, name, value)
+        return value
 
-    Returns a fresh MagicMock-based module for any submodule, so that
+    return __getattr__
+
+
+class _HAStubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Meta-path finder/loader that intercepts homeassistant.* and bleak* imports.
+
+    Returns a MagicMock-based module for any submodule, so that
     ``from homeassistant.components.recorder import get_instance`` works
     without the real HA package installed.
     """
 
+    # bleak_retry_connector is a separate top-level package (imported by the
+    # coordinator); the "bleak." prefix does not cover it
     _PREFIXES = ("homeassistant", "bleak", "bleak_retry_connector")
+    _PREFIX_DOTS = tuple(prefix + "." for prefix in _PREFIXES)
 
-    def find_module(self, fullname, path=None):
-        for prefix in self._PREFIXES:
-            if fullname == prefix or fullname.startswith(prefix + "."):
-                return self
+    def find_spec(self, fullname, path=None, target=None):
+        # Called for every import while tests run: one tuple startswith call
+        if fullname in self._PREFIXES or fullname.startswith(self._PREFIX_DOTS):
+            # Every stub is a package so submodule imports keep resolving
+            return importlib.util.spec_from_loader(fullname, self, is_package=True)
         return None
 
-    def load_module(self, fullname):
-        if fullname in sys.modules:
-            return sys.modules[fullname]
-        mod = types.ModuleType(fullname)
-        mod.__path__ = []          # make it a package
-        mod.__loader__ = self
-        mod.__spec__ = None
-        # Attribute access returns MagicMock so `from x import y` works
-        mod.__getattr__ = lambda name: MagicMock()
-        sys.modules[fullname] = mod
-        return mod
-
-
-# Install the finder BEFORE any test import
-sys.meta_path.insert(0, _HAStubFinder())
+    def create_module(self, spec):
+        return None  # default module creation
+
+    def exec_module(self, module):
+        # Attribute access returns MagicMock so `from x import y` works.
+        # Installed last, after the import system has set the module attributes.
+        module.__getattr__ = _stub_getattr(module)
+
+
+# Install the finder BEFORE any test import. Drop one left by an earlier
+# import of this module (e.g. as both ``conftest`` and ``tests.conftest``)
+# so finders don't pile up on sys.meta_path.
+sys.meta_path[:] = [
+    finder for finder in sys.meta_path
+    if type(finder).__name__ != _HAStubFinder.__name__
+]
+_STUB_FINDER = _HAStubFinder()
+sys.meta_path.insert(0, _STUB_FINDER)
+
+
+def _make_stub(name: str) -> types.ModuleType:
+    """Build the same stub module the finder would create for ``name``."""
+    module = importlib.util.module_from_spec(
+        importlib.util.spec_from_loader(name, _STUB_FINDER, is_package=True)
+    )
+    _STUB_FINDER.exec_module(module)
+    return module
+
+
+# Stub modules imported by custom_components.diesel_heater, created in one
+# batch up front (parents before children). The finder stays as a fallback
+# for anything not listed here.
+_PRELOAD = (
+    "homeassistant",
+    "homeassistant.components",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.bluetooth",
+    "homeassistant.components.button",
+    "homeassistant.components.climate",
+    "homeassistant.components.fan",
+    "homeassistant.components.number",
+    "homeassistant.components.recorder",
+    "homeassistant.components.recorder.statistics",
+    "homeassistant.components.select",
+    "homeassistant.components.sensor",
+    "homeassistant.components.switch",
+    "homeassistant.config_entries",
+    "homeassistant.const",
+    "homeassistant.core",
+    "homeassistant.data_entry_flow",
+    "homeassistant.exceptions",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.util",
+    "homeassistant.util.percentage",
+    "bleak",
+    "bleak.exc",
+    "bleak_retry_connector",
+)
+
+for _name in _PRELOAD:
+    if _name not in sys.modules:
+        sys.modules[_name] = _make_stub(_name)
+        # Bind submodules on their parent like the import system does, so
+        # `from homeassistant.components import climate` gets the module
+        _parent, _, _child = _name.rpartition(".")
+        if _parent:
+            setattr(sys.modules[_parent], _child, sys.modules[_name])
 
 # Ensure custom_components is importable
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 
 # ---------------------------------------------------------------------------
@@ -177,12 +265,8 @@ class _StubConfigEntry:
 # ---------------------------------------------------------------------------
 # Inject stubs into the HA stub modules
 # ---------------------------------------------------------------------------
-# Force-create the modules via our finder, then override specific attributes
-# with real classes.  This must happen BEFORE any test imports config_flow.py.
-
-import homeassistant.config_entries  # noqa: E402
-import homeassistant.data_entry_flow  # noqa: E402
-import homeassistant.const  # noqa: E402
+# The modules are preloaded above; override specific attributes with real
+# classes.  This must happen BEFORE any test imports config_flow.py.
 
 sys.modules["homeassistant.config_entries"].ConfigFlow = _StubConfigFlow
 sys.modules["homeassistant.config_entries"].OptionsFlow = _StubOptionsFlow
@@ -226,7 +310,6 @@ class _StubUpdateFailed(Exception):
 
 
 # Inject coordinator stubs
-import homeassistant.helpers.update_coordinator  # noqa: E402
 
 sys.modules["homeassistant.helpers.update_coordinator"].DataUpdateCoordinator = _StubDataUpdateCoordinator
 sys.modules["homeassistant.helpers.update_coordinator"].UpdateFailed = _StubUpdateFailed
@@ -337,16 +420,7 @@ class _StubButtonEntity(_StubEntity):
     pass
 
 
-# Inject entity stubs - import modules first to create them via our finder
-import homeassistant.helpers.entity  # noqa: E402
-import homeassistant.components.sensor  # noqa: E402
-import homeassistant.components.binary_sensor  # noqa: E402
-import homeassistant.components.climate  # noqa: E402
-import homeassistant.components.fan  # noqa: E402
-import homeassistant.components.switch  # noqa: E402
-import homeassistant.components.select  # noqa: E402
-import homeassistant.components.number  # noqa: E402
-import homeassistant.components.button  # noqa: E402
+# Inject entity stubs
 
 sys.modules["homeassistant.helpers.update_coordinator"].CoordinatorEntity = _StubCoordinatorEntity
 sys.modules["homeassistant.helpers.entity"].Entity = _StubEntity
@@ -372,14 +446,6 @@ def _stub_callback(func):
     """Stub for homeassistant.core.callback decorator (identity function)."""
     return func
 
-# Ensure homeassistant.core module exists before setting callback
-if "homeassistant.core" not in sys.modules:
-    _ha_core = types.ModuleType("homeassistant.core")
-    _ha_core.__path__ = []
-    _ha_core.__loader__ = _HAStubFinder()
-    _ha_core.__spec__ = None
-    _ha_core.__getattr__ = lambda name: MagicMock()
-    sys.modules["homeassistant.core"] = _ha_core
 sys.modules["homeassistant.core"].callback = _stub_callback
 
 
@@ -388,15 +454,6 @@ sys.modules["homeassistant.core"].callback = _stub_callback
 # ---------------------------------------------------------------------------
 # Some constants need to be real values for tests to work properly.
 
-# Ensure homeassistant.const module exists
-if "homeassistant.const" not in sys.modules:
-    _ha_const = types.ModuleType("homeassistant.const")
-    _ha_const.__path__ = []
-    _ha_const.__loader__ = _HAStubFinder()
-    _ha_const.__spec__ = None
-    _ha_const.__getattr__ = lambda name: MagicMock()
-    sys.modules["homeassistant.const"] = _ha_const
-
 # Set real string values for constants used as dict keys
 sys.modules["homeassistant.const"].ATTR_TEMPERATURE = "temperature"
 sys.modules["homeassistant.const"].CONF_ADDRESS = "address"
@@ -435,15 +492,6 @@ class _ServiceValidationError(_HomeAssistantError):
     pass
 
 
-# Ensure homeassistant.exceptions module exists
-if "homeassistant.exceptions" not in sys.modules:
-    _ha_exceptions = types.ModuleType("homeassistant.exceptions")
-    _ha_exceptions.__path__ = []
-    _ha_exceptions.__loader__ = _HAStubFinder()
-    _ha_exceptions.__spec__ = None
-    _ha_exceptions.__getattr__ = lambda name: MagicMock()
-    sys.modules["homeassistant.exceptions"] = _ha_exceptions
-
 sys.modules["homeassistant.exceptions"].ConfigEntryNotReady = _ConfigEntryNotReady
 sys.modules["homeassistant.exceptions"].HomeAssistantError = _HomeAssistantError
 sys.modules["homeassistant.exceptions"].ServiceValidationError = _ServiceValidationError
@@ -459,13 +507,88 @@ class _BleakError(Exception):
     pass
 
 
-# Ensure bleak.exc module exists
-if "bleak.exc" not in sys.modules:
-    _bleak_exc = types.ModuleType("bleak.exc")
-    _bleak_exc.__path__ = []
-    _bleak_exc.__loader__ = _HAStubFinder()
-    _bleak_exc.__spec__ = None
-    _bleak_exc.__getattr__ = lambda name: MagicMock()
-    sys.modules["bleak.exc"] = _bleak_exc
-
 sys.modules["bleak.exc"].BleakError = _BleakError
+
+
+# ---------------------------------------------------------------------------
+# Entity platform fixtures
+# ---------------------------------------------------------------------------
+
+def _async_stub(return_value=None):
+    """Return a coroutine function that records its calls in ``.calls``.
+
+    Lighter than AsyncMock for coordinator coroutines that tests only
+    count calls on.
+    """
+    calls = []
+
+    async def _stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        return return_value
+
+    _stub.calls = calls
+    return _stub
+
+
+def _stub(return_value=None):
+    """Synchronous counterpart of ``_async_stub``."""
+    calls = []
+
+    def _sync_stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        return return_value
+
+    _sync_stub.calls = calls
+    return _sync_stub
+
+
+class _StubCoordinator:
+    """Coordinator double for entity platform tests.
+
+    A slotted plain object instead of a MagicMock tree: only the attributes
+    the entities actually read exist, and a misspelled attribute in a test
+    raises instead of silently creating a child mock. Coroutines record calls
+    in ``.calls`` (see ``_async_stub``).
+    """
+
+    __slots__ = (
+        "_address", "address", "_heater_id", "_heater_uses_fahrenheit",
+        "last_update_success", "data", "send_command", "async_set_temperature",
+        "async_turn_on", "async_turn_off", "async_set_level", "async_sync_time",
+        "async_reset_fuel_level", "reset_fuel_level", "async_add_listener",
+    )
+
+    def __init__(self, data):
+        self._address = "AA:BB:CC:DD:EE:FF"
+        self.address = "AA:BB:CC:DD:EE:FF"
+        self._heater_id = "EE:FF"
+        self._heater_uses_fahrenheit = False
+        self.last_update_success = True
+        self.data = data
+        self.send_command = _async_stub(return_value=True)
+        # Tests assert call arguments on this one, so keep the full mock
+        self.async_set_temperature = AsyncMock()
+        self.async_turn_on = _async_stub()
+        self.async_turn_off = _async_stub()
+        self.async_set_level = _async_stub()
+        self.async_sync_time = _async_stub()
+        self.async_reset_fuel_level = _async_stub()
+        self.reset_fuel_level = _async_stub()
+        # Returns the unsubscribe callback, like DataUpdateCoordinator
+        self.async_add_listener = _stub(return_value=lambda: None)
+
+
+_DEFAULT_COORDINATOR_DATA = types.MappingProxyType({"connected": True})
+
+
+@pytest.fixture
+def coordinator(request):
+    """Lightweight coordinator double for entity platform tests.
+
+    Test modules can define ``MOCK_COORDINATOR_DATA`` (a ``MappingProxyType``)
+    for the initial ``coordinator.data``. The read-only view is shared by
+    every test; tests that change data assign a ``dict`` copy to
+    ``coordinator.data`` first.
+    """
+    data = getattr(request.module, "MOCK_COORDINATOR_DATA", _DEFAULT_COORDINATOR_DATA)
+    return _StubCoordinator(data)
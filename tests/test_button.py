@@ -1,11 +1,10 @@
 """Tests for Diesel Heater button platform."""
 from __future__ import annotations
 
-import pytest
-from unittest.mock import MagicMock, AsyncMock
+from types import MappingProxyType
 
-# Import stubs first
-from . import conftest  # noqa: F401
+import pytest
+from unittest.mock import MagicMock
 
 from custom_components.diesel_heater.button import (
     VevorTimeSyncButton,
@@ -14,21 +13,23 @@ from custom_components.diesel_heater.button import (
 )
 
 
-def create_mock_coordinator() -> MagicMock:
-    """Create a mock coordinator for button testing."""
-    coordinator = MagicMock()
-    coordinator._address = "AA:BB:CC:DD:EE:FF"
-    coordinator.address = "AA:BB:CC:DD:EE:FF"
-    coordinator._heater_id = "EE:FF"
-    coordinator.last_update_success = True
-    coordinator.send_command = AsyncMock(return_value=True)
-    coordinator.reset_fuel_level = AsyncMock()
-    coordinator.async_sync_time = AsyncMock()
-    coordinator.async_reset_fuel_level = AsyncMock()
-    coordinator.data = {
-        "connected": True,
-    }
-    return coordinator
+# Initial coordinator.data for the shared ``coordinator`` fixture (conftest).
+# Read-only; tests that change it assign a dict copy first.
+MOCK_COORDINATOR_DATA = MappingProxyType({
+    "connected": True,
+})
+
+
+@pytest.fixture
+def time_sync_button(coordinator) -> VevorTimeSyncButton:
+    """Time sync button built from the shared coordinator."""
+    return VevorTimeSyncButton(coordinator)
+
+
+@pytest.fixture
+def reset_fuel_button(coordinator) -> VevorResetFuelLevelButton:
+    """Reset fuel level button built from the shared coordinator."""
+    return VevorResetFuelLevelButton(coordinator)
 
 
 # ---------------------------------------------------------------------------
@@ -38,19 +39,13 @@ def create_mock_coordinator() -> MagicMock:
 class TestVevorTimeSyncButton:
     """Tests for Vevor time sync button entity."""
 
-    def test_unique_id(self):
+    def test_unique_id(self, time_sync_button):
         """Test unique_id format."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
+        assert "_time_sync" in time_sync_button.unique_id or "_sync" in time_sync_button.unique_id
 
-        assert "_time_sync" in button.unique_id or "_sync" in button.unique_id
-
-    def test_has_entity_name(self):
+    def test_has_entity_name(self, time_sync_button):
         """Test has_entity_name is True."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
-
-        assert button._attr_has_entity_name is True
+        assert time_sync_button._attr_has_entity_name is True
 
 
 # ---------------------------------------------------------------------------
@@ -60,19 +55,13 @@ class TestVevorTimeSyncButton:
 class TestVevorResetFuelLevelButton:
     """Tests for Vevor reset fuel level button entity."""
 
-    def test_unique_id(self):
+    def test_unique_id(self, reset_fuel_button):
         """Test unique_id format."""
-        coordinator = create_mock_coordinator()
-        button = VevorResetFuelLevelButton(coordinator)
-
-        assert "_reset" in button.unique_id or "_fuel" in button.unique_id
+        assert "_reset" in reset_fuel_button.unique_id or "_fuel" in reset_fuel_button.unique_id
 
-    def test_has_entity_name(self):
+    def test_has_entity_name(self, reset_fuel_button):
         """Test has_entity_name is True."""
-        coordinator = create_mock_coordinator()
-        button = VevorResetFuelLevelButton(coordinator)
-
-        assert button._attr_has_entity_name is True
+        assert reset_fuel_button._attr_has_entity_name is True
 
 
 # ---------------------------------------------------------------------------
@@ -82,25 +71,21 @@ class TestVevorResetFuelLevelButton:
 class TestButtonAvailability:
     """Tests for button availability."""
 
-    def test_available_when_connected(self):
+    def test_available_when_connected(self, coordinator):
         """Test button is available when connected."""
-        coordinator = create_mock_coordinator()
         coordinator.last_update_success = True
         button = VevorTimeSyncButton(coordinator)
 
         assert button.available is True
 
-    def test_available_property_exists(self):
+    def test_available_property_exists(self, time_sync_button):
         """Test available property is accessible."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
-
         # Just verify property is accessible
-        _ = button.available
+        _ = time_sync_button.available
 
-    def test_not_available_when_not_connected(self):
+    def test_not_available_when_not_connected(self, coordinator):
         """Test button is not available when not connected."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["connected"] = False
         button = VevorTimeSyncButton(coordinator)
 
@@ -114,10 +99,8 @@ class TestButtonAvailability:
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
-    @pytest.mark.asyncio
-    async def test_async_setup_entry_creates_buttons(self):
+    async def test_async_setup_entry_creates_buttons(self, coordinator):
         """Test async_setup_entry creates button entities."""
-        coordinator = create_mock_coordinator()
 
         # Create mock entry with runtime_data
         entry = MagicMock()
@@ -144,25 +127,17 @@ class TestAsyncSetupEntry:
 class TestButtonAsyncPress:
     """Tests for async_press methods."""
 
-    @pytest.mark.asyncio
-    async def test_time_sync_async_press(self):
+    async def test_time_sync_async_press(self, coordinator, time_sync_button):
         """Test VevorTimeSyncButton async_press calls coordinator."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
-
-        await button.async_press()
+        await time_sync_button.async_press()
 
-        coordinator.async_sync_time.assert_called_once()
+        assert len(coordinator.async_sync_time.calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_reset_fuel_level_async_press(self):
+    async def test_reset_fuel_level_async_press(self, coordinator, reset_fuel_button):
         """Test VevorResetFuelLevelButton async_press calls coordinator."""
-        coordinator = create_mock_coordinator()
-        button = VevorResetFuelLevelButton(coordinator)
+        await reset_fuel_button.async_press()
 
-        await button.async_press()
-
-        coordinator.async_reset_fuel_level.assert_called_once()
+        assert len(coordinator.async_reset_fuel_level.calls) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -172,61 +147,33 @@ class TestButtonAsyncPress:
 class TestButtonAttributes:
     """Tests for button entity attributes."""
 
-    def test_time_sync_icon(self):
-        """Test time sync button icon."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
-
-        assert button._attr_icon == "mdi:clock-sync"
-
-    def test_reset_fuel_icon(self):
-        """Test reset fuel button icon."""
-        coordinator = create_mock_coordinator()
-        button = VevorResetFuelLevelButton(coordinator)
-
-        assert button._attr_icon == "mdi:gas-station"
-
-    def test_time_sync_name(self):
-        """Test time sync button name."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
-
-        assert button._attr_name == "Sync Time"
-
-    def test_reset_fuel_name(self):
-        """Test reset fuel button name."""
-        coordinator = create_mock_coordinator()
-        button = VevorResetFuelLevelButton(coordinator)
-
-        assert button._attr_name == "Reset Estimated Fuel Remaining"
-
-    def test_time_sync_entity_category(self):
-        """Test time sync button is in CONFIG category."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
+    @pytest.mark.parametrize(
+        ("button_cls", "attr", "expected"),
+        [
+            (VevorTimeSyncButton, "_attr_icon", "mdi:clock-sync"),
+            (VevorResetFuelLevelButton, "_attr_icon", "mdi:gas-station"),
+            (VevorTimeSyncButton, "_attr_name", "Sync Time"),
+            (VevorResetFuelLevelButton, "_attr_name", "Reset Estimated Fuel Remaining"),
+        ],
+    )
+    def test_attribute_value(self, coordinator, button_cls, attr, expected):
+        """Test icon and name of each button."""
+        button = button_cls(coordinator)
+
+        assert getattr(button, attr) == expected
+
+    @pytest.mark.parametrize("button_cls", [VevorTimeSyncButton, VevorResetFuelLevelButton])
+    def test_entity_category(self, coordinator, button_cls):
+        """Test button is in CONFIG category."""
+        button = button_cls(coordinator)
 
         # EntityCategory.CONFIG is mocked
         assert button._attr_entity_category is not None
 
-    def test_reset_fuel_entity_category(self):
-        """Test reset fuel button is in CONFIG category."""
-        coordinator = create_mock_coordinator()
-        button = VevorResetFuelLevelButton(coordinator)
-
-        assert button._attr_entity_category is not None
-
-    def test_time_sync_device_info(self):
-        """Test time sync button device_info."""
-        coordinator = create_mock_coordinator()
-        button = VevorTimeSyncButton(coordinator)
-
-        assert button._attr_device_info is not None
-        assert "identifiers" in button._attr_device_info
-
-    def test_reset_fuel_device_info(self):
-        """Test reset fuel button device_info."""
-        coordinator = create_mock_coordinator()
-        button = VevorResetFuelLevelButton(coordinator)
+    @pytest.mark.parametrize("button_cls", [VevorTimeSyncButton, VevorResetFuelLevelButton])
+    def test_device_info(self, coordinator, button_cls):
+        """Test button device_info."""
+        button = button_cls(coordinator)
 
         assert button._attr_device_info is not None
         assert "identifiers" in button._attr_device_info
@@ -1,54 +1,70 @@
 """Tests for Diesel Heater climate platform."""
 from __future__ import annotations
 
-import pytest
-from unittest.mock import MagicMock, AsyncMock
+from dataclasses import dataclass
+from types import MappingProxyType
 
-# Import stubs first
-from . import conftest  # noqa: F401
+import pytest
+from unittest.mock import MagicMock
 
 from custom_components.diesel_heater.climate import VevorHeaterClimate, async_setup_entry
 
 
-def create_mock_coordinator() -> MagicMock:
-    """Create a mock coordinator for climate testing."""
-    coordinator = MagicMock()
-    coordinator._address = "AA:BB:CC:DD:EE:FF"
-    coordinator.address = "AA:BB:CC:DD:EE:FF"
-    coordinator._heater_id = "EE:FF"
-    coordinator.last_update_success = True
-    coordinator.send_command = AsyncMock(return_value=True)
-    coordinator.async_set_temperature = AsyncMock()
-    coordinator.async_turn_on = AsyncMock()
-    coordinator.async_turn_off = AsyncMock()
-    coordinator.data = {
-        "connected": True,
-        "running_state": 1,
-        "running_step": 3,
-        "running_mode": 2,  # Temperature mode
-        "set_level": 5,
-        "set_temp": 22,
-        "cab_temperature": 20.5,
-        "case_temperature": 50,
-        "supply_voltage": 12.5,
-        "error_code": 0,
-    }
-    return coordinator
-
-
-def create_mock_config_entry() -> MagicMock:
+# Initial coordinator.data for the shared ``coordinator`` fixture (conftest).
+# Read-only; tests that change it assign a dict copy first.
+MOCK_COORDINATOR_DATA = MappingProxyType({
+    "connected": True,
+    "running_state": 1,
+    "running_step": 3,
+    "running_mode": 2,  # Temperature mode
+    "set_level": 5,
+    "set_temp": 22,
+    "cab_temperature": 20.5,
+    "case_temperature": 50,
+    "supply_voltage": 12.5,
+    "error_code": 0,
+})
+
+
+@dataclass(slots=True)
+class _StubEntry:
+    """Plain config entry double: only the attributes the climate code reads."""
+
+    data: dict
+    options: dict
+    entry_id: str
+    runtime_data: object = None
+
+
+def create_mock_config_entry() -> _StubEntry:
     """Create a mock config entry for climate testing."""
-    entry = MagicMock()
-    entry.data = {
-        "address": "AA:BB:CC:DD:EE:FF",
-        "preset_away_temp": 8,
-        "preset_comfort_temp": 21,
-    }
-    entry.options = {
-        "preset_modes": {},
-    }
-    entry.entry_id = "test_entry"
-    return entry
+    return _StubEntry(
+        data={
+            "address": "AA:BB:CC:DD:EE:FF",
+            "preset_away_temp": 8,
+            "preset_comfort_temp": 21,
+        },
+        options={
+            "preset_modes": {},
+        },
+        entry_id="test_entry",
+    )
+
+
+@pytest.fixture
+def config_entry() -> _StubEntry:
+    """Config entry for the climate entity under test."""
+    return create_mock_config_entry()
+
+
+@pytest.fixture
+def climate(coordinator, config_entry) -> VevorHeaterClimate:
+    """Climate entity built from the shared coordinator and config entry.
+
+    Tests that change coordinator data or the entry before construction
+    build their own entity instead.
+    """
+    return VevorHeaterClimate(coordinator, config_entry)
 
 
 # ---------------------------------------------------------------------------
@@ -58,46 +74,34 @@ def create_mock_config_entry() -> MagicMock:
 class TestVevorHeaterClimate:
     """Tests for Vevor climate entity."""
 
-    def test_current_temperature(self):
+    def test_current_temperature(self, climate):
         """Test current_temperature returns cabin temperature."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate.current_temperature == 20.5
 
-    def test_current_temperature_none(self):
+    def test_current_temperature_none(self, coordinator):
         """Test current_temperature when None."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["cab_temperature"] = None
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate.current_temperature is None
 
-    def test_target_temperature(self):
+    def test_target_temperature(self, climate):
         """Test target_temperature returns set_temp."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate.target_temperature == 22
 
-    def test_unique_id(self):
+    def test_unique_id(self, climate):
         """Test unique_id format."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert "_climate" in climate.unique_id
 
 
 class TestClimateHvacMode:
     """Tests for HVAC mode functionality."""
 
-    def test_hvac_mode_heat_when_running(self):
+    def test_hvac_mode_heat_when_running(self, coordinator):
         """Test hvac_mode is HEAT when heater is running."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_state"] = 1  # Running
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -105,9 +109,9 @@ class TestClimateHvacMode:
         # The actual value may be a MagicMock, just check it's not None/OFF
         assert climate.hvac_mode is not None
 
-    def test_hvac_mode_off_when_not_running(self):
+    def test_hvac_mode_off_when_not_running(self, coordinator):
         """Test hvac_mode is OFF when heater is off."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_state"] = 0  # Off
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -119,21 +123,16 @@ class TestClimateHvacMode:
 class TestClimateAvailability:
     """Tests for climate availability."""
 
-    def test_available_when_connected(self):
+    def test_available_when_connected(self, coordinator):
         """Test climate is available when connected."""
-        coordinator = create_mock_coordinator()
         coordinator.last_update_success = True
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate.available is True
 
-    def test_available_property_exists(self):
+    def test_available_property_exists(self, climate):
         """Test available property is accessible."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Just verify we can access the property
         _ = climate.available
 
@@ -145,9 +144,9 @@ class TestClimateAvailability:
 class TestClimateHvacAction:
     """Tests for HVAC action functionality."""
 
-    def test_hvac_action_when_standby_and_off(self):
+    def test_hvac_action_when_standby_and_off(self, coordinator):
         """Test hvac_action when standby and running_state OFF."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 0  # RUNNING_STEP_STANDBY
         coordinator.data["running_state"] = 0  # OFF
         config_entry = create_mock_config_entry()
@@ -156,9 +155,9 @@ class TestClimateHvacAction:
         # Should return HVACAction.OFF (mock object)
         assert climate.hvac_action is not None
 
-    def test_hvac_action_when_standby_and_on(self):
+    def test_hvac_action_when_standby_and_on(self, coordinator):
         """Test hvac_action when standby but running_state ON."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 0  # RUNNING_STEP_STANDBY
         coordinator.data["running_state"] = 1  # ON (Auto Start/Stop waiting)
         config_entry = create_mock_config_entry()
@@ -167,9 +166,9 @@ class TestClimateHvacAction:
         # Should return HVACAction.IDLE
         assert climate.hvac_action is not None
 
-    def test_hvac_action_when_running(self):
+    def test_hvac_action_when_running(self, coordinator):
         """Test hvac_action when heater is running."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 3  # RUNNING_STEP_RUNNING
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -177,9 +176,9 @@ class TestClimateHvacAction:
         # Should return HVACAction.HEATING
         assert climate.hvac_action is not None
 
-    def test_hvac_action_when_ignition(self):
+    def test_hvac_action_when_ignition(self, coordinator):
         """Test hvac_action when in ignition phase."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 2  # RUNNING_STEP_IGNITION
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -187,18 +186,18 @@ class TestClimateHvacAction:
         # Should return HVACAction.HEATING
         assert climate.hvac_action is not None
 
-    def test_hvac_action_when_self_test(self):
+    def test_hvac_action_when_self_test(self, coordinator):
         """Test hvac_action when in self-test phase."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 1  # RUNNING_STEP_SELF_TEST
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate.hvac_action is not None
 
-    def test_hvac_action_when_cooldown(self):
+    def test_hvac_action_when_cooldown(self, coordinator):
         """Test hvac_action when in cooldown phase."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 4  # RUNNING_STEP_COOLDOWN
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -206,27 +205,27 @@ class TestClimateHvacAction:
         # Should return HVACAction.FAN
         assert climate.hvac_action is not None
 
-    def test_hvac_action_when_ventilation(self):
+    def test_hvac_action_when_ventilation(self, coordinator):
         """Test hvac_action when in ventilation mode."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 6  # RUNNING_STEP_VENTILATION
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate.hvac_action is not None
 
-    def test_hvac_action_none_when_running_step_none(self):
+    def test_hvac_action_none_when_running_step_none(self, coordinator):
         """Test hvac_action is None when running_step is None."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = None
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate.hvac_action is None
 
-    def test_hvac_action_for_unknown_step(self):
+    def test_hvac_action_for_unknown_step(self, coordinator):
         """Test hvac_action for unknown running_step."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["running_step"] = 99  # Unknown step
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -242,18 +241,14 @@ class TestClimateHvacAction:
 class TestClimatePresetMode:
     """Tests for preset mode functionality."""
 
-    def test_preset_mode_property_accessible(self):
+    def test_preset_mode_property_accessible(self, climate):
         """Test preset_mode property is accessible."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Just verify we can access the property
         _ = climate.preset_mode
 
-    def test_preset_mode_when_temp_matches_away(self):
+    def test_preset_mode_when_temp_matches_away(self, coordinator):
         """Test preset detection when temp matches away."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["set_temp"] = 8  # Matches default away temp
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 8
@@ -262,9 +257,9 @@ class TestClimatePresetMode:
         # Should detect PRESET_AWAY
         assert climate.preset_mode is not None
 
-    def test_preset_mode_when_temp_matches_comfort(self):
+    def test_preset_mode_when_temp_matches_comfort(self, coordinator):
         """Test preset detection when temp matches comfort."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["set_temp"] = 21  # Matches default comfort temp
         config_entry = create_mock_config_entry()
         config_entry.data["preset_comfort_temp"] = 21
@@ -272,9 +267,9 @@ class TestClimatePresetMode:
 
         assert climate.preset_mode is not None
 
-    def test_preset_mode_when_user_cleared(self):
+    def test_preset_mode_when_user_cleared(self, coordinator):
         """Test preset stays NONE when user explicitly cleared it."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["set_temp"] = 8  # Matches away temp
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -292,55 +287,35 @@ class TestClimateAsyncMethods:
     """Tests for async climate methods."""
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_method_exists(self):
+    async def test_async_set_temperature_method_exists(self, climate):
         """Test async_set_temperature method exists and is callable."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Verify method exists
         assert hasattr(climate, 'async_set_temperature')
         assert callable(climate.async_set_temperature)
 
     @pytest.mark.asyncio
-    async def test_async_turn_on(self):
+    async def test_async_turn_on(self, coordinator, climate):
         """Test async_turn_on turns on heater."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         await climate.async_turn_on()
 
-        coordinator.async_turn_on.assert_called_once()
+        assert len(coordinator.async_turn_on.calls) == 1
 
     @pytest.mark.asyncio
-    async def test_async_turn_off(self):
+    async def test_async_turn_off(self, coordinator, climate):
         """Test async_turn_off turns off heater."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         await climate.async_turn_off()
 
-        coordinator.async_turn_off.assert_called_once()
+        assert len(coordinator.async_turn_off.calls) == 1
 
     @pytest.mark.asyncio
-    async def test_async_set_hvac_mode_method_exists(self):
+    async def test_async_set_hvac_mode_method_exists(self, climate):
         """Test async_set_hvac_mode method exists."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert hasattr(climate, 'async_set_hvac_mode')
         assert callable(climate.async_set_hvac_mode)
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_method_exists(self):
+    async def test_async_set_preset_mode_method_exists(self, climate):
         """Test async_set_preset_mode method exists."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert hasattr(climate, 'async_set_preset_mode')
         assert callable(climate.async_set_preset_mode)
 
@@ -352,60 +327,32 @@ class TestClimateAsyncMethods:
 class TestClimateAttributes:
     """Tests for climate entity attributes."""
 
-    def test_min_temp(self):
+    def test_min_temp(self, climate):
         """Test min_temp attribute."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._attr_min_temp == 8
 
-    def test_max_temp(self):
+    def test_max_temp(self, climate):
         """Test max_temp attribute."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._attr_max_temp == 36
 
-    def test_target_temperature_step(self):
+    def test_target_temperature_step(self, climate):
         """Test target_temperature_step attribute."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._attr_target_temperature_step == 1
 
-    def test_hvac_modes_not_empty(self):
+    def test_hvac_modes_not_empty(self, climate):
         """Test hvac_modes attribute is not empty."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert len(climate._attr_hvac_modes) == 2
 
-    def test_preset_modes_not_empty(self):
+    def test_preset_modes_not_empty(self, climate):
         """Test preset_modes attribute is not empty."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert len(climate._attr_preset_modes) == 3
 
-    def test_has_entity_name(self):
+    def test_has_entity_name(self, climate):
         """Test has_entity_name is True."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._attr_has_entity_name is True
 
-    def test_device_info(self):
+    def test_device_info(self, climate):
         """Test device_info is set correctly."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._attr_device_info is not None
         assert "identifiers" in climate._attr_device_info
         assert "name" in climate._attr_device_info
@@ -418,9 +365,8 @@ class TestClimateAttributes:
 class TestClimateHelperMethods:
     """Tests for climate helper methods."""
 
-    def test_get_away_temp_default(self):
+    def test_get_away_temp_default(self, coordinator):
         """Test _get_away_temp returns default value."""
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}  # No preset temps
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -428,18 +374,16 @@ class TestClimateHelperMethods:
         # Should return default (8)
         assert climate._get_away_temp() == 8
 
-    def test_get_away_temp_configured(self):
+    def test_get_away_temp_configured(self, coordinator):
         """Test _get_away_temp returns configured value."""
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 10
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate._get_away_temp() == 10
 
-    def test_get_comfort_temp_default(self):
+    def test_get_comfort_temp_default(self, coordinator):
         """Test _get_comfort_temp returns default value."""
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}  # No preset temps
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -447,9 +391,8 @@ class TestClimateHelperMethods:
         # Should return default (21)
         assert climate._get_comfort_temp() == 21
 
-    def test_get_comfort_temp_configured(self):
+    def test_get_comfort_temp_configured(self, coordinator):
         """Test _get_comfort_temp returns configured value."""
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_comfort_temp"] = 23
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -465,9 +408,8 @@ class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
     @pytest.mark.asyncio
-    async def test_async_setup_entry_creates_climate(self):
+    async def test_async_setup_entry_creates_climate(self, coordinator):
         """Test async_setup_entry creates climate entity."""
-        coordinator = create_mock_coordinator()
 
         # Create mock entry with runtime_data
         entry = create_mock_config_entry()
@@ -496,22 +438,14 @@ class TestClimateAsyncSetTemperature:
     """Tests for async_set_temperature method."""
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_method_callable(self):
+    async def test_async_set_temperature_method_callable(self, climate):
         """Test async_set_temperature is callable."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Verify method is callable
         assert callable(climate.async_set_temperature)
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_no_kwargs_returns_early(self):
+    async def test_async_set_temperature_no_kwargs_returns_early(self, coordinator, climate):
         """Test async_set_temperature with no kwargs does nothing."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Should return early without calling coordinator
         await climate.async_set_temperature()
 
@@ -522,21 +456,13 @@ class TestClimateAsyncSetPresetMode:
     """Tests for async_set_preset_mode method."""
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_method_callable(self):
+    async def test_async_set_preset_mode_method_callable(self, climate):
         """Test async_set_preset_mode is callable."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert callable(climate.async_set_preset_mode)
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_sets_current_preset(self):
+    async def test_async_set_preset_mode_sets_current_preset(self, climate):
         """Test async_set_preset_mode sets _current_preset."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Call with a string value
         await climate.async_set_preset_mode("test_preset")
 
@@ -548,12 +474,8 @@ class TestClimateAsyncSetHvacMode:
     """Tests for async_set_hvac_mode method."""
 
     @pytest.mark.asyncio
-    async def test_async_set_hvac_mode_method_callable(self):
+    async def test_async_set_hvac_mode_method_callable(self, climate):
         """Test async_set_hvac_mode is callable."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert callable(climate.async_set_hvac_mode)
 
 
@@ -564,9 +486,9 @@ class TestClimateAsyncSetHvacMode:
 class TestClimatePresetModeEdgeCases:
     """Tests for preset mode edge cases."""
 
-    def test_preset_mode_when_set_temp_is_none(self):
+    def test_preset_mode_when_set_temp_is_none(self, coordinator):
         """Test preset_mode when set_temp is None."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["set_temp"] = None
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -575,9 +497,9 @@ class TestClimatePresetModeEdgeCases:
         result = climate.preset_mode
         assert result is not None
 
-    def test_preset_mode_returns_current_preset_when_no_match(self):
+    def test_preset_mode_returns_current_preset_when_no_match(self, coordinator):
         """Test preset_mode returns _current_preset when no temp match."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["set_temp"] = 15  # Doesn't match any preset
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 8
@@ -596,20 +518,13 @@ class TestClimatePresetModeEdgeCases:
 class TestClimateEntityLifecycle:
     """Tests for climate entity lifecycle."""
 
-    def test_handle_coordinator_update_method_exists(self):
+    def test_handle_coordinator_update_method_exists(self, climate):
         """Test _handle_coordinator_update method exists."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Verify method exists
         assert hasattr(climate, '_handle_coordinator_update')
 
-    def test_handle_coordinator_update_is_callable(self):
+    def test_handle_coordinator_update_is_callable(self, climate):
         """Test _handle_coordinator_update calls async_write_ha_state."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
         climate.async_write_ha_state = MagicMock()
 
         climate._handle_coordinator_update()
@@ -629,12 +544,11 @@ class TestClimateAsyncSetPresetModeFull:
     """
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_away(self):
+    async def test_async_set_preset_mode_away(self, coordinator):
         """Test async_set_preset_mode with PRESET_AWAY."""
         # Import from the same place climate.py imports
         from custom_components.diesel_heater.climate import PRESET_AWAY
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 10
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -647,11 +561,10 @@ class TestClimateAsyncSetPresetModeFull:
         assert climate._user_cleared_preset is False
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_comfort(self):
+    async def test_async_set_preset_mode_comfort(self, coordinator):
         """Test async_set_preset_mode with PRESET_COMFORT."""
         from custom_components.diesel_heater.climate import PRESET_COMFORT
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_comfort_temp"] = 23
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -664,11 +577,10 @@ class TestClimateAsyncSetPresetModeFull:
         assert climate._user_cleared_preset is False
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_none(self):
+    async def test_async_set_preset_mode_none(self, coordinator):
         """Test async_set_preset_mode with PRESET_NONE."""
         from custom_components.diesel_heater.climate import PRESET_NONE
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
         climate._current_preset = "comfort"  # Set previous preset
@@ -685,11 +597,10 @@ class TestClimateAsyncSetPresetModeFull:
         climate.async_write_ha_state.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_clears_none_flag_on_away(self):
+    async def test_async_set_preset_mode_clears_none_flag_on_away(self, coordinator):
         """Test setting preset clears _user_cleared_preset flag."""
         from custom_components.diesel_heater.climate import PRESET_AWAY
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
         climate._user_cleared_preset = True  # Was previously cleared
@@ -699,11 +610,10 @@ class TestClimateAsyncSetPresetModeFull:
         assert climate._user_cleared_preset is False
 
     @pytest.mark.asyncio
-    async def test_async_set_preset_mode_clears_none_flag_on_comfort(self):
+    async def test_async_set_preset_mode_clears_none_flag_on_comfort(self, coordinator):
         """Test setting comfort preset clears _user_cleared_preset flag."""
         from custom_components.diesel_heater.climate import PRESET_COMFORT
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
         climate._user_cleared_preset = True  # Was previously cleared
@@ -728,12 +638,8 @@ class TestClimateAsyncSetTemperatureFull:
     """
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_method_signature(self):
+    async def test_async_set_temperature_method_signature(self, coordinator, climate):
         """Test async_set_temperature accepts kwargs."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Should accept arbitrary kwargs without error
         await climate.async_set_temperature(some_param=25)
 
@@ -741,68 +647,47 @@ class TestClimateAsyncSetTemperatureFull:
         coordinator.async_set_temperature.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_returns_early_no_temp(self):
+    async def test_async_set_temperature_returns_early_no_temp(self, coordinator, climate):
         """Test async_set_temperature returns early with no temperature."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         await climate.async_set_temperature()
 
         coordinator.async_set_temperature.assert_not_called()
 
-    def test_get_away_temp_in_async_set_temperature_path(self):
+    def test_get_away_temp_in_async_set_temperature_path(self, coordinator):
         """Test _get_away_temp is correctly configured for temperature matching."""
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 10
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate._get_away_temp() == 10
 
-    def test_get_comfort_temp_in_async_set_temperature_path(self):
+    def test_get_comfort_temp_in_async_set_temperature_path(self, coordinator):
         """Test _get_comfort_temp is correctly configured for temperature matching."""
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_comfort_temp"] = 23
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate._get_comfort_temp() == 23
 
-    def test_user_cleared_preset_flag_initialized_false(self):
+    def test_user_cleared_preset_flag_initialized_false(self, climate):
         """Test _user_cleared_preset is initialized to False."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._user_cleared_preset is False
 
-    def test_current_preset_initialized_none(self):
+    def test_current_preset_initialized_none(self, climate):
         """Test _current_preset is initialized to None."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._current_preset is None
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_with_real_key(self):
+    async def test_async_set_temperature_with_real_key(self, coordinator, climate):
         """Test async_set_temperature with real temperature key."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Use actual string key "temperature" (what ATTR_TEMPERATURE should be)
         await climate.async_set_temperature(temperature=25)
 
         coordinator.async_set_temperature.assert_called_once_with(25)
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_clears_preset_flag(self):
+    async def test_async_set_temperature_clears_preset_flag(self, climate):
         """Test async_set_temperature clears _user_cleared_preset flag."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
         climate._user_cleared_preset = True
 
         await climate.async_set_temperature(temperature=20)
@@ -810,11 +695,10 @@ class TestClimateAsyncSetTemperatureFull:
         assert climate._user_cleared_preset is False
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_auto_selects_away_preset(self):
+    async def test_async_set_temperature_auto_selects_away_preset(self, coordinator):
         """Test async_set_temperature auto-selects PRESET_AWAY if temp matches."""
         from custom_components.diesel_heater.climate import PRESET_AWAY
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 15
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -825,11 +709,10 @@ class TestClimateAsyncSetTemperatureFull:
         assert climate._current_preset == PRESET_AWAY
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_auto_selects_comfort_preset(self):
+    async def test_async_set_temperature_auto_selects_comfort_preset(self, coordinator):
         """Test async_set_temperature auto-selects PRESET_COMFORT if temp matches."""
         from custom_components.diesel_heater.climate import PRESET_COMFORT
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_comfort_temp"] = 22
         climate = VevorHeaterClimate(coordinator, config_entry)
@@ -840,9 +723,8 @@ class TestClimateAsyncSetTemperatureFull:
         assert climate._current_preset == PRESET_COMFORT
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_sets_preset_none_for_other_temps(self):
+    async def test_async_set_temperature_sets_preset_none_for_other_temps(self, coordinator):
         """Test async_set_temperature sets preset to None for non-matching temps."""
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 10
         config_entry.data["preset_comfort_temp"] = 23
@@ -856,12 +738,8 @@ class TestClimateAsyncSetTemperatureFull:
         assert climate._current_preset is None
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature_converts_to_int(self):
+    async def test_async_set_temperature_converts_to_int(self, coordinator, climate):
         """Test async_set_temperature converts float to int."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         await climate.async_set_temperature(temperature=22.7)
 
         # Should be converted to int (22)
@@ -880,30 +758,28 @@ class TestClimateAsyncSetHvacModeFull:
     """
 
     @pytest.mark.asyncio
-    async def test_async_set_hvac_mode_heat(self):
+    async def test_async_set_hvac_mode_heat(self, coordinator):
         """Test async_set_hvac_mode with HEAT."""
         from custom_components.diesel_heater.climate import HVACMode
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         await climate.async_set_hvac_mode(HVACMode.HEAT)
 
-        coordinator.async_turn_on.assert_called_once()
+        assert len(coordinator.async_turn_on.calls) == 1
 
     @pytest.mark.asyncio
-    async def test_async_set_hvac_mode_off(self):
+    async def test_async_set_hvac_mode_off(self, coordinator):
         """Test async_set_hvac_mode with OFF."""
         from custom_components.diesel_heater.climate import HVACMode
 
-        coordinator = create_mock_coordinator()
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         await climate.async_set_hvac_mode(HVACMode.OFF)
 
-        coordinator.async_turn_off.assert_called_once()
+        assert len(coordinator.async_turn_off.calls) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -913,21 +789,13 @@ class TestClimateAsyncSetHvacModeFull:
 class TestClimateTemperatureUnit:
     """Tests for climate temperature unit."""
 
-    def test_temperature_unit_is_celsius(self):
+    def test_temperature_unit_is_celsius(self, climate):
         """Test temperature unit is Celsius."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # The unit is set via _attr_temperature_unit
         assert climate._attr_temperature_unit is not None
 
-    def test_supported_features(self):
+    def test_supported_features(self, climate):
         """Test supported features include required features."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Verify supported_features is set
         assert climate._attr_supported_features is not None
 
@@ -939,20 +807,21 @@ class TestClimateTemperatureUnit:
 class TestClimateEdgeCases:
     """Additional edge case tests for climate entity."""
 
-    def test_target_temperature_none(self):
+    def test_target_temperature_none(self, coordinator):
         """Test target_temperature when set_temp is None."""
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
         coordinator.data["set_temp"] = None
         config_entry = create_mock_config_entry()
         climate = VevorHeaterClimate(coordinator, config_entry)
 
         assert climate.target_temperature is None
 
-    def test_preset_mode_away_detection(self):
+    def test_preset_mode_away_detection(self, coordinator):
         """Test preset mode correctly detects away."""
         from custom_components.diesel_heater.climate import PRESET_AWAY
 
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
+
         coordinator.data["set_temp"] = 8
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 8
@@ -962,11 +831,12 @@ class TestClimateEdgeCases:
         # The preset_mode should be PRESET_AWAY
         assert climate.preset_mode == PRESET_AWAY
 
-    def test_preset_mode_comfort_detection(self):
+    def test_preset_mode_comfort_detection(self, coordinator):
         """Test preset mode correctly detects comfort."""
         from custom_components.diesel_heater.climate import PRESET_COMFORT
 
-        coordinator = create_mock_coordinator()
+        coordinator.data = dict(MOCK_COORDINATOR_DATA)
+
         coordinator.data["set_temp"] = 21
         config_entry = create_mock_config_entry()
         config_entry.data["preset_away_temp"] = 8
@@ -975,19 +845,11 @@ class TestClimateEdgeCases:
 
         assert climate.preset_mode == PRESET_COMFORT
 
-    def test_available_uses_coordinator(self):
+    def test_available_uses_coordinator(self, climate):
         """Test available property is accessible."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         # Just verify property is accessible (behavior from CoordinatorEntity)
         _ = climate.available
 
-    def test_name_is_none(self):
+    def test_name_is_none(self, climate):
         """Test name attribute is None (uses device name)."""
-        coordinator = create_mock_coordinator()
-        config_entry = create_mock_config_entry()
-        climate = VevorHeaterClimate(coordinator, config_entry)
-
         assert climate._attr_name is None
@@ -5,15 +5,24 @@ Focuses on data processing, fuel/runtime tracking, and protocol handling.
 """
 from __future__ import annotations
 
+import copy
+import sys
 from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock, patch
-import asyncio
 import pytest
 
 # Import stubs first
 from . import conftest  # noqa: F401
 
+from diesel_heater_ble import (
+    ProtocolAA55, ProtocolAA66, ProtocolAA55Encrypted,
+    ProtocolAA66Encrypted, ProtocolABBA, ProtocolCBFF,
+    _encrypt_data,
+)
+
 # Now we can import the coordinator
+import custom_components.diesel_heater.coordinator as coordinator_module
 from custom_components.diesel_heater.coordinator import VevorHeaterCoordinator
 from custom_components.diesel_heater.const import (
     FUEL_CONSUMPTION_TABLE,
@@ -37,37 +46,71 @@ from custom_components.diesel_heater.const import (
 # Test fixtures
 # ---------------------------------------------------------------------------
 
-def create_mock_coordinator() -> VevorHeaterCoordinator:
-    """Create a mock coordinator for testing without calling __init__."""
-    from diesel_heater_ble import (
-        ProtocolAA55, ProtocolAA66, ProtocolAA55Encrypted,
-        ProtocolAA66Encrypted, ProtocolABBA, ProtocolCBFF,
+# Frozen "current" time. The tests only care about dates relative to now, so
+# the coordinator and these tests share one fixed clock (no day rollover
+# mid-run, and no clock read per call).
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns ``_NOW``."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW if tz is None else _NOW.replace(tzinfo=tz)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _frozen_now():
+    """Patch ``datetime`` in the coordinator and in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(coordinator_module, "datetime", _FrozenDatetime)
+        mp.setattr(sys.modules[__name__], "datetime", _FrozenDatetime)
+        yield
+
+
+# Initial coordinator.data (read-only); every coordinator gets its own copy
+_TEMPLATE_DATA = MappingProxyType({
+    "connected": False,
+    "running_state": 0,
+    "running_step": 0,
+    "running_mode": 0,
+    "set_level": 1,
+    "set_temp": 22,
+    "cab_temperature": 20.0,
+    "case_temperature": 50,
+    "supply_voltage": 12.5,
+    "error_code": 0,
+    "altitude": 0,
+    "hourly_fuel_consumption": 0.0,
+    "daily_fuel_consumed": 0.0,
+    "total_fuel_consumed": 0.0,
+    "fuel_remaining": None,
+    "fuel_consumed_since_reset": 0.0,
+    "tank_capacity": 5,
+    "daily_runtime_hours": 0.0,
+    "total_runtime_hours": 0.0,
+    "daily_fuel_history": {},
+    "daily_runtime_history": {},
+})
+
+
+def _set_mutable_state(coordinator: VevorHeaterCoordinator) -> None:
+    """Give the coordinator its own mocks, protocols, data and history.
+
+    Everything a test can mutate in place lives here, so copies of a
+    template coordinator don't share state (see the ``coordinator`` fixture).
+    """
+    # Plain namespaces: tests only read these or replace single callables
+    coordinator.hass = SimpleNamespace(
+        loop=None, states=SimpleNamespace(get=lambda entity_id: None)
     )
-
-    hass = MagicMock()
-    hass.loop = asyncio.new_event_loop()
-
-    entry = MagicMock()
-    entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
-    entry.options = {}
-    entry.entry_id = "test_entry"
-
-    ble_device = MagicMock()
-    ble_device.address = "AA:BB:CC:DD:EE:FF"
-
-    # Create coordinator without calling __init__ using object.__new__
-    coordinator = object.__new__(VevorHeaterCoordinator)
-
-    # Set up minimum required attributes
-    coordinator.hass = hass
-    coordinator.config_entry = entry
-    coordinator._address = "AA:BB:CC:DD:EE:FF"
-    coordinator._heater_id = "EE:FF"
+    coordinator.config_entry = SimpleNamespace(
+        data={"address": "AA:BB:CC:DD:EE:FF"}, options={}, entry_id="test_entry"
+    )
+    coordinator._ble_device = SimpleNamespace(address="AA:BB:CC:DD:EE:FF")
     coordinator._logger = MagicMock()
     coordinator._store = MagicMock()
-    coordinator._protocol = None
-    coordinator._protocol_mode = 0
-    coordinator._passkey = 1234
 
     # Protocol handlers dict (mode -> protocol instance)
     coordinator._protocols = {
@@ -79,147 +122,133 @@ def create_mock_coordinator() -> VevorHeaterCoordinator:
         6: ProtocolCBFF(),
     }
 
-    # Data dict
-    coordinator.data = {
-        "connected": False,
-        "running_state": 0,
-        "running_step": 0,
-        "running_mode": 0,
-        "set_level": 1,
-        "set_temp": 22,
-        "cab_temperature": 20.0,
-        "case_temperature": 50,
-        "supply_voltage": 12.5,
-        "error_code": 0,
-        "altitude": 0,
-        "hourly_fuel_consumption": 0.0,
-        "daily_fuel_consumed": 0.0,
-        "total_fuel_consumed": 0.0,
-        "fuel_remaining": None,
-        "fuel_consumed_since_reset": 0.0,
-        "tank_capacity": 5,
-        "daily_runtime_hours": 0.0,
-        "total_runtime_hours": 0.0,
-        "daily_fuel_history": {},
-        "daily_runtime_history": {},
-    }
-
-    # Fuel tracking state (correct attribute names)
-    coordinator._daily_fuel_consumed = 0.0
-    coordinator._total_fuel_consumed = 0.0
+    # Data dict (the nested history dicts are copied too)
+    coordinator.data = dict(
+        _TEMPLATE_DATA, daily_fuel_history={}, daily_runtime_history={}
+    )
+    coordinator._last_valid_data = {}
     coordinator._daily_fuel_history = {}
-    coordinator._fuel_consumed_since_reset = 0.0
-    coordinator._last_reset_date = datetime.now().strftime("%Y-%m-%d")
-
-    # Runtime tracking state (correct attribute names)
-    coordinator._daily_runtime_seconds = 0.0
-    coordinator._total_runtime_seconds = 0.0
     coordinator._daily_runtime_history = {}
+    coordinator._last_reset_date = datetime.now().strftime("%Y-%m-%d")
     coordinator._last_runtime_reset_date = datetime.now().strftime("%Y-%m-%d")
 
-    # Connection state
-    coordinator._last_update_time = None
-    coordinator._last_valid_data = {}
-    coordinator._consecutive_failures = 0
-    coordinator._max_stale_cycles = 3
-    coordinator._is_abba_device = False
-    coordinator._connection_attempts = 0
-    coordinator._last_connection_attempt = 0.0
-    coordinator._client = None
-    coordinator._ble_device = ble_device
-    coordinator._characteristic = None
-    coordinator._active_char_uuid = None
-    coordinator._abba_write_char = None
-    coordinator._notification_data = None
-
-    # Volatile fields for clear/restore/save
-    coordinator._VOLATILE_FIELDS = (
-        "case_temperature", "cab_temperature", "cab_temperature_raw",
-        "supply_voltage", "running_state", "running_step", "running_mode",
-        "set_level", "set_temp", "altitude", "error_code",
-        "hourly_fuel_consumption", "co_ppm", "remain_run_time",
-    )
+    # Add async_set_updated_data method (from DataUpdateCoordinator parent)
+    coordinator.async_set_updated_data = MagicMock()
+
 
+# Scalar coordinator state, shared by every test coordinator (mutable state
+# is set per coordinator by _set_mutable_state)
+_TEMPLATE_STATE = MappingProxyType({
+    # Minimum required attributes
+    "_address": "AA:BB:CC:DD:EE:FF",
+    "_heater_id": "EE:FF",
+    "_protocol": None,
+    "_protocol_mode": 0,
+    "_passkey": 1234,
+    # Fuel tracking state
+    "_daily_fuel_consumed": 0.0,
+    "_total_fuel_consumed": 0.0,
+    "_fuel_consumed_since_reset": 0.0,
+    # Runtime tracking state
+    "_daily_runtime_seconds": 0.0,
+    "_total_runtime_seconds": 0.0,
+    # Connection state
+    "_last_update_time": None,
+    "_consecutive_failures": 0,
+    "_max_stale_cycles": 3,
+    "_is_abba_device": False,
+    "_connection_attempts": 0,
+    "_last_connection_attempt": 0.0,
+    "_client": None,
+    "_characteristic": None,
+    "_active_char_uuid": None,
+    "_abba_write_char": None,
+    "_notification_data": None,
     # Auto offset related
-    coordinator._auto_offset_unsub = None
-    coordinator._auto_offset_enabled = False
-    coordinator._external_temp_sensor = None
-    coordinator._auto_offset_max = 5
-    coordinator._heater_uses_fahrenheit = False
+    "_auto_offset_unsub": None,
+    "_auto_offset_enabled": False,
+    "_external_temp_sensor": None,
+    "_auto_offset_max": 5,
+    "_heater_uses_fahrenheit": False,
+    # Address property (used by statistics import)
+    "address": "AA:BB:CC:DD:EE:FF",
+})
 
-    # Add address property (used by statistics import)
-    coordinator.address = "AA:BB:CC:DD:EE:FF"
 
-    # Add async_set_updated_data method (from DataUpdateCoordinator parent)
-    coordinator.async_set_updated_data = MagicMock()
+def create_mock_coordinator() -> VevorHeaterCoordinator:
+    """Create a mock coordinator for testing without calling __init__."""
+    # Create coordinator without calling __init__ using object.__new__, then
+    # set the scalar state in one update (none of it is a class descriptor)
+    coordinator = object.__new__(VevorHeaterCoordinator)
+    vars(coordinator).update(_TEMPLATE_STATE)
 
+    _set_mutable_state(coordinator)
     return coordinator
 
 
-# ---------------------------------------------------------------------------
-# Fuel consumption calculation tests
-# ---------------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def _coordinator_template() -> VevorHeaterCoordinator:
+    """Coordinator built once per module; tests get copies of it."""
+    return create_mock_coordinator()
 
-class TestFuelConsumption:
-    """Tests for fuel consumption calculations."""
 
-    def test_calculate_fuel_consumption_level_1(self):
-        """Test fuel consumption at level 1."""
-        coordinator = create_mock_coordinator()
-        coordinator.data["set_level"] = 1
-        coordinator.data["running_step"] = RUNNING_STEP_RUNNING
+@pytest.fixture
+def coordinator(_coordinator_template) -> VevorHeaterCoordinator:
+    """Per-test shallow copy of the template with fresh mutable state.
 
-        # 1 hour = 3600 seconds
-        consumption = coordinator._calculate_fuel_consumption(3600)
+    Overrides the entity platform ``coordinator`` fixture from conftest.
+    """
+    coordinator = copy.copy(_coordinator_template)
+    _set_mutable_state(coordinator)
+    return coordinator
 
-        # Level 1 consumption from table
-        expected = FUEL_CONSUMPTION_TABLE.get(1, 0.1)
-        assert abs(consumption - expected) < 0.001
 
-    def test_calculate_fuel_consumption_level_10(self):
-        """Test fuel consumption at maximum level."""
-        coordinator = create_mock_coordinator()
-        coordinator.data["set_level"] = 10
-        coordinator.data["running_step"] = RUNNING_STEP_RUNNING
+# ---------------------------------------------------------------------------
+# Fuel consumption calculation tests
+# ---------------------------------------------------------------------------
 
-        consumption = coordinator._calculate_fuel_consumption(3600)
-        expected = FUEL_CONSUMPTION_TABLE.get(10, 0.5)
-        assert abs(consumption - expected) < 0.001
+# Absolute tolerance (liters) for computed fuel consumption
+_FUEL_TOL = 1e-3
 
-    def test_calculate_fuel_consumption_fractional_hour(self):
-        """Test fuel consumption for partial hour."""
-        coordinator = create_mock_coordinator()
-        coordinator.data["set_level"] = 5
-        coordinator.data["running_step"] = RUNNING_STEP_RUNNING
+# Expected consumption while running, keyed by (level, seconds)
+_EXPECTED_FUEL = MappingProxyType({
+    (level, seconds): rate * seconds / 3600
+    for level, rate in FUEL_CONSUMPTION_TABLE.items()
+    for seconds in (0, 1800, 3600)
+})
 
-        # 30 minutes = 1800 seconds
-        consumption = coordinator._calculate_fuel_consumption(1800)
-        expected = FUEL_CONSUMPTION_TABLE.get(5, 0.25) / 2
-        assert abs(consumption - expected) < 0.001
 
-    def test_calculate_fuel_consumption_zero_time(self):
-        """Test fuel consumption with zero elapsed time."""
-        coordinator = create_mock_coordinator()
-        coordinator.data["running_step"] = RUNNING_STEP_RUNNING
-        consumption = coordinator._calculate_fuel_consumption(0)
-        assert consumption == 0.0
+class TestFuelConsumption:
+    """Tests for fuel consumption calculations."""
 
-    def test_calculate_fuel_consumption_when_not_running(self):
-        """Test fuel consumption returns 0 when heater not running."""
-        coordinator = create_mock_coordinator()
-        coordinator.data["set_level"] = 10
-        coordinator.data["running_step"] = 0  # Standby
+    @pytest.mark.parametrize(
+        ("level", "seconds", "running_step", "expected"),
+        [
+            (1, 3600, RUNNING_STEP_RUNNING, _EXPECTED_FUEL[1, 3600]),
+            (10, 3600, RUNNING_STEP_RUNNING, _EXPECTED_FUEL[10, 3600]),
+            # 30 minutes = 1800 seconds
+            (5, 1800, RUNNING_STEP_RUNNING, _EXPECTED_FUEL[5, 1800]),
+            (1, 0, RUNNING_STEP_RUNNING, _EXPECTED_FUEL[1, 0]),
+            (10, 3600, 0, 0.0),  # Standby
+        ],
+        ids=["level_1", "level_10", "fractional_hour", "zero_time", "not_running"],
+    )
+    def test_calculate_fuel_consumption(
+        self, coordinator, level, seconds, running_step, expected
+    ):
+        """Test fuel consumption for a level, elapsed time and running step."""
+        coordinator.data["set_level"] = level
+        coordinator.data["running_step"] = running_step
 
-        consumption = coordinator._calculate_fuel_consumption(3600)
-        assert consumption == 0.0
+        consumption = coordinator._calculate_fuel_consumption(seconds)
+        assert consumption == pytest.approx(expected, abs=_FUEL_TOL)
 
 
 class TestFuelTracking:
     """Tests for fuel tracking logic."""
 
-    def test_update_fuel_tracking_when_running(self):
+    def test_update_fuel_tracking_when_running(self, coordinator):
         """Test fuel tracking updates when heater is running."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
         coordinator.data["set_level"] = 5
 
@@ -228,14 +257,13 @@ class TestFuelTracking:
 
         coordinator._update_fuel_tracking(3600)  # 1 hour
 
-        expected = FUEL_CONSUMPTION_TABLE.get(5, 0.25)
+        expected = _EXPECTED_FUEL[5, 3600]
         assert coordinator._daily_fuel_consumed > initial_daily
         assert coordinator._total_fuel_consumed > initial_total
-        assert abs(coordinator._daily_fuel_consumed - expected) < 0.01
+        assert coordinator._daily_fuel_consumed == pytest.approx(expected, abs=0.01)
 
-    def test_update_fuel_tracking_when_not_running(self):
+    def test_update_fuel_tracking_when_not_running(self, coordinator):
         """Test fuel tracking doesn't update when heater is off."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = 0  # Standby
 
         initial_daily = coordinator._daily_fuel_consumed
@@ -246,9 +274,8 @@ class TestFuelTracking:
         assert coordinator._daily_fuel_consumed == initial_daily
         assert coordinator._total_fuel_consumed == initial_total
 
-    def test_update_fuel_remaining(self):
+    def test_update_fuel_remaining(self, coordinator):
         """Test fuel remaining calculation."""
-        coordinator = create_mock_coordinator()
         coordinator.data["tank_capacity"] = 10
         coordinator._fuel_consumed_since_reset = 3.5
 
@@ -256,9 +283,8 @@ class TestFuelTracking:
 
         assert coordinator.data["fuel_remaining"] == 6.5
 
-    def test_update_fuel_remaining_negative_clamped(self):
+    def test_update_fuel_remaining_negative_clamped(self, coordinator):
         """Test fuel remaining is clamped to zero."""
-        coordinator = create_mock_coordinator()
         coordinator.data["tank_capacity"] = 5
         coordinator._fuel_consumed_since_reset = 10.0
 
@@ -274,30 +300,23 @@ class TestFuelTracking:
 class TestRuntimeTracking:
     """Tests for runtime tracking logic."""
 
-    def test_update_runtime_when_running(self):
-        """Test runtime updates when heater is running."""
-        coordinator = create_mock_coordinator()
+    def test_update_runtime(self, coordinator):
+        """Test runtime updates only while the heater is running."""
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
 
-        initial_daily = coordinator._daily_runtime_seconds
-        initial_total = coordinator._total_runtime_seconds
-
         coordinator._update_runtime_tracking(3600)  # 1 hour
 
         # Runtime is tracked in seconds internally
-        assert coordinator._daily_runtime_seconds == initial_daily + 3600
-        assert coordinator._total_runtime_seconds == initial_total + 3600
+        assert coordinator._daily_runtime_seconds == 3600
+        assert coordinator._total_runtime_seconds == 3600
 
-    def test_update_runtime_when_not_running(self):
-        """Test runtime doesn't update when heater is off."""
-        coordinator = create_mock_coordinator()
+        # Heater off: counters stay where they are
         coordinator.data["running_step"] = 0
 
-        initial_daily = coordinator._daily_runtime_seconds
-
         coordinator._update_runtime_tracking(3600)
 
-        assert coordinator._daily_runtime_seconds == initial_daily
+        assert coordinator._daily_runtime_seconds == 3600
+        assert coordinator._total_runtime_seconds == 3600
 
 
 # ---------------------------------------------------------------------------
@@ -307,9 +326,8 @@ class TestRuntimeTracking:
 class TestDataManagement:
     """Tests for data clearing, saving, and restoring."""
 
-    def test_clear_sensor_values(self):
+    def test_clear_sensor_values(self, coordinator):
         """Test that sensor values are cleared correctly."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = 25.0
         coordinator.data["supply_voltage"] = 12.5
 
@@ -318,9 +336,8 @@ class TestDataManagement:
         assert coordinator.data["cab_temperature"] is None
         assert coordinator.data["supply_voltage"] is None
 
-    def test_save_valid_data(self):
+    def test_save_valid_data(self, coordinator):
         """Test that valid data is saved for restoration."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = 25.0
         coordinator.data["supply_voltage"] = 12.5
 
@@ -329,9 +346,8 @@ class TestDataManagement:
         assert coordinator._last_valid_data["cab_temperature"] == 25.0
         assert coordinator._last_valid_data["supply_voltage"] == 12.5
 
-    def test_restore_stale_data(self):
+    def test_restore_stale_data(self, coordinator):
         """Test that stale data is restored correctly."""
-        coordinator = create_mock_coordinator()
         coordinator._last_valid_data = {
             "cab_temperature": 25.0,
             "supply_voltage": 12.5,
@@ -349,76 +365,52 @@ class TestDataManagement:
 # Protocol detection tests
 # ---------------------------------------------------------------------------
 
+# Detection payloads, built once at import (tests copy them into bytearrays)
+_AA55_RAW = b"\xaa\x55" + bytes(18)  # AA55 unencrypted, 20 bytes
+_AA66_RAW = b"\xaa\x66" + bytes(18)  # AA66 unencrypted, 20 bytes
+_ABBA_RAW = b"\xab\xba" + bytes(19)  # ABBA/HeaterCC, 21+ bytes
+_CBFF_RAW = b"\xcb\xff" + bytes(45)  # CBFF/Sunster, 47 bytes
+_UNKNOWN_RAW = b"\x12\x34" + bytes(10)  # No valid header
+
+# 48-byte encrypted packets that decrypt to an AA55 / AA66 header
+_AA55_ENC_DATA = bytes(_encrypt_data(bytearray(b"\xaa\x55" + bytes(46))))
+_AA66_ENC_DATA = bytes(_encrypt_data(bytearray(b"\xaa\x66" + bytes(46))))
+
+
 class TestProtocolDetection:
     """Tests for protocol detection logic."""
 
-    def test_detect_protocol_aa55_unencrypted(self):
-        """Test detection of AA55 unencrypted protocol."""
-        coordinator = create_mock_coordinator()
-
-        # AA55 header, 20 bytes
-        data = bytearray([0xAA, 0x55] + [0x00] * 18)
-        header = (data[0] << 8) | data[1]
+    @pytest.mark.parametrize(
+        ("data", "expected_mode"),
+        [
+            (_AA55_RAW, 1),
+            (_ABBA_RAW, 5),
+            (_CBFF_RAW, 6),
+            (_UNKNOWN_RAW, None),
+        ],
+        ids=["aa55_unencrypted", "abba", "cbff", "unknown_returns_none"],
+    )
+    def test_detect_protocol(self, coordinator, data, expected_mode):
+        """Test protocol detection from header and length."""
+        data = bytearray(data)
+        header = int.from_bytes(data[:2], "big")
 
         protocol, parsed_data = coordinator._detect_protocol(data, header)
 
-        assert protocol is not None
-        assert protocol.protocol_mode == 1  # AA55 unencrypted
+        mode = protocol.protocol_mode if protocol is not None else None
+        assert mode == expected_mode
 
-    def test_detect_protocol_aa55_encrypted(self):
+    def test_detect_protocol_aa55_encrypted(self, coordinator):
         """Test detection of AA55 encrypted protocol (48 bytes)."""
-        coordinator = create_mock_coordinator()
-
         # 48 bytes, after decryption should have AA55 or AA66 header
-        # Create encrypted data that decrypts to AA55
-        from diesel_heater_ble import _encrypt_data
-        plain = bytearray([0xAA, 0x55] + [0x00] * 46)
-        data = _encrypt_data(plain)
-        header = (data[0] << 8) | data[1]
+        data = bytearray(_AA55_ENC_DATA)
+        header = int.from_bytes(data[:2], "big")
 
         protocol, parsed_data = coordinator._detect_protocol(data, header)
 
         assert protocol is not None
         assert protocol.protocol_mode in [2, 4]  # Encrypted variants
 
-    def test_detect_protocol_abba(self):
-        """Test detection of ABBA/HeaterCC protocol."""
-        coordinator = create_mock_coordinator()
-
-        # ABBA header 0xABBA, 21+ bytes
-        data = bytearray([0xAB, 0xBA] + [0x00] * 19)
-        header = (data[0] << 8) | data[1]
-
-        protocol, parsed_data = coordinator._detect_protocol(data, header)
-
-        assert protocol is not None
-        assert protocol.protocol_mode == 5  # ABBA
-
-    def test_detect_protocol_cbff(self):
-        """Test detection of CBFF/Sunster protocol."""
-        coordinator = create_mock_coordinator()
-
-        # CBFF header 0xCBFF, 47 bytes
-        data = bytearray([0xCB, 0xFF] + [0x00] * 45)
-        header = (data[0] << 8) | data[1]
-
-        protocol, parsed_data = coordinator._detect_protocol(data, header)
-
-        assert protocol is not None
-        assert protocol.protocol_mode == 6  # CBFF
-
-    def test_detect_protocol_unknown_returns_none(self):
-        """Test that unknown data returns None."""
-        coordinator = create_mock_coordinator()
-
-        # Random data with no valid header
-        data = bytearray([0x12, 0x34] + [0x00] * 10)
-        header = (data[0] << 8) | data[1]
-
-        protocol, parsed_data = coordinator._detect_protocol(data, header)
-
-        assert protocol is None
-
 
 # ---------------------------------------------------------------------------
 # Command building tests
@@ -427,9 +419,8 @@ class TestProtocolDetection:
 class TestCommandBuilding:
     """Tests for command packet building."""
 
-    def test_build_command_packet_aa55(self):
+    def test_build_command_packet_aa55(self, coordinator):
         """Test building AA55 command packet."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1  # AA55
         coordinator._passkey = 1234
 
@@ -439,14 +430,12 @@ class TestCommandBuilding:
         assert packet[0] == 0xAA
         assert packet[1] == 0x55
 
-    def test_build_command_packet_abba(self):
+    def test_build_command_packet_abba(self, coordinator):
         """Test building ABBA command packet."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 5  # ABBA
         coordinator._is_abba_device = True
 
         # Need to set protocol to ABBA
-        from diesel_heater_ble import ProtocolABBA
         coordinator._protocol = ProtocolABBA()
 
         packet = coordinator._build_command_packet(1, 0)  # Status request
@@ -463,34 +452,25 @@ class TestCommandBuilding:
 class TestUITemperatureOffset:
     """Tests for UI temperature offset application."""
 
-    def test_apply_positive_offset(self):
-        """Test applying positive temperature offset."""
-        coordinator = create_mock_coordinator()
+    @pytest.mark.parametrize(
+        ("offset", "expected"),
+        [(2.0, 22.0), (-3.0, 17.0)],
+        ids=["positive", "negative"],
+    )
+    def test_apply_offset(self, coordinator, offset, expected):
+        """Test applying a manual temperature offset."""
         coordinator.data["cab_temperature"] = 20.0
         coordinator.data["heater_offset"] = 0
         # Set manual offset via config_entry.data
-        coordinator.config_entry.data = {"temperature_offset": 2.0}
+        coordinator.config_entry.data = {"temperature_offset": offset}
 
         coordinator._apply_ui_temperature_offset()
 
-        assert coordinator.data["cab_temperature"] == 22.0
+        assert coordinator.data["cab_temperature"] == expected
         assert coordinator.data["cab_temperature_raw"] == 20.0
 
-    def test_apply_negative_offset(self):
-        """Test applying negative temperature offset."""
-        coordinator = create_mock_coordinator()
-        coordinator.data["cab_temperature"] = 20.0
-        coordinator.data["heater_offset"] = 0
-        coordinator.config_entry.data = {"temperature_offset": -3.0}
-
-        coordinator._apply_ui_temperature_offset()
-
-        assert coordinator.data["cab_temperature"] == 17.0
-        assert coordinator.data["cab_temperature_raw"] == 20.0
-
-    def test_no_offset_when_none(self):
+    def test_no_offset_when_none(self, coordinator):
         """Test no offset applied when cab_temperature is None."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = None
         coordinator.config_entry.data = {"temperature_offset": 5.0}
 
@@ -506,26 +486,27 @@ class TestUITemperatureOffset:
 class TestConnectionFailureHandling:
     """Tests for connection failure handling."""
 
-    def test_handle_connection_failure_increments_counter(self):
-        """Test that connection failures increment the counter."""
-        coordinator = create_mock_coordinator()
-        coordinator._consecutive_failures = 0
-
-        coordinator._handle_connection_failure(Exception("Test error"))
-
-        assert coordinator._consecutive_failures == 1
-
-    def test_handle_connection_failure_clears_data_after_threshold(self):
-        """Test that data is cleared after consecutive failures exceed threshold."""
-        coordinator = create_mock_coordinator()
-        coordinator._consecutive_failures = 2  # After 3rd failure, data should clear
+    @pytest.mark.parametrize(
+        ("initial_failures", "expected_connected"),
+        [
+            (0, True),
+            (2, True),  # 3rd failure is still within the stale tolerance
+            (3, False),  # 4th failure exceeds _max_stale_cycles (3)
+        ],
+        ids=["first_failure", "within_tolerance", "after_threshold"],
+    )
+    def test_handle_connection_failure(
+        self, coordinator, initial_failures, expected_connected
+    ):
+        """Test failures increment the counter and disconnect past the threshold."""
+        coordinator._consecutive_failures = initial_failures
+        coordinator.data["connected"] = True
         coordinator.data["cab_temperature"] = 25.0
-        coordinator._stale_cycles = 3  # Exceed stale tolerance
 
         coordinator._handle_connection_failure(Exception("Test error"))
 
-        # After threshold, connected should be false
-        assert coordinator.data["connected"] is False
+        assert coordinator._consecutive_failures == initial_failures + 1
+        assert coordinator.data["connected"] is expected_connected
 
 
 # ---------------------------------------------------------------------------
@@ -535,53 +516,39 @@ class TestConnectionFailureHandling:
 class TestHistoryCleaning:
     """Tests for history data cleanup."""
 
-    def test_clean_old_history_removes_old_entries(self):
-        """Test that entries older than MAX_HISTORY_DAYS are removed."""
-        coordinator = create_mock_coordinator()
-
-        # Add old and new entries
-        old_date = (datetime.now() - timedelta(days=100)).strftime("%Y-%m-%d")
-        recent_date = datetime.now().strftime("%Y-%m-%d")
+    def test_clean_old_history_removes_old_entries(self, coordinator):
+        """Test that fuel and runtime entries older than MAX_HISTORY_DAYS are removed."""
+        now = datetime.now()
+        old_date = (now - timedelta(days=100)).strftime("%Y-%m-%d")
+        recent_date = now.strftime("%Y-%m-%d")
 
         coordinator._daily_fuel_history = {
             old_date: 1.5,
             recent_date: 0.5,
         }
-
-        coordinator._clean_old_history()
-
-        assert old_date not in coordinator._daily_fuel_history
-        assert recent_date in coordinator._daily_fuel_history
-
-    def test_clean_old_runtime_history(self):
-        """Test that old runtime history is cleaned."""
-        coordinator = create_mock_coordinator()
-
-        old_date = (datetime.now() - timedelta(days=100)).strftime("%Y-%m-%d")
-        recent_date = datetime.now().strftime("%Y-%m-%d")
-
         coordinator._daily_runtime_history = {
             old_date: 5.0,
             recent_date: 2.0,
         }
 
+        coordinator._clean_old_history()
         coordinator._clean_old_runtime_history()
 
+        assert old_date not in coordinator._daily_fuel_history
+        assert recent_date in coordinator._daily_fuel_history
         assert old_date not in coordinator._daily_runtime_history
         assert recent_date in coordinator._daily_runtime_history
 
-    def test_clean_old_history_empty(self):
+    def test_clean_old_history_empty(self, coordinator):
         """Test cleaning empty history doesn't crash."""
-        coordinator = create_mock_coordinator()
         coordinator._daily_fuel_history = {}
 
         coordinator._clean_old_history()
 
         assert coordinator._daily_fuel_history == {}
 
-    def test_clean_old_runtime_history_empty(self):
+    def test_clean_old_runtime_history_empty(self, coordinator):
         """Test cleaning empty runtime history doesn't crash."""
-        coordinator = create_mock_coordinator()
         coordinator._daily_runtime_history = {}
 
         coordinator._clean_old_runtime_history()
@@ -596,16 +563,14 @@ class TestHistoryCleaning:
 class TestProtocolMode:
     """Tests for protocol_mode property."""
 
-    def test_protocol_mode_returns_value(self):
+    def test_protocol_mode_returns_value(self, coordinator):
         """Test protocol_mode returns current mode."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 3
 
         assert coordinator.protocol_mode == 3
 
-    def test_protocol_mode_default(self):
+    def test_protocol_mode_default(self, coordinator):
         """Test protocol_mode default is 0."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 0
 
         assert coordinator.protocol_mode == 0
@@ -618,10 +583,8 @@ class TestProtocolMode:
 class TestNotificationCallback:
     """Tests for BLE notification callback."""
 
-    def test_notification_callback_method_exists(self):
+    def test_notification_callback_method_exists(self, coordinator):
         """Test notification callback method exists."""
-        coordinator = create_mock_coordinator()
-
         # Method should exist and be callable
         assert hasattr(coordinator, '_notification_callback')
         assert callable(coordinator._notification_callback)
@@ -634,20 +597,18 @@ class TestNotificationCallback:
 class TestFuelTrackingAdvanced:
     """Advanced tests for fuel tracking."""
 
-    def test_fuel_consumption_all_levels(self):
+    def test_fuel_consumption_all_levels(self, coordinator):
         """Test fuel consumption calculation for all levels 1-10."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
 
         for level in range(1, 11):
             coordinator.data["set_level"] = level
             consumption = coordinator._calculate_fuel_consumption(3600)
-            expected = FUEL_CONSUMPTION_TABLE.get(level, 0.1)
-            assert abs(consumption - expected) < 0.001, f"Level {level} failed"
+            expected = _EXPECTED_FUEL[level, 3600]
+            assert consumption == pytest.approx(expected, abs=_FUEL_TOL), f"Level {level} failed"
 
-    def test_fuel_tracking_accumulates(self):
+    def test_fuel_tracking_accumulates(self, coordinator):
         """Test fuel tracking accumulates over multiple updates."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
         coordinator.data["set_level"] = 1
 
@@ -660,11 +621,10 @@ class TestFuelTrackingAdvanced:
         second_total = coordinator._total_fuel_consumed
 
         assert second_total > first_total
-        assert abs(second_total - first_total * 2) < 0.01
+        assert second_total == pytest.approx(first_total * 2, abs=0.01)
 
-    def test_fuel_remaining_with_zero_capacity(self):
+    def test_fuel_remaining_with_zero_capacity(self, coordinator):
         """Test fuel remaining when tank capacity is 0."""
-        coordinator = create_mock_coordinator()
         coordinator.data["tank_capacity"] = 0
         coordinator._fuel_consumed_since_reset = 0.0
 
@@ -673,9 +633,8 @@ class TestFuelTrackingAdvanced:
         # With 0 capacity, fuel remaining stays None or 0
         assert coordinator.data["fuel_remaining"] is None or coordinator.data["fuel_remaining"] == 0.0
 
-    def test_fuel_remaining_exact_empty(self):
+    def test_fuel_remaining_exact_empty(self, coordinator):
         """Test fuel remaining when exactly empty."""
-        coordinator = create_mock_coordinator()
         coordinator.data["tank_capacity"] = 5
         coordinator._fuel_consumed_since_reset = 5.0
 
@@ -691,9 +650,8 @@ class TestFuelTrackingAdvanced:
 class TestRuntimeTrackingAdvanced:
     """Advanced tests for runtime tracking."""
 
-    def test_runtime_tracking_accumulates(self):
+    def test_runtime_tracking_accumulates(self, coordinator):
         """Test runtime tracking accumulates over multiple updates."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
 
         # First update
@@ -706,9 +664,8 @@ class TestRuntimeTrackingAdvanced:
 
         assert second_total == first_total + 1800
 
-    def test_runtime_updates_data_dict(self):
+    def test_runtime_updates_data_dict(self, coordinator):
         """Test runtime tracking updates data dict."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
 
         coordinator._update_runtime_tracking(3600)  # 1 hour
@@ -725,9 +682,8 @@ class TestRuntimeTrackingAdvanced:
 class TestCommandBuildingAdvanced:
     """Advanced tests for command building."""
 
-    def test_build_command_packet_with_argument(self):
+    def test_build_command_packet_with_argument(self, coordinator):
         """Test building command packet with argument."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1  # AA55
         coordinator._passkey = 1234
 
@@ -738,9 +694,8 @@ class TestCommandBuildingAdvanced:
         assert packet[0] == 0xAA
         assert packet[1] == 0x55
 
-    def test_build_command_packet_encrypted(self):
+    def test_build_command_packet_encrypted(self, coordinator):
         """Test building command packet for encrypted protocol."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 2  # AA55 Encrypted
         coordinator._passkey = 1234
 
@@ -750,9 +705,8 @@ class TestCommandBuildingAdvanced:
         assert packet[0] == 0xAA
         assert packet[1] == 0x55
 
-    def test_build_command_packet_aa66(self):
+    def test_build_command_packet_aa66(self, coordinator):
         """Test building AA66 command packet."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 3  # AA66
         coordinator._passkey = 1234
 
@@ -762,9 +716,8 @@ class TestCommandBuildingAdvanced:
         assert len(packet) == 8
         assert packet[0] == 0xAA
 
-    def test_build_command_packet_cbff(self):
+    def test_build_command_packet_cbff(self, coordinator):
         """Test building CBFF command packet (uses AA55 format)."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 6  # CBFF
         coordinator._passkey = 1234
 
@@ -782,26 +735,21 @@ class TestCommandBuildingAdvanced:
 class TestProtocolDetectionAdvanced:
     """Advanced tests for protocol detection."""
 
-    def test_detect_protocol_aa66_unencrypted(self):
+    def test_detect_protocol_aa66_unencrypted(self, coordinator):
         """Test detection of AA66 unencrypted protocol."""
-        coordinator = create_mock_coordinator()
-
-        # AA66 header, 20 bytes
-        data = bytearray([0xAA, 0x66] + [0x00] * 18)
-        header = (data[0] << 8) | data[1]
+        data = bytearray(_AA66_RAW)
+        header = int.from_bytes(data[:2], "big")
 
         protocol, parsed_data = coordinator._detect_protocol(data, header)
 
         assert protocol is not None
         assert protocol.protocol_mode == 3  # AA66 unencrypted
 
-    def test_detect_protocol_short_data(self):
+    def test_detect_protocol_short_data(self, coordinator):
         """Test protocol detection with too short data."""
-        coordinator = create_mock_coordinator()
-
         # Only 5 bytes - too short for any protocol
         data = bytearray([0xAA, 0x55, 0x00, 0x00, 0x00])
-        header = (data[0] << 8) | data[1]
+        header = int.from_bytes(data[:2], "big")
 
         protocol, parsed_data = coordinator._detect_protocol(data, header)
 
@@ -816,9 +764,8 @@ class TestProtocolDetectionAdvanced:
 class TestDataFormat:
     """Tests for data format and rounding."""
 
-    def test_hourly_consumption_rounded(self):
+    def test_hourly_consumption_rounded(self, coordinator):
         """Test hourly consumption is rounded to 2 decimals."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
         coordinator.data["set_level"] = 5
 
@@ -828,9 +775,8 @@ class TestDataFormat:
         daily = coordinator.data["daily_fuel_consumed"]
         assert daily == round(daily, 2)
 
-    def test_runtime_hours_rounded(self):
+    def test_runtime_hours_rounded(self, coordinator):
         """Test runtime hours are rounded to 2 decimals."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
 
         coordinator._update_runtime_tracking(3661)  # 1 hour and 1 second
@@ -846,9 +792,8 @@ class TestDataFormat:
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    def test_fuel_consumption_invalid_level(self):
+    def test_fuel_consumption_invalid_level(self, coordinator):
         """Test fuel consumption with invalid level (defaults)."""
-        coordinator = create_mock_coordinator()
         coordinator.data["running_step"] = RUNNING_STEP_RUNNING
         coordinator.data["set_level"] = 99  # Invalid
 
@@ -856,9 +801,8 @@ class TestEdgeCases:
         consumption = coordinator._calculate_fuel_consumption(3600)
         assert consumption >= 0
 
-    def test_clear_sensor_values_preserves_non_volatile(self):
+    def test_clear_sensor_values_preserves_non_volatile(self, coordinator):
         """Test clearing sensor values preserves non-volatile data."""
-        coordinator = create_mock_coordinator()
         coordinator.data["daily_fuel_consumed"] = 5.0
         coordinator.data["total_fuel_consumed"] = 100.0
         coordinator.data["cab_temperature"] = 25.0
@@ -871,9 +815,8 @@ class TestEdgeCases:
         assert coordinator.data["daily_fuel_consumed"] == 5.0
         assert coordinator.data["total_fuel_consumed"] == 100.0
 
-    def test_restore_stale_data_partial(self):
+    def test_restore_stale_data_partial(self, coordinator):
         """Test restoring partial stale data."""
-        coordinator = create_mock_coordinator()
         coordinator._last_valid_data = {
             "cab_temperature": 25.0,
             # supply_voltage not saved
@@ -888,9 +831,8 @@ class TestEdgeCases:
         # Should remain None
         assert coordinator.data["supply_voltage"] is None
 
-    def test_connection_failure_first_failure(self):
+    def test_connection_failure_first_failure(self, coordinator):
         """Test first connection failure behavior."""
-        coordinator = create_mock_coordinator()
         coordinator._consecutive_failures = 0
         coordinator._last_valid_data = {"cab_temperature": 20.0}
         coordinator.data["cab_temperature"] = 20.0
@@ -900,9 +842,8 @@ class TestEdgeCases:
         # After first failure, should restore stale data
         assert coordinator._consecutive_failures == 1
 
-    def test_save_valid_data_filters_none(self):
+    def test_save_valid_data_filters_none(self, coordinator):
         """Test that save_valid_data doesn't save None values."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = 25.0
         coordinator.data["supply_voltage"] = None
 
@@ -920,9 +861,8 @@ class TestEdgeCases:
 class TestTemperatureOffsetAdvanced:
     """Advanced tests for temperature offset."""
 
-    def test_offset_with_heater_offset(self):
+    def test_offset_with_heater_offset(self, coordinator):
         """Test UI offset calculation with heater's own offset."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = 20.0
         coordinator.data["heater_offset"] = 2  # Heater reports +2 offset
         coordinator.config_entry.data = {"temperature_offset": 0.0}
@@ -932,9 +872,8 @@ class TestTemperatureOffsetAdvanced:
         # Raw should be 20 - 2 = 18 (sensor reading before heater offset)
         assert coordinator.data["cab_temperature_raw"] == 18.0
 
-    def test_offset_applies_correctly(self):
+    def test_offset_applies_correctly(self, coordinator):
         """Test temperature offset applies correctly."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = 25.0
         coordinator.data["heater_offset"] = 0
         coordinator.config_entry.data = {"temperature_offset": 5.0}
@@ -943,9 +882,8 @@ class TestTemperatureOffsetAdvanced:
 
         assert coordinator.data["cab_temperature"] == 30.0
 
-    def test_offset_zero_no_change(self):
+    def test_offset_zero_no_change(self, coordinator):
         """Test zero offset doesn't change temperature."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = 25.0
         coordinator.data["heater_offset"] = 0
         coordinator.config_entry.data = {"temperature_offset": 0.0}
@@ -963,9 +901,8 @@ class TestAsyncDataPersistence:
     """Tests for async data persistence methods."""
 
     @pytest.mark.asyncio
-    async def test_async_save_data_calls_store(self):
+    async def test_async_save_data_calls_store(self, coordinator):
         """Test async_save_data calls the store."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_save_time = 0
@@ -975,9 +912,8 @@ class TestAsyncDataPersistence:
         coordinator._store.async_save.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_async_save_data_includes_fuel_data(self):
+    async def test_async_save_data_includes_fuel_data(self, coordinator):
         """Test async_save_data includes fuel tracking data."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_save_time = 0
@@ -993,9 +929,8 @@ class TestAsyncDataPersistence:
         assert STORAGE_KEY_DAILY_FUEL in saved_data
 
     @pytest.mark.asyncio
-    async def test_async_save_data_includes_runtime_data(self):
+    async def test_async_save_data_includes_runtime_data(self, coordinator):
         """Test async_save_data includes runtime tracking data."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_save_time = 0
@@ -1010,9 +945,8 @@ class TestAsyncDataPersistence:
         assert STORAGE_KEY_DAILY_RUNTIME in saved_data
 
     @pytest.mark.asyncio
-    async def test_async_load_data_restores_fuel(self):
+    async def test_async_load_data_restores_fuel(self, coordinator):
         """Test async_load_data calls store and processes data."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         # Use today's date to avoid daily reset
         today = datetime.now().date().isoformat()
@@ -1039,9 +973,8 @@ class TestAsyncDataPersistence:
         assert coordinator.data["daily_fuel_consumed"] == 5.0
 
     @pytest.mark.asyncio
-    async def test_async_load_data_handles_missing_data(self):
+    async def test_async_load_data_handles_missing_data(self, coordinator):
         """Test async_load_data handles missing/None data gracefully."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_load = AsyncMock(return_value=None)
 
@@ -1060,9 +993,8 @@ class TestAsyncFuelManagement:
     """Tests for async fuel management methods."""
 
     @pytest.mark.asyncio
-    async def test_async_reset_fuel_level(self):
+    async def test_async_reset_fuel_level(self, coordinator):
         """Test async_reset_fuel_level resets fuel tracking."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._fuel_consumed_since_reset = 10.0
@@ -1074,9 +1006,8 @@ class TestAsyncFuelManagement:
         assert coordinator.data["fuel_consumed_since_reset"] == 0.0
 
     @pytest.mark.asyncio
-    async def test_async_set_tank_capacity(self):
+    async def test_async_set_tank_capacity(self, coordinator):
         """Test async_set_tank_capacity updates capacity."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_save_time = 0
@@ -1094,9 +1025,8 @@ class TestDailyReset:
     """Tests for daily reset functionality."""
 
     @pytest.mark.asyncio
-    async def test_check_daily_reset_same_day(self):
+    async def test_check_daily_reset_same_day(self, coordinator):
         """Test _check_daily_reset doesn't reset on same day."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         today = datetime.now().strftime("%Y-%m-%d")
@@ -1109,9 +1039,8 @@ class TestDailyReset:
         assert coordinator._daily_fuel_consumed == 5.0
 
     @pytest.mark.asyncio
-    async def test_check_daily_reset_new_day(self):
+    async def test_check_daily_reset_new_day(self, coordinator):
         """Test _check_daily_reset resets on new day."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_save_time = 0
@@ -1128,9 +1057,8 @@ class TestDailyReset:
         assert yesterday in coordinator._daily_fuel_history
 
     @pytest.mark.asyncio
-    async def test_check_daily_runtime_reset_same_day(self):
+    async def test_check_daily_runtime_reset_same_day(self, coordinator):
         """Test _check_daily_runtime_reset doesn't reset on same day."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         today = datetime.now().strftime("%Y-%m-%d")
@@ -1143,9 +1071,8 @@ class TestDailyReset:
         assert coordinator._daily_runtime_seconds == 3600.0
 
     @pytest.mark.asyncio
-    async def test_check_daily_runtime_reset_new_day(self):
+    async def test_check_daily_runtime_reset_new_day(self, coordinator):
         """Test _check_daily_runtime_reset resets on new day."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_save_time = 0
@@ -1170,9 +1097,8 @@ class TestAsyncCommands:
     """Tests for async command methods."""
 
     @pytest.mark.asyncio
-    async def test_async_turn_on(self):
+    async def test_async_turn_on(self, coordinator):
         """Test async_turn_on sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_turn_on()
@@ -1184,9 +1110,8 @@ class TestAsyncCommands:
         assert call_args[0][1] == 1
 
     @pytest.mark.asyncio
-    async def test_async_turn_off(self):
+    async def test_async_turn_off(self, coordinator):
         """Test async_turn_off sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
         coordinator.data["running_state"] = 1  # Must be running to turn off
 
@@ -1199,9 +1124,8 @@ class TestAsyncCommands:
         assert call_args[0][1] == 0
 
     @pytest.mark.asyncio
-    async def test_async_set_level(self):
+    async def test_async_set_level(self, coordinator):
         """Test async_set_level sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_level(7)
@@ -1213,9 +1137,8 @@ class TestAsyncCommands:
         assert call_args[0][1] == 7
 
     @pytest.mark.asyncio
-    async def test_async_set_temperature(self):
+    async def test_async_set_temperature(self, coordinator):
         """Test async_set_temperature sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_temperature(25)
@@ -1227,9 +1150,8 @@ class TestAsyncCommands:
         assert call_args[0][1] == 25
 
     @pytest.mark.asyncio
-    async def test_async_set_mode(self):
+    async def test_async_set_mode(self, coordinator):
         """Test async_set_mode sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_mode(2)  # Temperature mode
@@ -1239,9 +1161,8 @@ class TestAsyncCommands:
         assert call_args[0][1] == 2
 
     @pytest.mark.asyncio
-    async def test_async_set_auto_start_stop(self):
+    async def test_async_set_auto_start_stop(self, coordinator):
         """Test async_set_auto_start_stop sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_auto_start_stop(True)
@@ -1249,9 +1170,8 @@ class TestAsyncCommands:
         coordinator._send_command.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_async_sync_time(self):
+    async def test_async_sync_time(self, coordinator):
         """Test async_sync_time sends time sync command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_sync_time()
@@ -1262,9 +1182,8 @@ class TestAsyncCommands:
         assert call_args[0][0] == 10
 
     @pytest.mark.asyncio
-    async def test_async_set_heater_offset(self):
+    async def test_async_set_heater_offset(self, coordinator):
         """Test async_set_heater_offset sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_heater_offset(3)
@@ -1275,9 +1194,8 @@ class TestAsyncCommands:
         assert call_args[0][0] in [12, 20]
 
     @pytest.mark.asyncio
-    async def test_async_set_backlight(self):
+    async def test_async_set_backlight(self, coordinator):
         """Test async_set_backlight sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_backlight(5)
@@ -1285,9 +1203,8 @@ class TestAsyncCommands:
         coordinator._send_command.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_async_set_auto_offset_enabled(self):
+    async def test_async_set_auto_offset_enabled(self, coordinator):
         """Test async_set_auto_offset_enabled updates state."""
-        coordinator = create_mock_coordinator()
         coordinator._store = MagicMock()
         coordinator._store.async_save = AsyncMock()
         coordinator._last_save_time = 0
@@ -1299,9 +1216,8 @@ class TestAsyncCommands:
         assert coordinator.data["auto_offset_enabled"] is True
 
     @pytest.mark.asyncio
-    async def test_async_send_raw_command(self):
+    async def test_async_send_raw_command(self, coordinator):
         """Test async_send_raw_command sends arbitrary command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         result = await coordinator.async_send_raw_command(99, 42)
@@ -1317,18 +1233,16 @@ class TestAsyncCommands:
 class TestAddressProperties:
     """Tests for address-related properties."""
 
-    def test_address_property(self):
+    def test_address_property(self, coordinator):
         """Test address property returns BLE address."""
-        coordinator = create_mock_coordinator()
         coordinator._address = "AA:BB:CC:DD:EE:FF"
 
         # Check if address property exists and works
         assert hasattr(coordinator, '_address')
         assert coordinator._address == "AA:BB:CC:DD:EE:FF"
 
-    def test_heater_id_format(self):
+    def test_heater_id_format(self, coordinator):
         """Test heater_id is last 2 bytes of address."""
-        coordinator = create_mock_coordinator()
         coordinator._heater_id = "EE:FF"
 
         assert coordinator._heater_id == "EE:FF"
@@ -1341,18 +1255,14 @@ class TestAddressProperties:
 class TestABBAProtocol:
     """Tests for ABBA protocol specific behavior."""
 
-    def test_is_abba_device_flag(self):
+    def test_is_abba_device_flag(self, coordinator):
         """Test _is_abba_device flag."""
-        coordinator = create_mock_coordinator()
         coordinator._is_abba_device = True
 
         assert coordinator._is_abba_device is True
 
-    def test_build_command_abba_uses_protocol(self):
+    def test_build_command_abba_uses_protocol(self, coordinator):
         """Test ABBA command building uses protocol handler."""
-        from diesel_heater_ble import ProtocolABBA
-
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 5
         coordinator._is_abba_device = True
         coordinator._protocol = ProtocolABBA()
@@ -1371,17 +1281,13 @@ class TestABBAProtocol:
 class TestStatisticsImport:
     """Tests for statistics import functionality."""
 
-    def test_has_import_statistics_method(self):
+    def test_has_import_statistics_method(self, coordinator):
         """Test _import_statistics method exists."""
-        coordinator = create_mock_coordinator()
-
         assert hasattr(coordinator, '_import_statistics')
         assert callable(coordinator._import_statistics)
 
-    def test_has_import_runtime_statistics_method(self):
+    def test_has_import_runtime_statistics_method(self, coordinator):
         """Test _import_runtime_statistics method exists."""
-        coordinator = create_mock_coordinator()
-
         assert hasattr(coordinator, '_import_runtime_statistics')
         assert callable(coordinator._import_runtime_statistics)
 
@@ -1394,9 +1300,8 @@ class TestAsyncConfigurationCommands:
     """Tests for async configuration commands."""
 
     @pytest.mark.asyncio
-    async def test_async_set_language(self):
+    async def test_async_set_language(self, coordinator):
         """Test async_set_language sends correct command."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_language(2)  # German
@@ -1408,9 +1313,8 @@ class TestAsyncConfigurationCommands:
         assert call_args[0][1] == 2
 
     @pytest.mark.asyncio
-    async def test_async_set_temp_unit_celsius(self):
+    async def test_async_set_temp_unit_celsius(self, coordinator):
         """Test async_set_temp_unit sets Celsius."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_temp_unit(False)  # Celsius
@@ -1422,9 +1326,8 @@ class TestAsyncConfigurationCommands:
         assert call_args[0][1] == 0  # 0 = Celsius
 
     @pytest.mark.asyncio
-    async def test_async_set_temp_unit_fahrenheit(self):
+    async def test_async_set_temp_unit_fahrenheit(self, coordinator):
         """Test async_set_temp_unit sets Fahrenheit."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_temp_unit(True)  # Fahrenheit
@@ -1435,9 +1338,8 @@ class TestAsyncConfigurationCommands:
         assert call_args[0][1] == 1  # 1 = Fahrenheit
 
     @pytest.mark.asyncio
-    async def test_async_set_altitude_unit_meters(self):
+    async def test_async_set_altitude_unit_meters(self, coordinator):
         """Test async_set_altitude_unit sets meters."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_altitude_unit(False)  # Meters
@@ -1449,9 +1351,8 @@ class TestAsyncConfigurationCommands:
         assert call_args[0][1] == 0  # 0 = Meters
 
     @pytest.mark.asyncio
-    async def test_async_set_altitude_unit_feet(self):
+    async def test_async_set_altitude_unit_feet(self, coordinator):
         """Test async_set_altitude_unit sets feet."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_altitude_unit(True)  # Feet
@@ -1462,9 +1363,8 @@ class TestAsyncConfigurationCommands:
         assert call_args[0][1] == 1  # 1 = Feet
 
     @pytest.mark.asyncio
-    async def test_async_set_high_altitude_enabled_abba(self):
+    async def test_async_set_high_altitude_enabled_abba(self, coordinator):
         """Test async_set_high_altitude enables high altitude mode for ABBA."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
         coordinator._is_abba_device = True  # Must be ABBA device
         coordinator.async_request_refresh = AsyncMock()
@@ -1477,9 +1377,8 @@ class TestAsyncConfigurationCommands:
         assert call_args[0][0] == 99
 
     @pytest.mark.asyncio
-    async def test_async_set_high_altitude_skipped_non_abba(self):
+    async def test_async_set_high_altitude_skipped_non_abba(self, coordinator):
         """Test async_set_high_altitude does nothing for non-ABBA devices."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
         coordinator._is_abba_device = False  # Not ABBA device
 
@@ -1489,9 +1388,8 @@ class TestAsyncConfigurationCommands:
         coordinator._send_command.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_async_set_tank_volume(self):
+    async def test_async_set_tank_volume(self, coordinator):
         """Test async_set_tank_volume sets tank volume index."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_tank_volume(5)  # Index 5 = 25L
@@ -1503,9 +1401,8 @@ class TestAsyncConfigurationCommands:
         assert call_args[0][1] == 5
 
     @pytest.mark.asyncio
-    async def test_async_set_pump_type(self):
+    async def test_async_set_pump_type(self, coordinator):
         """Test async_set_pump_type sets pump type."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_pump_type(2)  # 28µl pump
@@ -1524,14 +1421,13 @@ class TestAsyncConfigurationCommands:
 class TestResponseParsing:
     """Tests for response parsing functionality."""
 
-    def test_parse_response_aa55_updates_data(self):
+    def test_parse_response_aa55_updates_data(self, coordinator):
         """Test parsing AA55 response updates data dict."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1  # AA55
         coordinator._protocol = coordinator._protocols[1]
 
         # Create a valid 20-byte AA55 response
-        data = bytearray([0xAA, 0x55] + [0x00] * 18)
+        data = bytearray(_AA55_RAW)
 
         # Parse the response (actual byte positions depend on protocol)
         coordinator._parse_response(data)
@@ -1540,21 +1436,18 @@ class TestResponseParsing:
         # (not checking specific values since protocol layout is complex)
         assert "running_state" in coordinator.data
 
-    def test_parse_response_method_exists(self):
+    def test_parse_response_method_exists(self, coordinator):
         """Test _parse_response method exists."""
-        coordinator = create_mock_coordinator()
-
         assert hasattr(coordinator, '_parse_response')
         assert callable(coordinator._parse_response)
 
-    def test_parse_response_processes_data(self):
+    def test_parse_response_processes_data(self, coordinator):
         """Test parsing response processes the data without error."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1  # AA55
         coordinator._protocol = coordinator._protocols[1]
 
         # Create a valid response
-        data = bytearray([0xAA, 0x55] + [0x00] * 18)
+        data = bytearray(_AA55_RAW)
 
         # Should not raise an exception
         coordinator._parse_response(data)
@@ -1570,16 +1463,14 @@ class TestResponseParsing:
 class TestUtilityMethods:
     """Tests for utility methods."""
 
-    def test_protocol_mode_property(self):
+    def test_protocol_mode_property(self, coordinator):
         """Test protocol_mode property getter."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 5
 
         assert coordinator.protocol_mode == 5
 
-    def test_clear_sensor_values_all_volatile(self):
+    def test_clear_sensor_values_all_volatile(self, coordinator):
         """Test clearing all volatile sensor values."""
-        coordinator = create_mock_coordinator()
         # Set all volatile fields
         coordinator.data["case_temperature"] = 50
         coordinator.data["cab_temperature"] = 20
@@ -1596,9 +1487,8 @@ class TestUtilityMethods:
         assert coordinator.data["cab_temperature"] is None
         assert coordinator.data["supply_voltage"] is None
 
-    def test_save_valid_data_all_fields(self):
+    def test_save_valid_data_all_fields(self, coordinator):
         """Test saving all valid data fields."""
-        coordinator = create_mock_coordinator()
         coordinator.data["cab_temperature"] = 25.0
         coordinator.data["case_temperature"] = 60
         coordinator.data["supply_voltage"] = 13.2
@@ -1619,9 +1509,8 @@ class TestTemperatureClamp:
     """Tests for temperature clamping logic."""
 
     @pytest.mark.asyncio
-    async def test_set_temperature_clamps_below_min(self):
+    async def test_set_temperature_clamps_below_min(self, coordinator):
         """Test temperature below 8 is clamped to 8."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_temperature(5)  # Below min
@@ -1630,9 +1519,8 @@ class TestTemperatureClamp:
         assert call_args[0][1] == 8  # Clamped to min
 
     @pytest.mark.asyncio
-    async def test_set_temperature_clamps_above_max(self):
+    async def test_set_temperature_clamps_above_max(self, coordinator):
         """Test temperature above 36 is clamped to 36."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_temperature(40)  # Above max
@@ -1649,9 +1537,8 @@ class TestLevelClamp:
     """Tests for level clamping logic."""
 
     @pytest.mark.asyncio
-    async def test_set_level_clamps_below_min(self):
+    async def test_set_level_clamps_below_min(self, coordinator):
         """Test level below 1 is clamped to 1."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_level(0)  # Below min
@@ -1660,9 +1547,8 @@ class TestLevelClamp:
         assert call_args[0][1] == 1  # Clamped to min
 
     @pytest.mark.asyncio
-    async def test_set_level_clamps_above_max(self):
+    async def test_set_level_clamps_above_max(self, coordinator):
         """Test level above 10 is clamped to 10."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_level(15)  # Above max
@@ -1671,9 +1557,8 @@ class TestLevelClamp:
         assert call_args[0][1] == 10  # Clamped to max
 
     @pytest.mark.asyncio
-    async def test_set_level_in_range(self):
+    async def test_set_level_in_range(self, coordinator):
         """Test level in valid range is not clamped."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_level(5)  # In range
@@ -1690,9 +1575,8 @@ class TestModeCommands:
     """Tests for mode switching commands."""
 
     @pytest.mark.asyncio
-    async def test_set_mode_level(self):
+    async def test_set_mode_level(self, coordinator):
         """Test setting level mode (1)."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_mode(1)  # Level mode
@@ -1701,9 +1585,8 @@ class TestModeCommands:
         assert call_args[0][1] == 1
 
     @pytest.mark.asyncio
-    async def test_set_mode_temperature(self):
+    async def test_set_mode_temperature(self, coordinator):
         """Test setting temperature mode (2)."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
 
         await coordinator.async_set_mode(2)  # Temperature mode
@@ -1754,9 +1637,8 @@ class TestAsyncLoadDataEdgeCases:
     """Tests for async_load_data edge cases."""
 
     @pytest.mark.asyncio
-    async def test_load_data_new_day_resets_daily_fuel(self):
+    async def test_load_data_new_day_resets_daily_fuel(self, coordinator):
         """Test that loading data on a new day resets daily fuel counter."""
-        coordinator = create_mock_coordinator()
         yesterday = (datetime.now() - timedelta(days=1)).date().isoformat()
 
         stored_data = {
@@ -1782,9 +1664,8 @@ class TestAsyncLoadDataEdgeCases:
         assert yesterday in coordinator._daily_fuel_history
 
     @pytest.mark.asyncio
-    async def test_load_data_same_day_preserves_daily(self):
+    async def test_load_data_same_day_preserves_daily(self, coordinator):
         """Test that loading data on same day preserves daily counters."""
-        coordinator = create_mock_coordinator()
         today = datetime.now().date().isoformat()
 
         stored_data = {
@@ -1809,9 +1690,8 @@ class TestAsyncLoadDataEdgeCases:
         assert coordinator._daily_runtime_seconds == 900.0
 
     @pytest.mark.asyncio
-    async def test_load_data_with_tank_capacity(self):
+    async def test_load_data_with_tank_capacity(self, coordinator):
         """Test loading data with tank capacity."""
-        coordinator = create_mock_coordinator()
         today = datetime.now().date().isoformat()
 
         stored_data = {
@@ -1840,9 +1720,8 @@ class TestAsyncLoadDataEdgeCases:
         assert coordinator.data["last_refueled"] == "2024-01-15T10:00:00"
 
     @pytest.mark.asyncio
-    async def test_load_data_with_auto_offset_enabled(self):
+    async def test_load_data_with_auto_offset_enabled(self, coordinator):
         """Test loading data with auto offset enabled state."""
-        coordinator = create_mock_coordinator()
         today = datetime.now().date().isoformat()
 
         stored_data = {
@@ -1866,9 +1745,8 @@ class TestAsyncLoadDataEdgeCases:
         assert coordinator.data["auto_offset_enabled"] is True
 
     @pytest.mark.asyncio
-    async def test_load_data_handles_exception(self):
+    async def test_load_data_handles_exception(self, coordinator):
         """Test async_load_data handles storage exceptions gracefully."""
-        coordinator = create_mock_coordinator()
         coordinator._store.async_load = AsyncMock(side_effect=Exception("Storage error"))
         coordinator._setup_external_temp_listener = AsyncMock()
 
@@ -1879,10 +1757,8 @@ class TestAsyncLoadDataEdgeCases:
         coordinator._setup_external_temp_listener.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_load_data_no_saved_date_uses_today(self):
+    async def test_load_data_no_saved_date_uses_today(self, coordinator):
         """Test that missing saved date defaults to today."""
-        coordinator = create_mock_coordinator()
-
         stored_data = {
             STORAGE_KEY_TOTAL_FUEL: 10.0,
             STORAGE_KEY_DAILY_FUEL: 1.0,
@@ -1913,9 +1789,8 @@ class TestExternalTempSensor:
     """Tests for external temperature sensor integration."""
 
     @pytest.mark.asyncio
-    async def test_setup_external_temp_no_sensor_configured(self):
+    async def test_setup_external_temp_no_sensor_configured(self, coordinator):
         """Test setup with no external sensor configured."""
-        coordinator = create_mock_coordinator()
         coordinator.config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}  # No CONF_EXTERNAL_TEMP_SENSOR
         coordinator._auto_offset_unsub = None
 
@@ -1925,11 +1800,10 @@ class TestExternalTempSensor:
         assert coordinator._auto_offset_unsub is None
 
     @pytest.mark.asyncio
-    async def test_setup_external_temp_with_sensor(self):
+    async def test_setup_external_temp_with_sensor(self, coordinator):
         """Test setup with external sensor configured."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR
 
-        coordinator = create_mock_coordinator()
         coordinator.config_entry.data = {
             "address": "AA:BB:CC:DD:EE:FF",
             CONF_EXTERNAL_TEMP_SENSOR: "sensor.external_temp",
@@ -1946,9 +1820,8 @@ class TestExternalTempSensor:
             assert coordinator._auto_offset_unsub == mock_unsub
 
     @pytest.mark.asyncio
-    async def test_setup_external_temp_cleans_up_existing(self):
+    async def test_setup_external_temp_cleans_up_existing(self, coordinator):
         """Test that setup cleans up existing listener first."""
-        coordinator = create_mock_coordinator()
         coordinator.config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
         old_unsub = MagicMock()
         coordinator._auto_offset_unsub = old_unsub
@@ -1968,9 +1841,8 @@ class TestAutoOffsetCalculation:
     """Tests for auto temperature offset calculation."""
 
     @pytest.mark.asyncio
-    async def test_auto_offset_disabled(self):
+    async def test_auto_offset_disabled(self, coordinator):
         """Test that auto offset is skipped when disabled."""
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = False
         coordinator.async_set_heater_offset = AsyncMock()
 
@@ -1979,9 +1851,8 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_no_external_sensor(self):
+    async def test_auto_offset_no_external_sensor(self, coordinator):
         """Test auto offset with no external sensor configured."""
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.config_entry.data = {"address": "AA:BB:CC:DD:EE:FF"}
         coordinator.async_set_heater_offset = AsyncMock()
@@ -1991,12 +1862,11 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_throttled(self):
+    async def test_auto_offset_throttled(self, coordinator):
         """Test auto offset is throttled."""
         import time
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.config_entry.data = {
             "address": "AA:BB:CC:DD:EE:FF",
@@ -2010,11 +1880,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_external_sensor_unavailable(self):
+    async def test_auto_offset_external_sensor_unavailable(self, coordinator):
         """Test auto offset when external sensor is unavailable."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.config_entry.data = {
             "address": "AA:BB:CC:DD:EE:FF",
@@ -2033,11 +1902,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_invalid_external_value(self):
+    async def test_auto_offset_invalid_external_value(self, coordinator):
         """Test auto offset with invalid external sensor value."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.config_entry.data = {
             "address": "AA:BB:CC:DD:EE:FF",
@@ -2055,11 +1923,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_no_heater_temp(self):
+    async def test_auto_offset_no_heater_temp(self, coordinator):
         """Test auto offset when heater raw temp is not available."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = None
         coordinator.config_entry.data = {
@@ -2078,11 +1945,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_small_difference_ignored(self):
+    async def test_auto_offset_small_difference_ignored(self, coordinator):
         """Test auto offset ignores small temperature differences."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = 22
         coordinator.config_entry.data = {
@@ -2102,11 +1968,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_applies_offset(self):
+    async def test_auto_offset_applies_offset(self, coordinator):
         """Test auto offset applies when difference is significant."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR, CONF_AUTO_OFFSET_MAX
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = 25  # Heater reads 25
         coordinator.config_entry.data = {
@@ -2128,11 +1993,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_called_once_with(-3)
 
     @pytest.mark.asyncio
-    async def test_auto_offset_clamped_to_max(self):
+    async def test_auto_offset_clamped_to_max(self, coordinator):
         """Test auto offset is clamped to max value."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR, CONF_AUTO_OFFSET_MAX
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = 30  # Heater reads 30
         coordinator.config_entry.data = {
@@ -2154,11 +2018,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_called_once_with(-3)
 
     @pytest.mark.asyncio
-    async def test_auto_offset_no_change_skipped(self):
+    async def test_auto_offset_no_change_skipped(self, coordinator):
         """Test auto offset skips sending when offset unchanged."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR, CONF_AUTO_OFFSET_MAX
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = 22
         coordinator.config_entry.data = {
@@ -2180,7 +2043,7 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_fahrenheit_external_sensor(self):
+    async def test_auto_offset_fahrenheit_external_sensor(self, coordinator):
         """Test auto offset correctly converts Fahrenheit external sensor to Celsius.
 
         Issue #31: External sensor in Fahrenheit was not converted before offset calculation.
@@ -2188,7 +2051,6 @@ class TestAutoOffsetCalculation:
         """
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR, CONF_AUTO_OFFSET_MAX
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = 12  # Heater reads 12°C
         coordinator.config_entry.data = {
@@ -2212,11 +2074,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_auto_offset_fahrenheit_with_difference(self):
+    async def test_auto_offset_fahrenheit_with_difference(self, coordinator):
         """Test auto offset with Fahrenheit sensor and significant difference."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR, CONF_AUTO_OFFSET_MAX
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = 15  # Heater reads 15°C
         coordinator.config_entry.data = {
@@ -2241,11 +2102,10 @@ class TestAutoOffsetCalculation:
         coordinator.async_set_heater_offset.assert_called_once_with(-5)
 
     @pytest.mark.asyncio
-    async def test_auto_offset_celsius_unit_explicit(self):
+    async def test_auto_offset_celsius_unit_explicit(self, coordinator):
         """Test auto offset with explicit Celsius unit works normally."""
         from custom_components.diesel_heater.const import CONF_EXTERNAL_TEMP_SENSOR, CONF_AUTO_OFFSET_MAX
 
-        coordinator = create_mock_coordinator()
         coordinator.data["auto_offset_enabled"] = True
         coordinator.data["cab_temperature_raw"] = 25  # Heater reads 25°C
         coordinator.config_entry.data = {
@@ -2275,9 +2135,8 @@ class TestAutoOffsetCalculation:
 class TestConnectionFailureHandling2:
     """Additional tests for connection failure handling."""
 
-    def test_handle_connection_failure_marks_disconnected_after_max_stale(self):
+    def test_handle_connection_failure_marks_disconnected_after_max_stale(self, coordinator):
         """Test that connection is marked disconnected after max stale cycles."""
-        coordinator = create_mock_coordinator()
         coordinator._consecutive_failures = 3  # Already at max
         coordinator._max_stale_cycles = 3
         coordinator.data["connected"] = True
@@ -2290,9 +2149,8 @@ class TestConnectionFailureHandling2:
         assert coordinator.data["connected"] is False
         coordinator._clear_sensor_values.assert_called_once()
 
-    def test_handle_connection_failure_logs_warning_once(self):
+    def test_handle_connection_failure_logs_warning_once(self, coordinator):
         """Test warning is logged only once when going offline."""
-        coordinator = create_mock_coordinator()
         coordinator._consecutive_failures = 3  # At exactly max + 1
         coordinator._max_stale_cycles = 3
         coordinator.data["connected"] = True
@@ -2312,9 +2170,8 @@ class TestAsyncUpdateData:
     """Tests for the main _async_update_data method."""
 
     @pytest.mark.asyncio
-    async def test_update_data_checks_daily_reset_first(self):
+    async def test_update_data_checks_daily_reset_first(self, coordinator):
         """Test that daily reset is checked even if disconnected."""
-        coordinator = create_mock_coordinator()
         coordinator._check_daily_reset = AsyncMock()
         coordinator._check_daily_runtime_reset = AsyncMock()
         coordinator._client = None  # Not connected
@@ -2330,11 +2187,10 @@ class TestAsyncUpdateData:
         coordinator._check_daily_runtime_reset.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_update_data_success_resets_failure_counter(self):
+    async def test_update_data_success_resets_failure_counter(self, coordinator):
         """Test successful update resets consecutive failures."""
         import time
 
-        coordinator = create_mock_coordinator()
         coordinator._check_daily_reset = AsyncMock()
         coordinator._check_daily_runtime_reset = AsyncMock()
         coordinator._client = MagicMock()
@@ -2355,11 +2211,10 @@ class TestAsyncUpdateData:
         assert result == coordinator.data
 
     @pytest.mark.asyncio
-    async def test_update_data_retries_on_timeout(self):
+    async def test_update_data_retries_on_timeout(self, coordinator):
         """Test update data retries status request on timeout."""
         import time
 
-        coordinator = create_mock_coordinator()
         coordinator._check_daily_reset = AsyncMock()
         coordinator._check_daily_runtime_reset = AsyncMock()
         coordinator._client = MagicMock()
@@ -2381,11 +2236,10 @@ class TestAsyncUpdateData:
         assert coordinator.data["connected"] is True
 
     @pytest.mark.asyncio
-    async def test_update_data_saves_periodically(self):
+    async def test_update_data_saves_periodically(self, coordinator):
         """Test update data saves every 5 minutes."""
         import time
 
-        coordinator = create_mock_coordinator()
         coordinator._check_daily_reset = AsyncMock()
         coordinator._check_daily_runtime_reset = AsyncMock()
         coordinator._client = MagicMock()
@@ -2404,11 +2258,10 @@ class TestAsyncUpdateData:
         coordinator.async_save_data.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_update_data_no_status_returns_stale_during_tolerance(self):
+    async def test_update_data_no_status_returns_stale_during_tolerance(self, coordinator):
         """Test no status returns stale data during tolerance window."""
         import time
 
-        coordinator = create_mock_coordinator()
         coordinator._check_daily_reset = AsyncMock()
         coordinator._check_daily_runtime_reset = AsyncMock()
         coordinator._client = MagicMock()
@@ -2425,11 +2278,10 @@ class TestAsyncUpdateData:
         assert result == coordinator.data
 
     @pytest.mark.asyncio
-    async def test_update_data_no_status_raises_after_tolerance(self):
+    async def test_update_data_no_status_raises_after_tolerance(self, coordinator):
         """Test no status raises UpdateFailed after tolerance exceeded."""
         import time
 
-        coordinator = create_mock_coordinator()
         coordinator._check_daily_reset = AsyncMock()
         coordinator._check_daily_runtime_reset = AsyncMock()
         coordinator._client = MagicMock()
@@ -2447,11 +2299,10 @@ class TestAsyncUpdateData:
         assert "No status received" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_update_data_exception_returns_stale_during_tolerance(self):
+    async def test_update_data_exception_returns_stale_during_tolerance(self, coordinator):
         """Test exception returns stale data during tolerance window."""
         import time
 
-        coordinator = create_mock_coordinator()
         coordinator._check_daily_reset = AsyncMock()
         coordinator._check_daily_runtime_reset = AsyncMock()
         coordinator._client = MagicMock()
@@ -2474,9 +2325,8 @@ class TestAsyncUpdateData:
 class TestExternalTempCallback:
     """Tests for external temperature change callback."""
 
-    def test_external_temp_changed_schedules_task(self):
+    def test_external_temp_changed_schedules_task(self, coordinator):
         """Test _async_external_temp_changed schedules calculation task."""
-        coordinator = create_mock_coordinator()
         coordinator._async_calculate_auto_offset = AsyncMock()
         mock_task = MagicMock()
         coordinator.hass.async_create_task = MagicMock(return_value=mock_task)
@@ -2495,9 +2345,8 @@ class TestAsyncSaveData:
     """Tests for async_save_data method."""
 
     @pytest.mark.asyncio
-    async def test_save_data_handles_exception(self):
+    async def test_save_data_handles_exception(self, coordinator):
         """Test async_save_data handles storage exception gracefully."""
-        coordinator = create_mock_coordinator()
         coordinator._store.async_save = AsyncMock(side_effect=Exception("Write failed"))
 
         # Should not raise
@@ -2507,9 +2356,8 @@ class TestAsyncSaveData:
         coordinator._logger.warning.assert_called()
 
     @pytest.mark.asyncio
-    async def test_save_data_success(self):
+    async def test_save_data_success(self, coordinator):
         """Test async_save_data saves data successfully."""
-        coordinator = create_mock_coordinator()
         coordinator._store.async_save = AsyncMock()
 
         await coordinator.async_save_data()
@@ -2530,10 +2378,8 @@ class TestStatisticsImportDetailed:
     """Detailed tests for statistics import functionality."""
 
     @pytest.mark.asyncio
-    async def test_import_statistics_no_recorder(self):
+    async def test_import_statistics_no_recorder(self, coordinator):
         """Test _import_statistics when recorder not available."""
-        coordinator = create_mock_coordinator()
-
         with patch("custom_components.diesel_heater.coordinator.get_instance", return_value=None):
             await coordinator._import_statistics("2024-01-15", 2.5)
 
@@ -2541,9 +2387,8 @@ class TestStatisticsImportDetailed:
         coordinator._logger.debug.assert_called()
 
     @pytest.mark.asyncio
-    async def test_import_statistics_invalid_date(self):
+    async def test_import_statistics_invalid_date(self, coordinator):
         """Test _import_statistics with invalid date string."""
-        coordinator = create_mock_coordinator()
         mock_recorder = MagicMock()
 
         with patch("custom_components.diesel_heater.coordinator.get_instance", return_value=mock_recorder):
@@ -2552,9 +2397,8 @@ class TestStatisticsImportDetailed:
         coordinator._logger.error.assert_called()
 
     @pytest.mark.asyncio
-    async def test_import_statistics_exception(self):
+    async def test_import_statistics_exception(self, coordinator):
         """Test _import_statistics handles async_add_external_statistics exception."""
-        coordinator = create_mock_coordinator()
         mock_recorder = MagicMock()
 
         with patch("custom_components.diesel_heater.coordinator.get_instance", return_value=mock_recorder):
@@ -2564,9 +2408,8 @@ class TestStatisticsImportDetailed:
         coordinator._logger.warning.assert_called()
 
     @pytest.mark.asyncio
-    async def test_import_all_history_statistics_with_data(self):
+    async def test_import_all_history_statistics_with_data(self, coordinator):
         """Test _import_all_history_statistics with actual history."""
-        coordinator = create_mock_coordinator()
         coordinator._daily_fuel_history = {
             "2024-01-14": 2.5,
             "2024-01-15": 3.0,
@@ -2578,19 +2421,16 @@ class TestStatisticsImportDetailed:
         assert coordinator._import_statistics.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_import_runtime_statistics_no_recorder(self):
+    async def test_import_runtime_statistics_no_recorder(self, coordinator):
         """Test _import_runtime_statistics when recorder not available."""
-        coordinator = create_mock_coordinator()
-
         with patch("custom_components.diesel_heater.coordinator.get_instance", return_value=None):
             await coordinator._import_runtime_statistics("2024-01-15", 4.5)
 
         coordinator._logger.debug.assert_called()
 
     @pytest.mark.asyncio
-    async def test_import_runtime_statistics_invalid_date(self):
+    async def test_import_runtime_statistics_invalid_date(self, coordinator):
         """Test _import_runtime_statistics with invalid date string."""
-        coordinator = create_mock_coordinator()
         mock_recorder = MagicMock()
 
         with patch("custom_components.diesel_heater.coordinator.get_instance", return_value=mock_recorder):
@@ -2599,9 +2439,8 @@ class TestStatisticsImportDetailed:
         coordinator._logger.error.assert_called()
 
     @pytest.mark.asyncio
-    async def test_import_runtime_statistics_exception(self):
+    async def test_import_runtime_statistics_exception(self, coordinator):
         """Test _import_runtime_statistics handles exception."""
-        coordinator = create_mock_coordinator()
         mock_recorder = MagicMock()
 
         with patch("custom_components.diesel_heater.coordinator.get_instance", return_value=mock_recorder):
@@ -2611,9 +2450,8 @@ class TestStatisticsImportDetailed:
         coordinator._logger.warning.assert_called()
 
     @pytest.mark.asyncio
-    async def test_import_all_runtime_history_statistics_with_data(self):
+    async def test_import_all_runtime_history_statistics_with_data(self, coordinator):
         """Test _import_all_runtime_history_statistics with actual history."""
-        coordinator = create_mock_coordinator()
         coordinator._daily_runtime_history = {
             "2024-01-14": 3.5,
             "2024-01-15": 5.0,
@@ -2633,9 +2471,8 @@ class TestBLEConnectionCleanup:
     """Tests for BLE connection cleanup."""
 
     @pytest.mark.asyncio
-    async def test_cleanup_connection_no_client(self):
+    async def test_cleanup_connection_no_client(self, coordinator):
         """Test cleanup_connection with no client."""
-        coordinator = create_mock_coordinator()
         coordinator._client = None
 
         await coordinator._cleanup_connection()
@@ -2644,9 +2481,8 @@ class TestBLEConnectionCleanup:
         assert coordinator._client is None
 
     @pytest.mark.asyncio
-    async def test_cleanup_connection_disconnects(self):
+    async def test_cleanup_connection_disconnects(self, coordinator):
         """Test cleanup_connection disconnects active client."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         mock_client.disconnect = AsyncMock()
@@ -2664,9 +2500,8 @@ class TestBLEConnectionCleanup:
         assert coordinator._characteristic is None
 
     @pytest.mark.asyncio
-    async def test_cleanup_connection_handles_disconnect_error(self):
+    async def test_cleanup_connection_handles_disconnect_error(self, coordinator):
         """Test cleanup_connection handles disconnect error gracefully."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         mock_client.disconnect = AsyncMock(side_effect=Exception("Disconnect failed"))
@@ -2680,9 +2515,8 @@ class TestBLEConnectionCleanup:
         assert coordinator._client is None
 
     @pytest.mark.asyncio
-    async def test_cleanup_connection_handles_stop_notify_error(self):
+    async def test_cleanup_connection_handles_stop_notify_error(self, coordinator):
         """Test cleanup_connection handles stop_notify error gracefully."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         mock_client.disconnect = AsyncMock()
@@ -2707,9 +2541,8 @@ class TestGATTWrite:
     """Tests for GATT write operations."""
 
     @pytest.mark.asyncio
-    async def test_write_gatt_standard_characteristic(self):
+    async def test_write_gatt_standard_characteristic(self, coordinator):
         """Test _write_gatt uses standard characteristic."""
-        coordinator = create_mock_coordinator()
         coordinator._is_abba_device = False
         mock_client = MagicMock()
         mock_client.write_gatt_char = AsyncMock()
@@ -2723,9 +2556,8 @@ class TestGATTWrite:
         mock_client.write_gatt_char.assert_called_once_with("standard_char", packet, response=False)
 
     @pytest.mark.asyncio
-    async def test_write_gatt_abba_characteristic(self):
+    async def test_write_gatt_abba_characteristic(self, coordinator):
         """Test _write_gatt uses ABBA write characteristic for ABBA devices."""
-        coordinator = create_mock_coordinator()
         coordinator._is_abba_device = True
         mock_client = MagicMock()
         mock_client.write_gatt_char = AsyncMock()
@@ -2747,9 +2579,8 @@ class TestWakeUpPing:
     """Tests for wake-up ping functionality."""
 
     @pytest.mark.asyncio
-    async def test_send_wake_up_ping_success(self):
+    async def test_send_wake_up_ping_success(self, coordinator):
         """Test _send_wake_up_ping sends packet successfully."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         coordinator._client = mock_client
         coordinator._characteristic = "char"
@@ -2762,9 +2593,8 @@ class TestWakeUpPing:
         coordinator._write_gatt.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_send_wake_up_ping_handles_error(self):
+    async def test_send_wake_up_ping_handles_error(self, coordinator):
         """Test _send_wake_up_ping handles errors gracefully."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         coordinator._client = mock_client
         coordinator._characteristic = "char"
@@ -2777,9 +2607,8 @@ class TestWakeUpPing:
         coordinator._logger.debug.assert_called()
 
     @pytest.mark.asyncio
-    async def test_send_wake_up_ping_no_client(self):
+    async def test_send_wake_up_ping_no_client(self, coordinator):
         """Test _send_wake_up_ping with no client does nothing."""
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._write_gatt = AsyncMock()
 
@@ -2796,9 +2625,8 @@ class TestSendCommand:
     """Tests for _send_command method."""
 
     @pytest.mark.asyncio
-    async def test_send_command_no_client(self):
+    async def test_send_command_no_client(self, coordinator):
         """Test _send_command returns False when no client."""
-        coordinator = create_mock_coordinator()
         coordinator._client = None
 
         result = await coordinator._send_command(1, 0, timeout=0.1)
@@ -2806,9 +2634,8 @@ class TestSendCommand:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_send_command_not_connected(self):
+    async def test_send_command_not_connected(self, coordinator):
         """Test _send_command returns False when not connected."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = False
         coordinator._client = mock_client
@@ -2818,9 +2645,8 @@ class TestSendCommand:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_send_command_no_characteristic(self):
+    async def test_send_command_no_characteristic(self, coordinator):
         """Test _send_command returns False when no characteristic."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         coordinator._client = mock_client
@@ -2831,9 +2657,8 @@ class TestSendCommand:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_send_command_timeout(self):
+    async def test_send_command_timeout(self, coordinator):
         """Test _send_command returns False on timeout."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         coordinator._client = mock_client
@@ -2847,9 +2672,8 @@ class TestSendCommand:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_send_command_success_with_response(self):
+    async def test_send_command_success_with_response(self, coordinator):
         """Test _send_command returns True when response received."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         coordinator._client = mock_client
@@ -2867,9 +2691,8 @@ class TestSendCommand:
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_send_command_exception_cleans_up(self):
+    async def test_send_command_exception_cleans_up(self, coordinator):
         """Test _send_command cleans up connection on exception."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         coordinator._client = mock_client
@@ -2891,9 +2714,8 @@ class TestSendCommand:
 class TestBuildCommandPacketEdgeCases:
     """Edge case tests for _build_command_packet."""
 
-    def test_build_command_uses_abba_fallback(self):
+    def test_build_command_uses_abba_fallback(self, coordinator):
         """Test _build_command_packet uses ABBA protocol fallback."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol = None
         coordinator._is_abba_device = True
 
@@ -2903,9 +2725,8 @@ class TestBuildCommandPacketEdgeCases:
         assert packet[0] == 0xBA
         assert packet[1] == 0xAB
 
-    def test_build_command_uses_aa55_fallback(self):
+    def test_build_command_uses_aa55_fallback(self, coordinator):
         """Test _build_command_packet uses AA55 protocol fallback."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol = None
         coordinator._is_abba_device = False
 
@@ -2924,9 +2745,8 @@ class TestABBAToggleGuard:
     """Tests for ABBA protocol toggle guard."""
 
     @pytest.mark.asyncio
-    async def test_turn_on_skipped_when_already_on_abba(self):
+    async def test_turn_on_skipped_when_already_on_abba(self, coordinator):
         """Test async_turn_on is skipped when heater already on (ABBA mode)."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 5  # ABBA
         coordinator.data["running_state"] = 1  # Already on
         coordinator._send_command = AsyncMock()
@@ -2937,9 +2757,8 @@ class TestABBAToggleGuard:
         coordinator._send_command.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_turn_on_proceeds_when_off_abba(self):
+    async def test_turn_on_proceeds_when_off_abba(self, coordinator):
         """Test async_turn_on proceeds when heater is off (ABBA mode)."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 5  # ABBA
         coordinator.data["running_state"] = 0  # Off
         coordinator._send_command = AsyncMock(return_value=True)
@@ -2951,9 +2770,8 @@ class TestABBAToggleGuard:
         coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_turn_off_skipped_when_already_off_abba(self):
+    async def test_turn_off_skipped_when_already_off_abba(self, coordinator):
         """Test async_turn_off is skipped when heater already off (ABBA mode)."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 5  # ABBA
         coordinator.data["running_state"] = 0  # Already off
         coordinator._send_command = AsyncMock()
@@ -2964,9 +2782,8 @@ class TestABBAToggleGuard:
         coordinator._send_command.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_turn_off_proceeds_when_on_abba(self):
+    async def test_turn_off_proceeds_when_on_abba(self, coordinator):
         """Test async_turn_off proceeds when heater is on (ABBA mode)."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 5  # ABBA
         coordinator.data["running_state"] = 1  # On
         coordinator._send_command = AsyncMock(return_value=True)
@@ -2978,9 +2795,8 @@ class TestABBAToggleGuard:
         coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_turn_on_proceeds_non_abba_protocol(self):
+    async def test_turn_on_proceeds_non_abba_protocol(self, coordinator):
         """Test async_turn_on always proceeds for non-ABBA protocols."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1  # AA55, not ABBA
         coordinator.data["running_state"] = 1  # Already on, but not ABBA
         coordinator._send_command = AsyncMock(return_value=True)
@@ -3000,9 +2816,8 @@ class TestFahrenheitConversion:
     """Tests for Fahrenheit temperature conversion."""
 
     @pytest.mark.asyncio
-    async def test_set_temperature_converts_to_fahrenheit(self):
+    async def test_set_temperature_converts_to_fahrenheit(self, coordinator):
         """Test async_set_temperature converts to Fahrenheit when heater uses it."""
-        coordinator = create_mock_coordinator()
         coordinator._heater_uses_fahrenheit = True
         coordinator._send_command = AsyncMock(return_value=True)
         coordinator.async_request_refresh = AsyncMock()
@@ -3017,9 +2832,8 @@ class TestFahrenheitConversion:
         assert call_args[0][1] == 68
 
     @pytest.mark.asyncio
-    async def test_set_temperature_celsius_no_conversion(self):
+    async def test_set_temperature_celsius_no_conversion(self, coordinator):
         """Test async_set_temperature sends Celsius when heater uses it."""
-        coordinator = create_mock_coordinator()
         coordinator._heater_uses_fahrenheit = False
         coordinator._send_command = AsyncMock(return_value=True)
         coordinator.async_request_refresh = AsyncMock()
@@ -3041,9 +2855,8 @@ class TestAsyncCommands2:
     """Additional tests for async command methods."""
 
     @pytest.mark.asyncio
-    async def test_turn_on_no_refresh_on_failure(self):
+    async def test_turn_on_no_refresh_on_failure(self, coordinator):
         """Test async_turn_on doesn't refresh on command failure."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
@@ -3053,9 +2866,8 @@ class TestAsyncCommands2:
         coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_turn_off_no_refresh_on_failure(self):
+    async def test_turn_off_no_refresh_on_failure(self, coordinator):
         """Test async_turn_off doesn't refresh on command failure."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
@@ -3065,9 +2877,8 @@ class TestAsyncCommands2:
         coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_set_level_no_refresh_on_failure(self):
+    async def test_set_level_no_refresh_on_failure(self, coordinator):
         """Test async_set_level doesn't refresh on command failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
 
@@ -3076,9 +2887,8 @@ class TestAsyncCommands2:
         coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_set_temperature_no_refresh_on_failure(self):
+    async def test_set_temperature_no_refresh_on_failure(self, coordinator):
         """Test async_set_temperature doesn't refresh on command failure."""
-        coordinator = create_mock_coordinator()
         coordinator._heater_uses_fahrenheit = False
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
@@ -3096,9 +2906,8 @@ class TestEnsureConnected:
     """Tests for the _ensure_connected BLE connection method."""
 
     @pytest.mark.asyncio
-    async def test_already_connected_returns_immediately(self):
+    async def test_already_connected_returns_immediately(self, coordinator):
         """Test _ensure_connected returns immediately if already connected."""
-        coordinator = create_mock_coordinator()
         mock_client = MagicMock()
         mock_client.is_connected = True
         coordinator._client = mock_client
@@ -3110,10 +2919,9 @@ class TestEnsureConnected:
         assert coordinator._connection_attempts == 0
 
     @pytest.mark.asyncio
-    async def test_exponential_backoff_delay(self):
+    async def test_exponential_backoff_delay(self, coordinator):
         """Test exponential backoff is applied between connection attempts."""
         import time
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._ble_device = MagicMock()
         coordinator._ble_device.address = "AA:BB:CC:DD:EE:FF"
@@ -3133,9 +2941,8 @@ class TestEnsureConnected:
                 await coordinator._ensure_connected()
 
     @pytest.mark.asyncio
-    async def test_connection_cleanup_on_stale_client(self):
+    async def test_connection_cleanup_on_stale_client(self, coordinator):
         """Test cleanup is called before new connection attempt."""
-        coordinator = create_mock_coordinator()
         coordinator._client = MagicMock()
         coordinator._client.is_connected = False  # Stale connection
         coordinator._ble_device = MagicMock()
@@ -3157,7 +2964,7 @@ class TestEnsureConnected:
             assert coordinator._cleanup_connection.call_count >= 1
 
     @pytest.mark.asyncio
-    async def test_abba_device_detection(self):
+    async def test_abba_device_detection(self, coordinator):
         """Test ABBA/HeaterCC device detection via fff0 service."""
         from custom_components.diesel_heater.const import (
             ABBA_SERVICE_UUID,
@@ -3165,7 +2972,6 @@ class TestEnsureConnected:
             ABBA_WRITE_UUID,
         )
 
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._ble_device = MagicMock()
         coordinator._ble_device.address = "AA:BB:CC:DD:EE:FF"
@@ -3210,14 +3016,13 @@ class TestEnsureConnected:
         assert coordinator._abba_write_char == mock_write_char
 
     @pytest.mark.asyncio
-    async def test_abba_fallback_write_char(self):
+    async def test_abba_fallback_write_char(self, coordinator):
         """Test ABBA falls back to fff1 if fff2 not available."""
         from custom_components.diesel_heater.const import (
             ABBA_SERVICE_UUID,
             ABBA_NOTIFY_UUID,
         )
 
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._ble_device = MagicMock()
         coordinator._ble_device.address = "AA:BB:CC:DD:EE:FF"
@@ -3255,14 +3060,13 @@ class TestEnsureConnected:
         coordinator._logger.warning.assert_called()
 
     @pytest.mark.asyncio
-    async def test_vevor_service_discovery(self):
+    async def test_vevor_service_discovery(self, coordinator):
         """Test standard Vevor service/characteristic discovery."""
         from custom_components.diesel_heater.const import (
             SERVICE_UUID,
             CHARACTERISTIC_UUID,
         )
 
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._ble_device = MagicMock()
         coordinator._ble_device.address = "AA:BB:CC:DD:EE:FF"
@@ -3299,9 +3103,8 @@ class TestEnsureConnected:
         assert coordinator._active_char_uuid == CHARACTERISTIC_UUID
 
     @pytest.mark.asyncio
-    async def test_no_services_discovered(self):
+    async def test_no_services_discovered(self, coordinator):
         """Test handling when no services are discovered."""
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._ble_device = MagicMock()
         coordinator._ble_device.address = "AA:BB:CC:DD:EE:FF"
@@ -3321,9 +3124,8 @@ class TestEnsureConnected:
             assert "No services available" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_characteristic_not_found(self):
+    async def test_characteristic_not_found(self, coordinator):
         """Test error when heater characteristic not found."""
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._ble_device = MagicMock()
         coordinator._ble_device.address = "AA:BB:CC:DD:EE:FF"
@@ -3353,14 +3155,13 @@ class TestEnsureConnected:
             assert "Could not find heater characteristic" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_characteristic_no_notify(self):
+    async def test_characteristic_no_notify(self, coordinator):
         """Test warning when characteristic doesn't support notify."""
         from custom_components.diesel_heater.const import (
             SERVICE_UUID,
             CHARACTERISTIC_UUID,
         )
 
-        coordinator = create_mock_coordinator()
         coordinator._client = None
         coordinator._ble_device = MagicMock()
         coordinator._ble_device.address = "AA:BB:CC:DD:EE:FF"
@@ -3402,9 +3203,8 @@ class TestEnsureConnected:
 class TestNotificationCallback:
     """Tests for notification callback and response parsing."""
 
-    def test_notification_callback_logs_and_parses(self):
+    def test_notification_callback_logs_and_parses(self, coordinator):
         """Test _notification_callback logs data and calls _parse_response."""
-        coordinator = create_mock_coordinator()
         coordinator._parse_response = MagicMock()
 
         data = bytearray([0xAA, 0x55, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00])
@@ -3413,9 +3213,8 @@ class TestNotificationCallback:
         coordinator._logger.info.assert_called()
         coordinator._parse_response.assert_called_once_with(data)
 
-    def test_notification_callback_catches_parse_errors(self):
+    def test_notification_callback_catches_parse_errors(self, coordinator):
         """Test _notification_callback catches and logs parse errors."""
-        coordinator = create_mock_coordinator()
         coordinator._parse_response = MagicMock(side_effect=ValueError("Parse error"))
 
         data = bytearray([0xAA, 0x55, 0x00, 0x01])
@@ -3423,9 +3222,8 @@ class TestNotificationCallback:
 
         coordinator._logger.error.assert_called()
 
-    def test_parse_response_too_short(self):
+    def test_parse_response_too_short(self, coordinator):
         """Test _parse_response handles short data."""
-        coordinator = create_mock_coordinator()
         coordinator._notification_data = None
 
         data = bytearray([0x00, 0x01, 0x02])  # Too short
@@ -3433,9 +3231,8 @@ class TestNotificationCallback:
 
         coordinator._logger.debug.assert_called()
 
-    def test_parse_response_aa77_ack_short(self):
+    def test_parse_response_aa77_ack_short(self, coordinator):
         """Test _parse_response handles short AA77 ACK."""
-        coordinator = create_mock_coordinator()
         coordinator._notification_data = None
 
         data = bytearray([0xAA, 0x77, 0x01, 0x02, 0x03])  # Short but valid AA77
@@ -3443,9 +3240,8 @@ class TestNotificationCallback:
 
         assert coordinator._notification_data == data
 
-    def test_parse_response_aa77_ack_full(self):
+    def test_parse_response_aa77_ack_full(self, coordinator):
         """Test _parse_response handles full AA77 ACK."""
-        coordinator = create_mock_coordinator()
         coordinator._notification_data = None
 
         data = bytearray([0xAA, 0x77] + [0x00] * 8)  # Full AA77
@@ -3453,19 +3249,16 @@ class TestNotificationCallback:
 
         assert coordinator._notification_data == data
 
-    def test_parse_response_unknown_protocol(self):
+    def test_parse_response_unknown_protocol(self, coordinator):
         """Test _parse_response logs warning for unknown protocol."""
-        coordinator = create_mock_coordinator()
-
         # Unknown header
         data = bytearray([0x12, 0x34] + [0x00] * 16)
         coordinator._parse_response(data)
 
         coordinator._logger.warning.assert_called()
 
-    def test_parse_response_parse_error_handling(self):
+    def test_parse_response_parse_error_handling(self, coordinator):
         """Test _parse_response handles protocol parse errors gracefully."""
-        coordinator = create_mock_coordinator()
         coordinator._protocol_mode = 1
         coordinator._is_abba_device = False
         coordinator._notification_data = None
@@ -3474,7 +3267,7 @@ class TestNotificationCallback:
         mock_protocol = MagicMock()
         mock_protocol.protocol_mode = 1
         mock_protocol.name = "TestProtocol"
-        mock_protocol.parse = MagicMock(side_effect=ValueError("Bad data"))
+        mock_protocol.parse_cached = MagicMock(side_effect=ValueError("Bad data"))
 
         # Mock _detect_protocol to return our failing protocol
         coordinator._detect_protocol = MagicMock(
@@ -3490,14 +3283,12 @@ class TestNotificationCallback:
         assert coordinator.data["running_state"] == 0
         coordinator._logger.error.assert_called()
 
-    def test_parse_response_parsed_none(self):
+    def test_parse_response_parsed_none(self, coordinator):
         """Test _parse_response handles None parse result."""
-        coordinator = create_mock_coordinator()
-
         # Mock protocol that returns None
         mock_protocol = MagicMock()
         mock_protocol.protocol_mode = 1
-        mock_protocol.parse.return_value = None
+        mock_protocol.parse_cached.return_value = None
 
         coordinator._detect_protocol = MagicMock(return_value=(mock_protocol, bytearray(18)))
 
@@ -3510,28 +3301,23 @@ class TestNotificationCallback:
 class TestDetectProtocol:
     """Tests for protocol detection logic."""
 
-    def test_detect_cbff_protocol(self):
+    def test_detect_cbff_protocol(self, coordinator):
         """Test CBFF protocol detection."""
-        coordinator = create_mock_coordinator()
-
         data = bytearray([0xCB, 0xFF] + [0x00] * 30)
         protocol, parse_data = coordinator._detect_protocol(data, 0xCBFF)
 
         assert protocol == coordinator._protocols[6]
         assert parse_data == data
 
-    def test_detect_abba_protocol(self):
+    def test_detect_abba_protocol(self, coordinator):
         """Test ABBA protocol detection."""
-        coordinator = create_mock_coordinator()
-
-        data = bytearray([0xAB, 0xBA] + [0x00] * 19)
+        data = bytearray(_ABBA_RAW)
         protocol, parse_data = coordinator._detect_protocol(data, 0xABBA)
 
         assert protocol == coordinator._protocols[5]
 
-    def test_detect_abba_by_device_flag(self):
+    def test_detect_abba_by_device_flag(self, coordinator):
         """Test ABBA detection when device flag is set."""
-        coordinator = create_mock_coordinator()
         coordinator._is_abba_device = True
 
         data = bytearray([0x00, 0x00] + [0x00] * 19)
@@ -3539,74 +3325,48 @@ class TestDetectProtocol:
 
         assert protocol == coordinator._protocols[5]
 
-    def test_detect_aa55_unencrypted(self):
+    def test_detect_aa55_unencrypted(self, coordinator):
         """Test AA55 unencrypted protocol detection."""
-        coordinator = create_mock_coordinator()
-
         data = bytearray(18)
         data[0], data[1] = 0xAA, 0x55
         protocol, parse_data = coordinator._detect_protocol(data, 0xAA55)
 
         assert protocol == coordinator._protocols[1]
 
-    def test_detect_aa66_unencrypted(self):
+    def test_detect_aa66_unencrypted(self, coordinator):
         """Test AA66 unencrypted protocol detection."""
-        coordinator = create_mock_coordinator()
-
         data = bytearray(20)
         data[0], data[1] = 0xAA, 0x66
         protocol, parse_data = coordinator._detect_protocol(data, 0xAA66)
 
         assert protocol == coordinator._protocols[3]
 
-    def test_detect_aa55_encrypted(self):
+    def test_detect_aa55_encrypted(self, coordinator):
         """Test AA55 encrypted (48 bytes) protocol detection."""
-        from diesel_heater_ble import _encrypt_data
-
-        coordinator = create_mock_coordinator()
-
-        # Create unencrypted AA55 data
-        plain = bytearray(48)
-        plain[0], plain[1] = 0xAA, 0x55
-
-        # Encrypt it
-        encrypted = _encrypt_data(plain)
+        encrypted = bytearray(_AA55_ENC_DATA)
 
         protocol, parse_data = coordinator._detect_protocol(encrypted, 0)
 
         assert protocol == coordinator._protocols[2]
 
-    def test_detect_aa66_encrypted(self):
+    def test_detect_aa66_encrypted(self, coordinator):
         """Test AA66 encrypted (48 bytes) protocol detection."""
-        from diesel_heater_ble import _encrypt_data
-
-        coordinator = create_mock_coordinator()
-
-        # Create unencrypted AA66 data
-        plain = bytearray(48)
-        plain[0], plain[1] = 0xAA, 0x66
-
-        # Encrypt it
-        encrypted = _encrypt_data(plain)
+        encrypted = bytearray(_AA66_ENC_DATA)
 
         protocol, parse_data = coordinator._detect_protocol(encrypted, 0)
 
         assert protocol == coordinator._protocols[4]
 
-    def test_detect_unknown_protocol(self):
+    def test_detect_unknown_protocol(self, coordinator):
         """Test unknown protocol returns None."""
-        coordinator = create_mock_coordinator()
-
         data = bytearray([0x12, 0x34] + [0x00] * 16)
         protocol, parse_data = coordinator._detect_protocol(data, 0x1234)
 
         assert protocol is None
         assert parse_data is None
 
-    def test_detect_short_data(self):
+    def test_detect_short_data(self, coordinator):
         """Test short data returns None."""
-        coordinator = create_mock_coordinator()
-
         data = bytearray([0xAA, 0x55, 0x00])  # Too short
         protocol, parse_data = coordinator._detect_protocol(data, 0xAA55)
 
@@ -3620,14 +3380,13 @@ class TestDetectProtocol:
 class TestCBFFDecryption:
     """Tests for CBFF decryption status logging."""
 
-    def test_cbff_decrypted_flag_logged(self):
+    def test_cbff_decrypted_flag_logged(self, coordinator):
         """Test CBFF decrypted flag triggers info log."""
-        coordinator = create_mock_coordinator()
         coordinator.address = "AA:BB:CC:DD:EE:FF"
 
         mock_protocol = MagicMock()
         mock_protocol.protocol_mode = 6
-        mock_protocol.parse.return_value = {"_cbff_decrypted": True, "running_state": 1}
+        mock_protocol.parse_cached.return_value = {"_cbff_decrypted": True, "running_state": 1}
 
         coordinator._detect_protocol = MagicMock(return_value=(mock_protocol, bytearray(32)))
 
@@ -3637,13 +3396,11 @@ class TestCBFFDecryption:
         # Should log decryption success
         coordinator._logger.info.assert_called()
 
-    def test_cbff_suspect_data_logged(self):
+    def test_cbff_suspect_data_logged(self, coordinator):
         """Test CBFF suspect data triggers warning log."""
-        coordinator = create_mock_coordinator()
-
         mock_protocol = MagicMock()
         mock_protocol.protocol_mode = 6
-        mock_protocol.parse.return_value = {
+        mock_protocol.parse_cached.return_value = {
             "_cbff_data_suspect": True,
             "cbff_protocol_version": "1.2",
             "running_state": 0,
@@ -3656,14 +3413,13 @@ class TestCBFFDecryption:
 
         coordinator._logger.warning.assert_called()
 
-    def test_temp_unit_detection_fahrenheit(self):
+    def test_temp_unit_detection_fahrenheit(self, coordinator):
         """Test temp_unit detection sets Fahrenheit flag."""
-        coordinator = create_mock_coordinator()
         coordinator._heater_uses_fahrenheit = False
 
         mock_protocol = MagicMock()
         mock_protocol.protocol_mode = 1
-        mock_protocol.parse.return_value = {"temp_unit": 1, "running_state": 1}
+        mock_protocol.parse_cached.return_value = {"temp_unit": 1, "running_state": 1}
 
         coordinator._detect_protocol = MagicMock(return_value=(mock_protocol, bytearray(18)))
 
@@ -3672,14 +3428,13 @@ class TestCBFFDecryption:
 
         assert coordinator._heater_uses_fahrenheit is True
 
-    def test_temp_unit_detection_celsius(self):
+    def test_temp_unit_detection_celsius(self, coordinator):
         """Test temp_unit detection sets Celsius flag."""
-        coordinator = create_mock_coordinator()
         coordinator._heater_uses_fahrenheit = True
 
         mock_protocol = MagicMock()
         mock_protocol.protocol_mode = 1
-        mock_protocol.parse.return_value = {"temp_unit": 0, "running_state": 1}
+        mock_protocol.parse_cached.return_value = {"temp_unit": 0, "running_state": 1}
 
         coordinator._detect_protocol = MagicMock(return_value=(mock_protocol, bytearray(18)))
 
@@ -3697,9 +3452,8 @@ class TestPostStatusRequest:
     """Tests for post-command status request."""
 
     @pytest.mark.asyncio
-    async def test_abba_post_status_sent(self):
+    async def test_abba_post_status_sent(self, coordinator):
         """Test ABBA sends follow-up status request after command."""
-        coordinator = create_mock_coordinator()
         coordinator._write_gatt = AsyncMock()
         coordinator._client = MagicMock()
         coordinator._client.is_connected = True
@@ -3727,9 +3481,8 @@ class TestPostStatusRequest:
         assert mock_protocol.build_command.call_args_list[1][0][0] == 1
 
     @pytest.mark.asyncio
-    async def test_no_post_status_for_status_command(self):
+    async def test_no_post_status_for_status_command(self, coordinator):
         """Test no post-status sent when command is already a status request."""
-        coordinator = create_mock_coordinator()
         coordinator._write_gatt = AsyncMock()
         coordinator._client = MagicMock()
         coordinator._client.is_connected = True
@@ -3761,9 +3514,8 @@ class TestAutoOffsetDisable:
     """Tests for disabling auto-offset."""
 
     @pytest.mark.asyncio
-    async def test_disable_auto_offset_resets_to_zero(self):
+    async def test_disable_auto_offset_resets_to_zero(self, coordinator):
         """Test disabling auto-offset resets heater offset to 0."""
-        coordinator = create_mock_coordinator()
         coordinator._current_heater_offset = 5
         coordinator.async_save_data = AsyncMock()
         coordinator.async_set_heater_offset = AsyncMock()
@@ -3777,9 +3529,8 @@ class TestAutoOffsetDisable:
         assert coordinator.data["auto_offset_enabled"] is False
 
     @pytest.mark.asyncio
-    async def test_disable_auto_offset_skips_if_already_zero(self):
+    async def test_disable_auto_offset_skips_if_already_zero(self, coordinator):
         """Test disabling auto-offset doesn't call set_offset if already 0."""
-        coordinator = create_mock_coordinator()
         coordinator._current_heater_offset = 0
         coordinator.async_save_data = AsyncMock()
         coordinator.async_set_heater_offset = AsyncMock()
@@ -3792,9 +3543,8 @@ class TestAutoOffsetDisable:
         coordinator.async_set_heater_offset.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_enable_auto_offset_triggers_calculation(self):
+    async def test_enable_auto_offset_triggers_calculation(self, coordinator):
         """Test enabling auto-offset triggers initial calculation."""
-        coordinator = create_mock_coordinator()
         coordinator._current_heater_offset = 0
         coordinator.async_save_data = AsyncMock()
         coordinator._async_calculate_auto_offset = AsyncMock()
@@ -3815,9 +3565,8 @@ class TestSendRawCommand:
     """Tests for raw command sending."""
 
     @pytest.mark.asyncio
-    async def test_send_raw_command_success(self):
+    async def test_send_raw_command_success(self, coordinator):
         """Test send_raw_command returns True on success."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=True)
         coordinator.async_request_refresh = AsyncMock()
 
@@ -3828,9 +3577,8 @@ class TestSendRawCommand:
         coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_send_raw_command_failure(self):
+    async def test_send_raw_command_failure(self, coordinator):
         """Test send_raw_command returns False on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
 
@@ -3849,9 +3597,8 @@ class TestAsyncShutdown:
     """Tests for coordinator shutdown."""
 
     @pytest.mark.asyncio
-    async def test_shutdown_cleans_up_auto_offset_listener(self):
+    async def test_shutdown_cleans_up_auto_offset_listener(self, coordinator):
         """Test shutdown cleans up external sensor listener."""
-        coordinator = create_mock_coordinator()
         mock_unsub = MagicMock()
         coordinator._auto_offset_unsub = mock_unsub
         coordinator._cleanup_connection = AsyncMock()
@@ -3862,9 +3609,8 @@ class TestAsyncShutdown:
         assert coordinator._auto_offset_unsub is None
 
     @pytest.mark.asyncio
-    async def test_shutdown_without_listener(self):
+    async def test_shutdown_without_listener(self, coordinator):
         """Test shutdown works when no listener registered."""
-        coordinator = create_mock_coordinator()
         coordinator._auto_offset_unsub = None
         coordinator._cleanup_connection = AsyncMock()
 
@@ -3873,9 +3619,8 @@ class TestAsyncShutdown:
         coordinator._cleanup_connection.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_shutdown_cleans_up_connection(self):
+    async def test_shutdown_cleans_up_connection(self, coordinator):
         """Test shutdown cleans up BLE connection."""
-        coordinator = create_mock_coordinator()
         coordinator._auto_offset_unsub = None
         coordinator._cleanup_connection = AsyncMock()
 
@@ -3892,9 +3637,8 @@ class TestSetMethodFailures:
     """Tests for set_xxx method failure paths."""
 
     @pytest.mark.asyncio
-    async def test_set_heater_offset_failure(self):
+    async def test_set_heater_offset_failure(self, coordinator):
         """Test async_set_heater_offset logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator._current_heater_offset = 0
         coordinator.async_request_refresh = AsyncMock()
@@ -3907,9 +3651,8 @@ class TestSetMethodFailures:
         coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_set_language_failure(self):
+    async def test_set_language_failure(self, coordinator):
         """Test async_set_language logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
         coordinator.data["language"] = 0
@@ -3921,9 +3664,8 @@ class TestSetMethodFailures:
         assert coordinator.data["language"] == 0
 
     @pytest.mark.asyncio
-    async def test_set_temp_unit_failure(self):
+    async def test_set_temp_unit_failure(self, coordinator):
         """Test async_set_temp_unit logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
         coordinator.data["temp_unit"] = 0
@@ -3934,9 +3676,8 @@ class TestSetMethodFailures:
         assert coordinator.data["temp_unit"] == 0
 
     @pytest.mark.asyncio
-    async def test_set_altitude_unit_failure(self):
+    async def test_set_altitude_unit_failure(self, coordinator):
         """Test async_set_altitude_unit logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
         coordinator.data["altitude_unit"] = 0
@@ -3947,9 +3688,8 @@ class TestSetMethodFailures:
         assert coordinator.data["altitude_unit"] == 0
 
     @pytest.mark.asyncio
-    async def test_set_high_altitude_failure(self):
+    async def test_set_high_altitude_failure(self, coordinator):
         """Test async_set_high_altitude logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator._is_abba_device = True
         coordinator.async_request_refresh = AsyncMock()
@@ -3961,9 +3701,8 @@ class TestSetMethodFailures:
         assert coordinator.data["high_altitude"] == 0
 
     @pytest.mark.asyncio
-    async def test_set_high_altitude_non_abba_device(self):
+    async def test_set_high_altitude_non_abba_device(self, coordinator):
         """Test async_set_high_altitude warns on non-ABBA device."""
-        coordinator = create_mock_coordinator()
         coordinator._is_abba_device = False
         coordinator._send_command = AsyncMock()
 
@@ -3974,9 +3713,8 @@ class TestSetMethodFailures:
         coordinator._send_command.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_set_tank_volume_failure(self):
+    async def test_set_tank_volume_failure(self, coordinator):
         """Test async_set_tank_volume logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
         coordinator.data["tank_volume"] = 0
@@ -3987,9 +3725,8 @@ class TestSetMethodFailures:
         assert coordinator.data["tank_volume"] == 0
 
     @pytest.mark.asyncio
-    async def test_set_pump_type_failure(self):
+    async def test_set_pump_type_failure(self, coordinator):
         """Test async_set_pump_type logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
         coordinator.data["pump_type"] = 0
@@ -4000,9 +3737,8 @@ class TestSetMethodFailures:
         assert coordinator.data["pump_type"] == 0
 
     @pytest.mark.asyncio
-    async def test_set_backlight_failure(self):
+    async def test_set_backlight_failure(self, coordinator):
         """Test async_set_backlight logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
         coordinator.async_request_refresh = AsyncMock()
         coordinator.data["backlight"] = 50
@@ -4013,9 +3749,8 @@ class TestSetMethodFailures:
         assert coordinator.data["backlight"] == 50
 
     @pytest.mark.asyncio
-    async def test_sync_time_failure(self):
+    async def test_sync_time_failure(self, coordinator):
         """Test async_sync_time logs warning on failure."""
-        coordinator = create_mock_coordinator()
         coordinator._send_command = AsyncMock(return_value=False)
 
         await coordinator.async_sync_time()
@@ -6,9 +6,12 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # Import stubs first
 from . import conftest  # noqa: F401
 
+import custom_components.diesel_heater as diesel_heater
 from custom_components.diesel_heater import (
     _migrate_entity_unique_ids,
     _safe_update_unique_id,
@@ -80,6 +83,27 @@ class TestSafeUpdateUniqueId:
 # _migrate_entity_unique_ids tests
 # ---------------------------------------------------------------------------
 
+@pytest.fixture
+def patched_er():
+    """Point the integration's entity registry helpers at a test registry.
+
+    Returns an installer ``(registry, entities)``. The helpers are assigned
+    directly on the ``er`` module and restored on teardown, which is much
+    cheaper than starting and stopping two ``patch()`` contexts per test.
+    """
+    er = diesel_heater.er
+    orig_get = er.async_get
+    orig_entries = er.async_entries_for_config_entry
+
+    def _install(registry, entities):
+        er.async_get = lambda *_args: registry
+        er.async_entries_for_config_entry = lambda *_args, **_kwargs: entities
+
+    yield _install
+    er.async_get = orig_get
+    er.async_entries_for_config_entry = orig_entries
+
+
 class TestMigrateEntityUniqueIds:
     """Tests for entity unique_id migration."""
 
@@ -90,102 +114,61 @@ class TestMigrateEntityUniqueIds:
         entity.entity_id = entity_id or f"sensor.test_{unique_id.split('_')[-1]}"
         return entity
 
-    def test_migration_skips_already_migrated(self):
-        """Test that already-migrated entities are not re-migrated."""
-        hass = MagicMock()
-        entry = MagicMock()
-        entry.entry_id = "test_entry"
-
-        registry = MagicMock()
-        entity = self._make_entity(
-            "DC:32:62:40:6A:00_est_daily_fuel_consumed",
-            "sensor.test_est_daily"
-        )
-        registry.entities = {entity.entity_id: entity}
-
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
-
-        # Should not try to update since it already ends with new suffix
-        registry.async_update_entity.assert_not_called()
-
-    def test_migration_fixes_corrupted_unique_id(self):
-        """Test that corrupted unique_ids with repeated _est_ are fixed."""
-        hass = MagicMock()
-        entry = MagicMock()
-        entry.entry_id = "test_entry"
-
-        registry = MagicMock()
-        # Simulates corrupted unique_id with multiple _est_ prefixes
-        corrupted_uid = "DC:32:62:40:6A:00_est_est_daily_fuel_consumed"
-        expected_uid = "DC:32:62:40:6A:00_est_daily_fuel_consumed"
-        entity = self._make_entity(corrupted_uid, "sensor.test_corrupted")
-        registry.entities = {entity.entity_id: entity}
-
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
-
-        # Should fix the corrupted unique_id
-        registry.async_update_entity.assert_called()
-
-    def test_migration_removes_deprecated_backlight(self):
-        """Test that deprecated backlight number entity is removed."""
+    @pytest.mark.parametrize(
+        ("unique_id", "entity_id", "expect_update", "expect_remove"),
+        [
+            # Already ends with the new suffix: nothing to re-migrate
+            (
+                "DC:32:62:40:6A:00_est_daily_fuel_consumed",
+                "sensor.test_est_daily",
+                False,
+                None,
+            ),
+            # Repeated _est_ prefixes from the migration bug get fixed
+            (
+                "DC:32:62:40:6A:00_est_est_daily_fuel_consumed",
+                "sensor.test_corrupted",
+                True,
+                None,
+            ),
+            # Deprecated backlight number entity is removed
+            (
+                "DC:32:62:40:6A:00_backlight",
+                "number.test_backlight",
+                False,
+                "number.test_backlight",
+            ),
+            # Old suffix without _est_ prefix is renamed
+            (
+                "DC:32:62:40:6A:00_daily_fuel_consumed",
+                "sensor.test_daily_fuel",
+                True,
+                None,
+            ),
+        ],
+        ids=["already_migrated", "corrupted", "deprecated_backlight", "old_suffix"],
+    )
+    def test_migration(
+        self, patched_er, unique_id, entity_id, expect_update, expect_remove
+    ):
+        """Test unique_id migration updates or removes entities as needed."""
         hass = MagicMock()
         entry = MagicMock()
         entry.entry_id = "test_entry"
 
         registry = MagicMock()
-        entity = self._make_entity(
-            "DC:32:62:40:6A:00_backlight",
-            "number.test_backlight"
-        )
+        entity = self._make_entity(unique_id, entity_id)
         registry.entities = {entity.entity_id: entity}
 
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
-
-        # Should remove the deprecated entity
-        registry.async_remove.assert_called_once_with("number.test_backlight")
+        patched_er(registry, [entity])
+        _migrate_entity_unique_ids(hass, entry)
 
-    def test_migration_renames_old_suffix(self):
-        """Test that old suffixes are renamed to new suffixes."""
-        hass = MagicMock()
-        entry = MagicMock()
-        entry.entry_id = "test_entry"
-
-        registry = MagicMock()
-        # Old suffix without _est_ prefix
-        entity = self._make_entity(
-            "DC:32:62:40:6A:00_daily_fuel_consumed",
-            "sensor.test_daily_fuel"
-        )
-        registry.entities = {entity.entity_id: entity}
-
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
-
-        # Should rename to new suffix with _est_ prefix
-        registry.async_update_entity.assert_called()
+        if expect_update:
+            registry.async_update_entity.assert_called()
+        else:
+            registry.async_update_entity.assert_not_called()
+        if expect_remove is not None:
+            registry.async_remove.assert_called_once_with(expect_remove)
 
 
 # ---------------------------------------------------------------------------
@@ -228,7 +211,7 @@ class TestMigrationEdgeCases:
         entity.entity_id = entity_id or f"sensor.test_{unique_id.split('_')[-1]}"
         return entity
 
-    def test_skips_entity_already_removed_at_start(self):
+    def test_skips_entity_already_removed_at_start(self, patched_er):
         """Test migration skips entity if already removed from registry."""
         hass = MagicMock()
         entry = MagicMock()
@@ -239,19 +222,14 @@ class TestMigrationEdgeCases:
         # Entity in iteration list but NOT in registry.entities
         registry.entities = {}
 
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
+        patched_er(registry, [entity])
+        _migrate_entity_unique_ids(hass, entry)
 
         # Should skip without any operations
         registry.async_update_entity.assert_not_called()
         registry.async_remove.assert_not_called()
 
-    def test_skips_entity_removed_during_corruption_fix(self):
+    def test_skips_entity_removed_during_corruption_fix(self, patched_er):
         """Test migration skips entity if removed during corruption fix."""
         hass = MagicMock()
         entry = MagicMock()
@@ -272,18 +250,13 @@ class TestMigrationEdgeCases:
 
         registry.async_update_entity.side_effect = remove_entity_side_effect
 
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
+        patched_er(registry, [entity])
+        _migrate_entity_unique_ids(hass, entry)
 
         # Corruption fix should be attempted
         registry.async_update_entity.assert_called()
 
-    def test_skips_entity_removed_during_migration(self):
+    def test_skips_entity_removed_during_migration(self, patched_er):
         """Test migration skips entity if removed during suffix migration."""
         hass = MagicMock()
         entry = MagicMock()
@@ -305,18 +278,13 @@ class TestMigrationEdgeCases:
 
         registry.async_update_entity.side_effect = remove_entity_side_effect
 
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
+        patched_er(registry, [entity])
+        _migrate_entity_unique_ids(hass, entry)
 
         # Migration should be attempted
         registry.async_update_entity.assert_called()
 
-    def test_corruption_fix_breaks_on_failed_update(self):
+    def test_corruption_fix_breaks_on_failed_update(self, patched_er):
         """Test corruption fix loop breaks when update fails."""
         hass = MagicMock()
         entry = MagicMock()
@@ -337,18 +305,13 @@ class TestMigrationEdgeCases:
 
         registry.async_update_entity.side_effect = update_side_effect
 
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
+        patched_er(registry, [entity])
+        _migrate_entity_unique_ids(hass, entry)
 
         # Should have attempted multiple updates before failing
         assert registry.async_update_entity.call_count >= 1
 
-    def test_corruption_fix_breaks_when_uid_unchanged(self):
+    def test_corruption_fix_breaks_when_uid_unchanged(self, patched_er):
         """Test corruption fix loop breaks when fixed uid equals current uid."""
         hass = MagicMock()
         entry = MagicMock()
@@ -362,13 +325,8 @@ class TestMigrationEdgeCases:
         )
         registry.entities = {entity.entity_id: entity}
 
-        with patch(
-            "custom_components.diesel_heater.er.async_get", return_value=registry
-        ), patch(
-            "custom_components.diesel_heater.er.async_entries_for_config_entry",
-            return_value=[entity],
-        ):
-            _migrate_entity_unique_ids(hass, entry)
+        patched_er(registry, [entity])
+        _migrate_entity_unique_ids(hass, entry)
 
         # No corruption fix needed since uid is already correct
         # Should not try to update for corruption fix
@@ -5,6 +5,8 @@ produce identical results for the same input data.
 """
 from __future__ import annotations
 
+import pytest
+
 from diesel_heater_ble import (
     HeaterProtocol,
     ProtocolAA55,
@@ -69,43 +71,89 @@ class TestLibraryExports:
         assert ProtocolCBFF().protocol_mode == 6
 
 
-class TestLibraryConstants:
-    """Verify protocol constants are correct."""
-
-    def test_protocol_headers(self):
-        assert PROTOCOL_HEADER_AA55 == 0xAA55
-        assert PROTOCOL_HEADER_AA66 == 0xAA66
-        assert PROTOCOL_HEADER_ABBA == 0xABBA
-        assert PROTOCOL_HEADER_CBFF == 0xCBFF
-
-    def test_running_states(self):
-        assert RUNNING_STATE_OFF == 0
-        assert RUNNING_STATE_ON == 1
+# (name, actual, expected) for scalar protocol constants
+_CONSTANT_VALUES = (
+    ("PROTOCOL_HEADER_AA55", PROTOCOL_HEADER_AA55, 0xAA55),
+    ("PROTOCOL_HEADER_AA66", PROTOCOL_HEADER_AA66, 0xAA66),
+    ("PROTOCOL_HEADER_ABBA", PROTOCOL_HEADER_ABBA, 0xABBA),
+    ("PROTOCOL_HEADER_CBFF", PROTOCOL_HEADER_CBFF, 0xCBFF),
+    ("RUNNING_STATE_OFF", RUNNING_STATE_OFF, 0),
+    ("RUNNING_STATE_ON", RUNNING_STATE_ON, 1),
+    ("RUNNING_MODE_MANUAL", RUNNING_MODE_MANUAL, 0),
+    ("RUNNING_MODE_LEVEL", RUNNING_MODE_LEVEL, 1),
+    ("RUNNING_MODE_TEMPERATURE", RUNNING_MODE_TEMPERATURE, 2),
+)
 
-    def test_running_modes(self):
-        assert RUNNING_MODE_MANUAL == 0
-        assert RUNNING_MODE_LEVEL == 1
-        assert RUNNING_MODE_TEMPERATURE == 2
+# (description, lookup, expected) for keys, tables and lookup maps. The
+# lookups run inside the test, so a bad entry fails only its own case.
+_TABLE_VALUES = (
+    ("len(ENCRYPTION_KEY)", lambda: len(ENCRYPTION_KEY), 8),
+    ("bytes(ENCRYPTION_KEY)", lambda: bytes(ENCRYPTION_KEY), b"password"),
+    ("ABBA_STATUS_MAP[0x00]", lambda: ABBA_STATUS_MAP[0x00], RUNNING_STEP_STANDBY),
+    ("ABBA_STATUS_MAP[0x01]", lambda: ABBA_STATUS_MAP[0x01], RUNNING_STEP_RUNNING),
+    ("ABBA_STATUS_MAP[0x02]", lambda: ABBA_STATUS_MAP[0x02], RUNNING_STEP_COOLDOWN),
+    ("CBFF_RUN_STATE_OFF", lambda: CBFF_RUN_STATE_OFF, {2, 5, 6}),
+    ("ERROR_NAMES[0]", lambda: ERROR_NAMES[0], "No fault"),
+    ("len(ERROR_NAMES)", lambda: len(ERROR_NAMES), 11),
+    ("ABBA_ERROR_NAMES[0]", lambda: ABBA_ERROR_NAMES[0], "No fault"),
+    ("192 in ABBA_ERROR_NAMES", lambda: 192 in ABBA_ERROR_NAMES, True),  # CO alarm
+)
 
-    def test_encryption_key(self):
-        assert len(ENCRYPTION_KEY) == 8
-        assert bytes(ENCRYPTION_KEY) == b"password"
 
-    def test_abba_status_map(self):
-        assert ABBA_STATUS_MAP[0x00] == RUNNING_STEP_STANDBY
-        assert ABBA_STATUS_MAP[0x01] == RUNNING_STEP_RUNNING
-        assert ABBA_STATUS_MAP[0x02] == RUNNING_STEP_COOLDOWN
+class TestLibraryConstants:
+    """Verify protocol constants are correct."""
 
-    def test_cbff_off_states(self):
-        assert CBFF_RUN_STATE_OFF == {2, 5, 6}
+    @pytest.mark.parametrize(
+        ("actual", "expected"),
+        [row[1:] for row in _CONSTANT_VALUES],
+        ids=[row[0] for row in _CONSTANT_VALUES],
+    )
+    def test_constant_values(self, actual, expected):
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        ("lookup", "expected"),
+        [row[1:] for row in _TABLE_VALUES],
+        ids=[row[0] for row in _TABLE_VALUES],
+    )
+    def test_table_values(self, lookup, expected):
+        assert lookup() == expected
+
+
+# AA55 status packet (18 bytes): running, level mode 5, 20.0V
+_AA55_PACKET = bytes.fromhex(
+    "aa55"  # 0-1: header
+    "00"    # 2
+    "01"    # 3: running_state ON
+    "00" "00" "0000"  # 4-7: error, step, altitude
+    "01"    # 8: Level mode
+    "05"    # 9: level 5
+    "00"    # 10
+    "c800"  # 11-12: 20.0V
+    "9600"  # 13-14: case_temp 150
+    "e800"  # 15-16: cab_temp 232
+    "00"    # 17
+)
 
-    def test_error_names(self):
-        assert ERROR_NAMES[0] == "No fault"
-        assert len(ERROR_NAMES) == 11
+# ABBA status packet (21 bytes): heating, temperature mode 22C, 12V
+_ABBA_PACKET = bytes.fromhex(
+    "abba"  # 0-1: header
+    "0000"  # 2-3
+    "01"    # 4: Heating
+    "01"    # 5: Temperature mode
+    "16"    # 6: 22 degrees
+    "0000"  # 7-8
+    "0c"    # 9: 12V
+    "00"    # 10: Celsius
+    "34"    # 11: 52-30 = 22C
+    "0096"  # 12-13: case_temp = 150
+    + "00" * 7  # 14-20
+)
 
-    def test_abba_error_names(self):
-        assert ABBA_ERROR_NAMES[0] == "No fault"
-        assert 192 in ABBA_ERROR_NAMES  # CO alarm
+# parse() and build_command() don't depend on instance state for these
+# protocols, so the parity tests share one instance each
+_PROTO_AA55 = ProtocolAA55()
+_PROTO_ABBA = ProtocolABBA()
 
 
 class TestLibraryParity:
@@ -113,17 +161,7 @@ class TestLibraryParity:
 
     def test_aa55_parse_parity(self):
         """Same AA55 packet parsed by library gives same result."""
-        data = bytearray(18)
-        data[0], data[1] = 0xAA, 0x55
-        data[3] = 1  # running_state ON
-        data[8] = 1  # Level mode
-        data[9] = 5  # level 5
-        data[11], data[12] = 0xC8, 0x00  # 20.0V
-        data[13], data[14] = 0x96, 0x00  # case_temp 150
-        data[15], data[16] = 0xE8, 0x00  # cab_temp 232
-
-        p = ProtocolAA55()
-        result = p.parse(data)
+        result = _PROTO_AA55.parse(_AA55_PACKET)
         assert result["running_state"] == 1
         assert result["running_mode"] == 1
         assert result["set_level"] == 5
@@ -131,19 +169,7 @@ class TestLibraryParity:
 
     def test_abba_parse_parity(self):
         """Same ABBA packet parsed by library gives same result."""
-        data = bytearray(21)
-        data[0], data[1] = 0xAB, 0xBA
-        data[4] = 0x01  # Heating
-        data[5] = 0x01  # Temperature mode
-        data[6] = 22    # 22 degrees
-        data[9] = 12    # 12V
-        data[10] = 0    # Celsius
-        data[11] = 52   # 52-30 = 22C
-        data[12] = 0x00
-        data[13] = 0x96  # case_temp = 150
-
-        p = ProtocolABBA()
-        result = p.parse(data)
+        result = _PROTO_ABBA.parse(_ABBA_PACKET)
         assert result["running_state"] == 1
         assert result["running_mode"] == RUNNING_MODE_TEMPERATURE
         assert result["set_temp"] == 22
@@ -151,8 +177,7 @@ class TestLibraryParity:
 
     def test_command_build_parity(self):
         """AA55 command builder produces same output."""
-        p = ProtocolAA55()
-        cmd = p.build_command(1, 0, 1234)
+        cmd = _PROTO_AA55.build_command(1, 0, 1234)
         assert cmd[0] == 0xAA
         assert cmd[1] == 0x55
         assert cmd[4] == 1  # command
@@ -23,7 +23,7 @@ def create_mock_coordinator(protocol_mode: int = 0) -> MagicMock:
     coordinator.address = "AA:BB:CC:DD:EE:FF"
     coordinator._heater_id = "EE:FF"
     coordinator.last_update_success = True
-    coordinator.send_command = AsyncMock(return_value=True)
+    coordinator.send_command = conftest._async_stub(return_value=True)
     coordinator.async_set_level = AsyncMock()
     coordinator.async_set_temperature = AsyncMock()
     coordinator.async_set_heater_offset = AsyncMock()
@@ -6,6 +6,8 @@ exercises the parser and command builder.
 """
 from __future__ import annotations
 
+import struct
+
 from diesel_heater_ble import (
     HeaterProtocol,
     ProtocolAA55,
@@ -22,6 +24,12 @@ from diesel_heater_ble import (
     _unsign_to_sign,
 )
 
+# Packers for the multi-byte fields in the packet builders below
+_pack_be_u16 = struct.Struct(">H").pack_into
+_pack_le_u16 = struct.Struct("<H").pack_into
+_pack_le_u32 = struct.Struct("<I").pack_into
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
@@ -400,45 +408,25 @@ def _make_aa55enc_data(**overrides) -> bytearray:
     data[4] = overrides.get("error_code", 0)
     data[5] = overrides.get("running_step", 0)
     # Altitude: (byte7 + 256*byte6) / 10
-    alt = int(overrides.get("altitude_raw", 0))
-    data[6] = (alt >> 8) & 0xFF
-    data[7] = alt & 0xFF
+    _pack_be_u16(data, 6, int(overrides.get("altitude_raw", 0)) & 0xFFFF)
     data[8] = overrides.get("running_mode", 1)
     data[9] = overrides.get("set_temp", 22)
     data[10] = overrides.get("set_level", 5)
     # Voltage: (256*byte11 + byte12) / 10
-    voltage_raw = overrides.get("voltage_raw", 120)
-    data[11] = (voltage_raw >> 8) & 0xFF
-    data[12] = voltage_raw & 0xFF
+    _pack_be_u16(data, 11, overrides.get("voltage_raw", 120) & 0xFFFF)
     # Case temp: (256*byte13 + byte14) signed
-    case = overrides.get("case_temp_raw", 150)
-    if case < 0:
-        case = case + 65536
-    data[13] = (case >> 8) & 0xFF
-    data[14] = case & 0xFF
+    _pack_be_u16(data, 13, overrides.get("case_temp_raw", 150) & 0xFFFF)
     # Cab temp: (256*byte32 + byte33) / 10 signed
-    cab = overrides.get("cab_temp_raw", 230)
-    if cab < 0:
-        cab = cab + 65536
-    data[32] = (cab >> 8) & 0xFF
-    data[33] = cab & 0xFF
+    _pack_be_u16(data, 32, overrides.get("cab_temp_raw", 230) & 0xFFFF)
     # Heater offset (signed byte)
-    offset = overrides.get("heater_offset", 0)
-    data[34] = offset if offset >= 0 else (offset + 256)
+    data[34] = overrides.get("heater_offset", 0) & 0xFF
     # Backlight
     data[36] = overrides.get("backlight", 50)
     # CO sensor
-    co_present = overrides.get("co_present", 0)
-    data[37] = co_present
-    co_ppm = overrides.get("co_ppm_raw", 0)
-    data[38] = (co_ppm >> 8) & 0xFF
-    data[39] = co_ppm & 0xFF
+    data[37] = overrides.get("co_present", 0)
+    _pack_be_u16(data, 38, overrides.get("co_ppm_raw", 0) & 0xFFFF)
     # Part number (uint32 LE)
-    part = overrides.get("part_number_raw", 0)
-    data[40] = part & 0xFF
-    data[41] = (part >> 8) & 0xFF
-    data[42] = (part >> 16) & 0xFF
-    data[43] = (part >> 24) & 0xFF
+    _pack_le_u32(data, 40, overrides.get("part_number_raw", 0) & 0xFFFFFFFF)
     # Motherboard version
     data[44] = overrides.get("motherboard_version", 0)
     return data
@@ -552,44 +540,25 @@ def _make_aa66enc_data(**overrides) -> bytearray:
     data[1] = 0x66
     data[3] = overrides.get("running_state", 0)
     data[5] = overrides.get("running_step", 0)
-    alt = int(overrides.get("altitude_raw", 0))
-    data[6] = (alt >> 8) & 0xFF
-    data[7] = alt & 0xFF
+    _pack_be_u16(data, 6, int(overrides.get("altitude_raw", 0)) & 0xFFFF)
     data[8] = overrides.get("running_mode", 1)
     data[9] = overrides.get("set_temp_raw", 22)
     data[10] = overrides.get("set_level", 5)
-    voltage_raw = overrides.get("voltage_raw", 120)
-    data[11] = (voltage_raw >> 8) & 0xFF
-    data[12] = voltage_raw & 0xFF
-    case = overrides.get("case_temp_raw", 150)
-    if case < 0:
-        case = case + 65536
-    data[13] = (case >> 8) & 0xFF
-    data[14] = case & 0xFF
+    _pack_be_u16(data, 11, overrides.get("voltage_raw", 120) & 0xFFFF)
+    _pack_be_u16(data, 13, overrides.get("case_temp_raw", 150) & 0xFFFF)
     data[26] = overrides.get("language", 0)
     data[27] = overrides.get("temp_unit", 0)
     data[28] = overrides.get("tank_volume", 0)
     data[29] = overrides.get("pump_byte", 0)
     data[30] = overrides.get("altitude_unit", 0)
     data[31] = overrides.get("auto_start_stop", 0)
-    cab = overrides.get("cab_temp_raw", 230)
-    if cab < 0:
-        cab = cab + 65536
-    data[32] = (cab >> 8) & 0xFF
-    data[33] = cab & 0xFF
-    offset = overrides.get("heater_offset", 0)
-    data[34] = offset if offset >= 0 else (offset + 256)
+    _pack_be_u16(data, 32, overrides.get("cab_temp_raw", 230) & 0xFFFF)
+    data[34] = overrides.get("heater_offset", 0) & 0xFF
     data[35] = overrides.get("error_code", 0)
     data[36] = overrides.get("backlight", 50)
     data[37] = overrides.get("co_present", 0)
-    co_ppm = overrides.get("co_ppm_raw", 0)
-    data[38] = (co_ppm >> 8) & 0xFF
-    data[39] = co_ppm & 0xFF
-    part = overrides.get("part_number_raw", 0)
-    data[40] = part & 0xFF
-    data[41] = (part >> 8) & 0xFF
-    data[42] = (part >> 16) & 0xFF
-    data[43] = (part >> 24) & 0xFF
+    _pack_be_u16(data, 38, overrides.get("co_ppm_raw", 0) & 0xFFFF)
+    _pack_le_u32(data, 40, overrides.get("part_number_raw", 0) & 0xFFFFFFFF)
     data[44] = overrides.get("motherboard_version", 0)
     return data
 
@@ -954,44 +923,25 @@ def _make_cbff_data(**overrides) -> bytearray:
     # Byte 17: temp_unit (lower nibble)
     data[17] = overrides.get("temp_unit", 0)
     # Bytes 18-19: cab temp (int16 LE)
-    cab = overrides.get("cab_temp", 23)
-    if cab < 0:
-        cab = cab + 65536
-    data[18] = cab & 0xFF
-    data[19] = (cab >> 8) & 0xFF
+    _pack_le_u16(data, 18, overrides.get("cab_temp", 23) & 0xFFFF)
     # Byte 20: altitude_unit
     data[20] = overrides.get("altitude_unit", 0)
     # Bytes 21-22: altitude (uint16 LE)
-    alt = overrides.get("altitude", 0)
-    data[21] = alt & 0xFF
-    data[22] = (alt >> 8) & 0xFF
+    _pack_le_u16(data, 21, overrides.get("altitude", 0) & 0xFFFF)
     # Bytes 23-24: voltage (uint16 LE, /10)
-    voltage = overrides.get("voltage_raw", 120)
-    data[23] = voltage & 0xFF
-    data[24] = (voltage >> 8) & 0xFF
+    _pack_le_u16(data, 23, overrides.get("voltage_raw", 120) & 0xFFFF)
     # Bytes 25-26: case temp (int16 LE, /10)
-    case = overrides.get("case_temp_raw", 1500)
-    if case < 0:
-        case = case + 65536
-    data[25] = case & 0xFF
-    data[26] = (case >> 8) & 0xFF
+    _pack_le_u16(data, 25, overrides.get("case_temp_raw", 1500) & 0xFFFF)
     # Bytes 27-28: CO ppm (uint16 LE, /10)
-    co = overrides.get("co_raw", 0)
-    data[27] = co & 0xFF
-    data[28] = (co >> 8) & 0xFF
+    _pack_le_u16(data, 27, overrides.get("co_raw", 0) & 0xFFFF)
     # Byte 29: pwr_onoff
     data[29] = overrides.get("pwr_onoff", 0)
     # Bytes 30-31: hardware_version
-    hw = overrides.get("hw_version", 0)
-    data[30] = hw & 0xFF
-    data[31] = (hw >> 8) & 0xFF
+    _pack_le_u16(data, 30, overrides.get("hw_version", 0) & 0xFFFF)
     # Bytes 32-33: software_version
-    sw = overrides.get("sw_version", 0)
-    data[32] = sw & 0xFF
-    data[33] = (sw >> 8) & 0xFF
+    _pack_le_u16(data, 32, overrides.get("sw_version", 0) & 0xFFFF)
     # Byte 34: temp_comp (heater offset)
-    offset = overrides.get("heater_offset", 0)
-    data[34] = offset if offset >= 0 else (offset + 256)
+    data[34] = overrides.get("heater_offset", 0) & 0xFF
     # Byte 35: language
     data[35] = overrides.get("language", 255)
     # Byte 36: tank_volume
@@ -1011,9 +961,7 @@ def _make_cbff_data(**overrides) -> bytearray:
     # Byte 43: heater_mode
     data[43] = overrides.get("heater_mode", 0)
     # Bytes 44-45: remain_run_time
-    remain = overrides.get("remain_run_time", 65535)
-    data[44] = remain & 0xFF
-    data[45] = (remain >> 8) & 0xFF
+    _pack_le_u16(data, 44, overrides.get("remain_run_time", 65535) & 0xFFFF)
     # Byte 46: padding
     data[46] = 0x00
     return data
@@ -29,7 +29,7 @@ def create_mock_coordinator(protocol_mode: int = 1) -> MagicMock:
     coordinator._heater_id = "EE:FF"
     coordinator.last_update_success = True
     coordinator.protocol_mode = protocol_mode
-    coordinator.send_command = AsyncMock(return_value=True)
+    coordinator.send_command = conftest._async_stub(return_value=True)
     coordinator.async_set_mode = AsyncMock()
     coordinator.async_set_language = AsyncMock()
     coordinator.async_set_pump_type = AsyncMock()
@@ -25,7 +25,7 @@ def create_mock_coordinator() -> MagicMock:
     coordinator.address = "AA:BB:CC:DD:EE:FF"
     coordinator._heater_id = "EE:FF"
     coordinator.last_update_success = True
-    coordinator.send_command = AsyncMock(return_value=True)
+    coordinator.send_command = conftest._async_stub(return_value=True)
     coordinator.async_turn_on = AsyncMock()
     coordinator.async_turn_off = AsyncMock()
     coordinator.async_set_auto_start_stop = AsyncMock()